@@ -8,7 +8,11 @@ import click
 
 from ..llm_providers.config import get_config_manager
 from ..llm_providers.registry import list_providers
-from ..shared.base_functions import async_to_sync, function_registry
+from ..shared.base_functions import (
+    async_to_sync,
+    function_registry,
+    install_uvloop,
+)
 from ..shared.functions import initialize_functions
 from .agent import AgentChat
 
@@ -196,6 +200,7 @@ def list_providers_cmd():
 
 def main():
     """Main entry point for CLI."""
+    install_uvloop()
     cli()
 
 
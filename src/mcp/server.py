@@ -10,7 +10,7 @@ import mcp.types as types
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 
-from ..shared.base_functions import function_registry
+from ..shared.base_functions import function_registry, install_uvloop
 from ..shared.functions import initialize_functions
 
 # Set up logging
@@ -76,6 +76,7 @@ async def run_server():
 
 def main():
     """Main entry point for MCP server."""
+    install_uvloop()
     asyncio.run(run_server())
 
 
@@ -1,9 +1,10 @@
 """Base functions shared between MCP server and A2A agent."""
 
 import asyncio
+import contextlib
 import functools
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 
 class BaseFunction(ABC):
@@ -23,6 +24,44 @@ class BaseFunction(ABC):
         """Return JSON schema for function parameters."""
         pass
 
+    async def _run_command_stream(
+        self,
+        cmd: List[str],
+        limit: int = 1 << 20,
+        slots: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncIterator[str]:
+        """Run a command and yield its stdout line by line.
+
+        Output is never buffered in full, so callers can parse while the
+        command is still writing. limit caps the length of a single line.
+        If slots is given, the process holds one of them until it exits.
+        Raises RuntimeError if the command exits with a non-zero status.
+        """
+        async with slots or contextlib.nullcontext():
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=limit,
+            )
+            stderr_task = asyncio.ensure_future(process.stderr.read())
+            try:
+                async for line in process.stdout:
+                    yield line.decode().rstrip("\n")
+
+                returncode = await process.wait()
+                stderr = await stderr_task
+                if returncode != 0:
+                    raise RuntimeError(
+                        stderr.decode(errors="replace").strip() or f"exit {returncode}"
+                    )
+            finally:
+                if process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                if not stderr_task.done():
+                    stderr_task.cancel()
+
 
 class FunctionRegistry:
     """Registry to manage all available functions."""
@@ -62,5 +101,20 @@ def async_to_sync(func: Callable) -> Callable:
     return wrapper
 
 
+def install_uvloop() -> bool:
+    """Use uvloop for new event loops when it is installed.
+
+    uvloop is optional; without it (e.g. on Windows) the default asyncio
+    loop is kept. Returns True if uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 # Global registry instance
 function_registry = FunctionRegistry()
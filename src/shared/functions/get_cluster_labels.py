@@ -39,9 +39,10 @@ class GetClusterLabelsFunction(BaseFunction):
             Dictionary with cluster information and labels
         """
         try:
-            # Build kubectl command
-            cmd = ["kubectl", "get", "managedclusters", "-A"]
-            
+            # ManagedCluster is cluster-scoped, so a single invocation without
+            # -A covers every setup and avoids a second fork on failure.
+            cmd = ["kubectl", "get", "managedclusters"]
+
             if output_format == "json":
                 cmd.extend(["-o", "json"])
             elif output_format == "yaml":
@@ -57,22 +58,6 @@ class GetClusterLabelsFunction(BaseFunction):
                 
             # Execute command
             result = await self._run_command(cmd)
-            
-            if result["returncode"] != 0:
-                # Try without -A flag (some setups don't support it)
-                cmd = ["kubectl", "get", "managedclusters"]
-                if output_format == "json":
-                    cmd.extend(["-o", "json"])
-                elif output_format == "yaml":
-                    cmd.extend(["-o", "yaml"])
-                else:
-                    cmd.append("--show-labels")
-                if context:
-                    cmd.extend(["--context", context])
-                if kubeconfig:
-                    cmd.extend(["--kubeconfig", kubeconfig])
-                    
-                result = await self._run_command(cmd)
                 
             if result["returncode"] != 0:
                 return {
@@ -129,14 +114,18 @@ class GetClusterLabelsFunction(BaseFunction):
             
     def _generate_example_selectors(self, labels: Dict[str, List[str]]) -> List[Dict[str, str]]:
         """Generate example cluster selector labels for BindingPolicy."""
+        max_examples = 5
         examples = []
-        
+
         # Single label examples
         for key, values in labels.items():
-            if key != "name":  # Skip name label as it's too specific
-                for value in values[:2]:  # Limit to 2 examples per key
-                    examples.append({key: value})
-                    
+            if key == "name":  # Skip name label as it's too specific
+                continue
+            for value in values[:2]:  # Limit to 2 examples per key
+                examples.append({key: value})
+                if len(examples) >= max_examples:
+                    return examples
+
         # Multi-label example if we have multiple keys
         if len(labels) > 1:
             multi_example = {}
@@ -148,7 +137,7 @@ class GetClusterLabelsFunction(BaseFunction):
             if multi_example:
                 examples.append(multi_example)
                 
-        return examples[:5]  # Return max 5 examples
+        return examples
             
     async def _run_command(self, cmd: List[str]) -> Dict[str, Any]:
         """Execute command and return results."""
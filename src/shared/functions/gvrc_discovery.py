@@ -1,34 +1,12 @@
 """GVRC (Group, Version, Resource, Category) discovery utilities for KubeStellar."""
 
 import asyncio
-from dataclasses import dataclass
+import json
 from typing import Any, Dict, List, Optional
 
 from ..base_functions import BaseFunction
 
 
-@dataclass
-class ResourceInfo:
-    """Resource information structure."""
-
-    name: str
-    shortnames: List[str]
-    api_version: str
-    kind: str
-    namespaced: bool
-    categories: List[str]
-
-
-@dataclass
-class NamespaceInfo:
-    """Namespace information structure."""
-
-    name: str
-    status: str
-    labels: Dict[str, str]
-    annotations: Dict[str, str]
-
-
 class GVRCDiscoveryFunction(BaseFunction):
     """Function to discover Group, Version, Resource, Category information across clusters."""
 
@@ -176,19 +154,17 @@ class GVRCDiscoveryFunction(BaseFunction):
             # Add output format for parsing
             cmd.extend(["-o", "wide"])
 
-            result = await self._run_command(cmd)
-            if result["returncode"] != 0:
-                return []
-
-            # Parse api-resources output
+            # Parse api-resources output line by line as kubectl emits it
             resources = []
-            lines = result["stdout"].strip().split("\n")
+            header_checked = False
 
-            # Skip header line
-            if lines and "NAME" in lines[0]:
-                lines = lines[1:]
+            async for line in self._run_command_stream(cmd):
+                # Skip header line
+                if not header_checked:
+                    header_checked = True
+                    if "NAME" in line:
+                        continue
 
-            for line in lines:
                 if not line.strip():
                     continue
 
@@ -241,37 +217,22 @@ class GVRCDiscoveryFunction(BaseFunction):
     ) -> List[Dict[str, Any]]:
         """Get namespaces from a cluster."""
         try:
-            # Build kubectl get namespaces command
+            # A single JSON list carries status, labels and annotations
             cmd = ["kubectl", "get", "namespaces", "--context", cluster["context"]]
 
             if kubeconfig:
                 cmd.extend(["--kubeconfig", kubeconfig])
 
-            # Add output format for parsing
-            cmd.extend(["-o", "wide"])
+            cmd.extend(["-o", "json"])
 
             result = await self._run_command(cmd)
             if result["returncode"] != 0:
                 return []
 
-            # Parse namespaces output
             namespaces = []
-            lines = result["stdout"].strip().split("\n")
-
-            # Skip header line
-            if lines and "NAME" in lines[0]:
-                lines = lines[1:]
-
-            for line in lines:
-                if not line.strip():
-                    continue
-
-                parts = line.split()
-                if len(parts) < 2:
-                    continue
-
-                namespace_name = parts[0]
-                status = parts[1]
+            for item in json.loads(result["stdout"]).get("items", []):
+                metadata = item.get("metadata", {})
+                namespace_name = metadata.get("name", "")
 
                 # Apply filter
                 if (
@@ -280,17 +241,12 @@ class GVRCDiscoveryFunction(BaseFunction):
                 ):
                     continue
 
-                # Get additional namespace details
-                namespace_details = await self._get_namespace_details(
-                    cluster, namespace_name, kubeconfig
-                )
-
                 namespaces.append(
                     {
                         "name": namespace_name,
-                        "status": status,
-                        "labels": namespace_details.get("labels", {}),
-                        "annotations": namespace_details.get("annotations", {}),
+                        "status": item.get("status", {}).get("phase", "Unknown"),
+                        "labels": metadata.get("labels", {}),
+                        "annotations": metadata.get("annotations", {}),
                     }
                 )
 
@@ -299,53 +255,6 @@ class GVRCDiscoveryFunction(BaseFunction):
         except Exception:
             return []
 
-    async def _get_namespace_details(
-        self, cluster: Dict[str, Any], namespace: str, kubeconfig: str
-    ) -> Dict[str, Any]:
-        """Get detailed information about a namespace."""
-        try:
-            cmd = [
-                "kubectl",
-                "get",
-                "namespace",
-                namespace,
-                "--context",
-                cluster["context"],
-                "-o",
-                "jsonpath={.metadata.labels}{';'}{.metadata.annotations}",
-            ]
-
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
-
-            result = await self._run_command(cmd)
-            if result["returncode"] != 0:
-                return {"labels": {}, "annotations": {}}
-
-            # Parse the output (labels;annotations)
-            parts = result["stdout"].split(";")
-            labels = {}
-            annotations = {}
-
-            if len(parts) > 0 and parts[0].strip():
-                # Parse labels (basic parsing)
-                labels_str = parts[0].strip()
-                if labels_str and labels_str != "map[]":
-                    # This is a simplified parser - in production, you'd want more robust JSON parsing
-                    pass
-
-            if len(parts) > 1 and parts[1].strip():
-                # Parse annotations (basic parsing)
-                annotations_str = parts[1].strip()
-                if annotations_str and annotations_str != "map[]":
-                    # This is a simplified parser - in production, you'd want more robust JSON parsing
-                    pass
-
-            return {"labels": labels, "annotations": annotations}
-
-        except Exception:
-            return {"labels": {}, "annotations": {}}
-
     def _create_summary(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Create a summary of GVRC discovery results."""
         summary = {
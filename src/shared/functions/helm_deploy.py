@@ -35,12 +35,102 @@ To check cluster labels:
 
 import asyncio
 import json
+import os
+import re
+import shutil
+import sys
 import tempfile
-from typing import Any, Dict, List, Optional
-
-import yaml
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from ..base_functions import BaseFunction
+from .kubeconfig import load_kubeconfig, resolve_kubeconfig_path
+
+# Only the tail of stderr is kept; it is used for error messages
+_STDERR_TAIL_BYTES = 64 * 1024
+
+_OPERATIONS = ("install", "upgrade", "uninstall", "status", "history")
+
+# Name of the repository registered in a deployment's private repository config
+_TEMP_REPO_NAME = "tmp"
+
+# Namespaces handled at once across all clusters of one install
+_MAX_PARALLEL_NAMESPACES = 16
+
+# Per-cluster overrides: "cluster=values.yaml" and "cluster=key=value"
+_CLUSTER_VALUE_RE = re.compile(r"([^=]*)=(.*)", re.DOTALL)
+_CLUSTER_SET_RE = re.compile(r"([^=]*)=([^=]*=.*)", re.DOTALL)
+
+# KubeStellar space names: a "wds"/"its" prefix or a -wds-/_wds_ style infix
+_WDS_NAME_RE = re.compile(r"^wds|-wds-|_wds_", re.IGNORECASE)
+_ITS_NAME_RE = re.compile(r"^its|-its-|_its_", re.IGNORECASE)
+
+# "helm list" reports a release's chart as "<name>-<semver>"
+_LISTED_CHART_RE = re.compile(r"(.+)-(v?\d+\.\d+\.\d+(?:[-+].*)?)")
+
+# Labels already covered by the default BindingPolicy object selector
+_RESERVED_HELM_KEYS = frozenset(
+    {"app.kubernetes.io/managed-by", "app.kubernetes.io/instance"}
+)
+
+
+def _status_from_list_entry(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild the parts of "helm status -o json" that a "helm list" entry has.
+
+    The chart metadata keeps the name, version and appVersion keys helm
+    status uses; manifest, values and notes are not available from a list.
+    """
+    chart = release.get("chart", "")
+    match = _LISTED_CHART_RE.fullmatch(chart)
+    chart_name, chart_version = (match[1], match[2]) if match else (chart, "")
+    return {
+        "name": release.get("name", ""),
+        "namespace": release.get("namespace", ""),
+        "version": release.get("revision", "unknown"),
+        "info": {
+            "status": release.get("status", "unknown"),
+            "last_deployed": release.get("updated", ""),
+        },
+        "chart": {
+            "metadata": {
+                "name": chart_name,
+                "version": chart_version,
+                "appVersion": release.get("app_version", ""),
+            }
+        },
+    }
+
+
+def _max_procs() -> int:
+    """Maximum concurrent helm/kubectl subprocesses (HELM_MAX_PROCS overrides)."""
+    try:
+        return max(1, int(os.environ["HELM_MAX_PROCS"]))
+    except (KeyError, ValueError):
+        return max(8, (os.cpu_count() or 1) * 2)
+
+
+@lru_cache(maxsize=256)
+def _prep_labels(
+    release_name: str, chart_name: str, extra: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the KubeStellar label pairs for a release, memoized per input."""
+    labels = {
+        "app.kubernetes.io/managed-by": "Helm",
+        "app.kubernetes.io/instance": release_name,
+        "kubestellar.io/helm-chart": (
+            chart_name.replace("/", "-") if chart_name else release_name
+        ),
+        "kubestellar.io/helm-release": release_name,
+    }
+
+    if chart_name:
+        labels["app.kubernetes.io/name"] = chart_name.split("/")[-1]
+
+    labels.update(extra)
+
+    return tuple(labels.items())
 
 
 class HelmDeployFunction(BaseFunction):
@@ -59,6 +149,14 @@ class HelmDeployFunction(BaseFunction):
             name="helm_deploy",
             description="Deploy Helm charts with KubeStellar multi-cluster support. For KubeStellar: deploy to ITS cluster (e.g., its1) and create BindingPolicy in WDS (e.g., wds1) to propagate to WECs. Use cluster_selector_labels to match ManagedCluster labels. Supports install/upgrade/uninstall/status/history operations. Always use wait=false to avoid timeouts.",
         )
+        # Recent cluster discovery results, keyed by kubeconfig identity
+        self._discovery_cache: Dict[Tuple[Any, ...], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._discovery_ttl = 30.0
+        self._discovery_lock: Optional[asyncio.Lock] = None
+        self._discovery_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Admission control for helm/kubectl subprocesses across all callers
+        self._proc_slots: Optional[asyncio.Semaphore] = None
+        self._proc_slots_loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def execute(
         self,
@@ -93,6 +191,7 @@ class HelmDeployFunction(BaseFunction):
         cluster_selector_labels: Optional[Dict[str, str]] = None,
         kubestellar_labels: Optional[Dict[str, str]] = None,
         wds_context: str = "",
+        max_parallel_clusters: int = 8,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -132,157 +231,101 @@ class HelmDeployFunction(BaseFunction):
             cluster_selector_labels: Labels to select WECs (e.g., {"location-group": "edge"})
             kubestellar_labels: Additional labels for resources
             wds_context: WDS cluster context for policy creation (e.g., "wds1")
+            max_parallel_clusters: Maximum number of clusters processed concurrently
 
         Returns:
             Dictionary with deployment results and binding policy information
         """
-        try:
-            # Validate required parameters based on operation type
-            validation_result = self._validate_inputs(
-                chart_name,
-                chart_path,
-                repository_url,
-                repository_name,
-                operation,
-                release_name,
-            )
-            if validation_result:
-                return validation_result
-
-            # Set defaults for optional parameters
-            if not release_name:
-                release_name = (
-                    chart_name.replace("/", "-") if chart_name else "helm-release"
-                )
-
-            # Set default binding policy name
-            if not binding_policy_name:
-                binding_policy_name = f"{release_name}-helm-policy"
+        # Validate required parameters based on operation type
+        validation_result = self._validate_inputs(
+            chart_name,
+            chart_path,
+            repository_url,
+            repository_name,
+            operation,
+            release_name,
+        )
+        if validation_result:
+            return validation_result
 
-            # Discover available clusters (excludes WDS management clusters)
-            all_clusters = await self._discover_clusters(kubeconfig, remote_context)
-            if not all_clusters:
-                return {"status": "error", "error": "No clusters discovered"}
+        if operation not in _OPERATIONS:
+            return {
+                "status": "error",
+                "error": f"Unsupported operation: {operation}",
+            }
 
-            # Filter clusters by names or labels
-            selected_clusters = self._filter_clusters(
-                all_clusters, target_clusters, cluster_labels
-            )
+        # Set defaults for optional parameters
+        if not release_name:
+            release_name = chart_name.replace("/", "-") if chart_name else "helm-release"
 
-            if not selected_clusters:
-                return {
-                    "status": "error",
-                    "error": "No clusters match the selection criteria",
-                    "available_clusters": [
-                        {"name": c["name"], "context": c["context"]}
-                        for c in all_clusters
-                    ],
-                }
-                
-            # Validate KubeStellar deployment pattern
-            if create_binding_policy and wds_context:
-                # Check if deploying to ITS cluster
-                its_clusters = [c for c in selected_clusters if self._is_its_cluster(c["name"])]
-                wec_clusters = [c for c in selected_clusters if self._is_wec_cluster(c["name"])]
-                
-                if wec_clusters and not its_clusters:
-                    return {
-                        "status": "error",
-                        "error": "KubeStellar deployments should target ITS cluster (e.g., its1) not WEC clusters directly",
-                        "suggestion": "Use target_clusters=['its1'] and cluster_selector_labels to select WECs",
-                        "its_clusters": [c["name"] for c in all_clusters if self._is_its_cluster(c["name"])],
-                        "wec_clusters": [c["name"] for c in wec_clusters]
-                    }
-                    
-                if len(selected_clusters) > 1 and operation in ["install", "upgrade"]:
-                    # Warn if deploying to multiple clusters with KubeStellar
-                    self._log_warning(
-                        f"Deploying to {len(selected_clusters)} clusters with KubeStellar. "
-                        "Recommended: deploy to ITS only and use BindingPolicy for propagation"
-                    )
+        # Set default binding policy name
+        if not binding_policy_name:
+            binding_policy_name = f"{release_name}-helm-policy"
 
-            # Resolve target namespaces (explicit list, all namespaces, or default)
-            target_ns_list = await self._resolve_target_namespaces(
-                selected_clusters[0],
+        try:
+            plan = await self._plan_deployment(
+                chart_name,
+                chart_version,
+                release_name,
+                target_clusters,
+                cluster_labels,
+                namespace,
                 all_namespaces,
                 namespace_selector,
                 target_namespaces,
-                namespace,
+                operation,
                 kubeconfig,
+                remote_context,
+                create_binding_policy,
+                binding_policy_name,
+                cluster_selector_labels,
+                kubestellar_labels,
+                wds_context,
             )
-
-            # Prepare KubeStellar-compatible labels for resources and BindingPolicy
-            helm_labels = self._prepare_kubestellar_labels(
-                release_name, chart_name, kubestellar_labels
-            )
-
-            # Create deployment plan summary
-            deployment_plan = {
-                "operation": operation,
-                "release_name": release_name,
-                "chart_name": chart_name,
-                "chart_version": chart_version,
-                "target_clusters": [c["name"] for c in selected_clusters],
-                "target_namespaces": target_ns_list,
-                "binding_policy": {
-                    "create": create_binding_policy,
-                    "name": binding_policy_name,
-                    "cluster_selector_labels": cluster_selector_labels,
-                },
-                "kubestellar_labels": helm_labels,
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Failed to execute Helm deployment: {str(e)}",
             }
 
-            # Return preview for dry-run mode
-            if dry_run:
-                return {
-                    "status": "success",
-                    "message": "DRY RUN - No actual deployment will occur",
-                    "deployment_plan": deployment_plan,
-                    "clusters_selected": len(selected_clusters),
-                }
+        if plan["status"] != "planned":
+            return plan
 
-            # Execute Helm operation (install/upgrade/uninstall/status/history)
-            if operation in ["install", "upgrade"]:
-                result = await self._deploy_helm_chart(
-                    selected_clusters,
-                    chart_name,
-                    chart_version,
-                    repository_url,
-                    repository_name,
-                    chart_path,
-                    release_name,
-                    target_ns_list,
-                    values_file,
-                    values_files,
-                    cluster_values,
-                    set_values,
-                    cluster_set_values,
-                    create_namespace,
-                    wait,
-                    timeout,
-                    atomic,
-                    operation,
-                    kubeconfig,
-                    helm_labels,
-                )
-            elif operation == "uninstall":
-                result = await self._uninstall_helm_chart(
-                    selected_clusters, release_name, target_ns_list, kubeconfig
-                )
-            elif operation in ["status", "history"]:
-                result = await self._get_helm_info(
-                    selected_clusters,
-                    release_name,
-                    target_ns_list,
-                    operation,
-                    kubeconfig,
-                )
-            else:
-                return {
-                    "status": "error",
-                    "error": f"Unsupported operation: {operation}",
-                }
+        deployment_plan = plan["deployment_plan"]
+
+        # Return preview for dry-run mode
+        if dry_run:
+            return {
+                "status": "success",
+                "message": "DRY RUN - No actual deployment will occur",
+                "deployment_plan": deployment_plan,
+                "clusters_selected": len(plan["clusters"]),
+            }
 
+        try:
+            result = await self._run_operation(
+                plan["clusters"],
+                chart_name,
+                chart_version,
+                repository_url,
+                repository_name,
+                chart_path,
+                release_name,
+                plan["namespaces"],
+                values_file,
+                values_files,
+                cluster_values,
+                set_values,
+                cluster_set_values,
+                create_namespace,
+                wait,
+                timeout,
+                atomic,
+                operation,
+                kubeconfig,
+                plan["labels"],
+                max_parallel_clusters,
+            )
             # Create or update binding policy if requested
             binding_policy_result = None
             if (
@@ -293,28 +336,199 @@ class HelmDeployFunction(BaseFunction):
                 binding_policy_result = await self._create_binding_policy(
                     binding_policy_name,
                     release_name,
-                    helm_labels,
+                    plan["labels"],
                     cluster_selector_labels,
-                    target_ns_list,
+                    plan["namespaces"],
                     wds_context,
                     kubeconfig,
                 )
 
-            # Combine results
-            final_result = {
-                **result,
-                "deployment_plan": deployment_plan,
-                "binding_policy": binding_policy_result,
+        except Exception as e:
+            return {
+                "status": "error",
+                "error": f"Failed to execute Helm deployment: {str(e)}",
             }
 
-            return final_result
+        # Attach the plan and policy to the operation result without copying it
+        result["deployment_plan"] = deployment_plan
+        result["binding_policy"] = binding_policy_result
 
-        except Exception as e:
+        return result
+
+    async def _plan_deployment(
+        self,
+        chart_name: str,
+        chart_version: str,
+        release_name: str,
+        target_clusters: Optional[List[str]],
+        cluster_labels: Optional[List[str]],
+        namespace: str,
+        all_namespaces: bool,
+        namespace_selector: str,
+        target_namespaces: Optional[List[str]],
+        operation: str,
+        kubeconfig: str,
+        remote_context: str,
+        create_binding_policy: bool,
+        binding_policy_name: str,
+        cluster_selector_labels: Optional[Dict[str, str]],
+        kubestellar_labels: Optional[Dict[str, str]],
+        wds_context: str,
+    ) -> Dict[str, Any]:
+        """Select clusters and namespaces and describe the deployment.
+
+        Returns an error result, or a dict with status "planned" carrying the
+        selected clusters, namespaces, labels and the deployment plan summary.
+        Unexpected exceptions propagate to execute, which reports them.
+        """
+        # Discover available clusters (excludes WDS management clusters)
+        all_clusters = await self._discover_clusters_cached(kubeconfig, remote_context)
+        if not all_clusters:
+            return {"status": "error", "error": "No clusters discovered"}
+
+        # Filter clusters by names or labels
+        selected_clusters = self._filter_clusters(
+            all_clusters, target_clusters, cluster_labels
+        )
+
+        if not selected_clusters:
             return {
                 "status": "error",
-                "error": f"Failed to execute Helm deployment: {str(e)}",
+                "error": "No clusters match the selection criteria",
+                "available_clusters": [
+                    {"name": c["name"], "context": c["context"]} for c in all_clusters
+                ],
             }
 
+        # Validate KubeStellar deployment pattern
+        if create_binding_policy and wds_context:
+            # Check if deploying to ITS cluster
+            its_clusters = [c for c in selected_clusters if self._is_its_cluster(c["name"])]
+            wec_clusters = [c for c in selected_clusters if self._is_wec_cluster(c["name"])]
+
+            if wec_clusters and not its_clusters:
+                return {
+                    "status": "error",
+                    "error": "KubeStellar deployments should target ITS cluster (e.g., its1) not WEC clusters directly",
+                    "suggestion": "Use target_clusters=['its1'] and cluster_selector_labels to select WECs",
+                    "its_clusters": [c["name"] for c in all_clusters if self._is_its_cluster(c["name"])],
+                    "wec_clusters": [c["name"] for c in wec_clusters]
+                }
+
+            if len(selected_clusters) > 1 and operation in ["install", "upgrade"]:
+                # Warn if deploying to multiple clusters with KubeStellar
+                self._log_warning(
+                    f"Deploying to {len(selected_clusters)} clusters with KubeStellar. "
+                    "Recommended: deploy to ITS only and use BindingPolicy for propagation"
+                )
+
+        # Resolve target namespaces (explicit list, all namespaces, or default)
+        target_ns_list = await self._resolve_target_namespaces(
+            selected_clusters[0],
+            all_namespaces,
+            namespace_selector,
+            target_namespaces,
+            namespace,
+            kubeconfig,
+        )
+
+        # Prepare KubeStellar-compatible labels for resources and BindingPolicy
+        helm_labels = self._prepare_kubestellar_labels(
+            release_name, chart_name, kubestellar_labels
+        )
+
+        return {
+            "status": "planned",
+            "clusters": selected_clusters,
+            "namespaces": target_ns_list,
+            "labels": helm_labels,
+            "deployment_plan": {
+                "operation": operation,
+                "release_name": release_name,
+                "chart_name": chart_name,
+                "chart_version": chart_version,
+                "target_clusters": [c["name"] for c in selected_clusters],
+                "target_namespaces": target_ns_list,
+                "binding_policy": {
+                    "create": create_binding_policy,
+                    "name": binding_policy_name,
+                    "cluster_selector_labels": cluster_selector_labels,
+                },
+                "kubestellar_labels": helm_labels,
+            },
+        }
+
+    async def _run_operation(
+        self,
+        selected_clusters: List[Dict[str, Any]],
+        chart_name: str,
+        chart_version: str,
+        repository_url: str,
+        repository_name: str,
+        chart_path: str,
+        release_name: str,
+        target_ns_list: List[str],
+        values_file: str,
+        values_files: Optional[List[str]],
+        cluster_values: Optional[List[str]],
+        set_values: Optional[List[str]],
+        cluster_set_values: Optional[List[str]],
+        create_namespace: bool,
+        wait: bool,
+        timeout: str,
+        atomic: bool,
+        operation: str,
+        kubeconfig: str,
+        helm_labels: Dict[str, str],
+        max_parallel_clusters: int,
+    ) -> Dict[str, Any]:
+        """Dispatch the Helm operation (install/upgrade/uninstall/status/history)."""
+        if operation in ["install", "upgrade"]:
+            # Parse per-cluster values and settings once for all clusters
+            cluster_values_map = self._parse_cluster_values(cluster_values)
+            cluster_set_values_map = self._parse_cluster_set_values(cluster_set_values)
+
+            return await self._deploy_helm_chart(
+                selected_clusters,
+                chart_name,
+                chart_version,
+                repository_url,
+                repository_name,
+                chart_path,
+                release_name,
+                target_ns_list,
+                values_file,
+                values_files,
+                cluster_values_map,
+                set_values,
+                cluster_set_values_map,
+                create_namespace,
+                wait,
+                timeout,
+                atomic,
+                operation,
+                kubeconfig,
+                helm_labels,
+                max_parallel_clusters,
+            )
+        if operation == "uninstall":
+            return await self._uninstall_helm_chart(
+                selected_clusters,
+                release_name,
+                target_ns_list,
+                kubeconfig,
+                max_parallel_clusters,
+            )
+        # status / history
+        return await self._get_helm_info(
+            selected_clusters,
+            release_name,
+            target_ns_list,
+            operation,
+            kubeconfig,
+            max_parallel_clusters,
+        )
+
     def _validate_inputs(
         self,
         chart_name: str,
@@ -359,22 +573,11 @@ class HelmDeployFunction(BaseFunction):
         additional_labels: Optional[Dict[str, str]],
     ) -> Dict[str, str]:
         """Create standard K8s + KubeStellar labels for resources and BindingPolicy selection."""
-        labels = {
-            "app.kubernetes.io/managed-by": "Helm",
-            "app.kubernetes.io/instance": release_name,
-            "kubestellar.io/helm-chart": (
-                chart_name.replace("/", "-") if chart_name else release_name
-            ),
-            "kubestellar.io/helm-release": release_name,
-        }
-
-        if chart_name:
-            labels["app.kubernetes.io/name"] = chart_name.split("/")[-1]
-
-        if additional_labels:
-            labels.update(additional_labels)
-
-        return labels
+        # Label values are strings in Kubernetes; coercing keeps the key hashable
+        extra = tuple(
+            (str(key), str(value)) for key, value in (additional_labels or {}).items()
+        )
+        return dict(_prep_labels(release_name, chart_name, extra))
 
     async def _deploy_helm_chart(
         self,
@@ -388,9 +591,9 @@ class HelmDeployFunction(BaseFunction):
         target_namespaces: List[str],
         values_file: str,
         values_files: Optional[List[str]],
-        cluster_values: Optional[List[str]],
+        cluster_values_map: Dict[str, str],
         set_values: Optional[List[str]],
-        cluster_set_values: Optional[List[str]],
+        cluster_set_values_map: Dict[str, List[str]],
         create_namespace: bool,
         wait: bool,
         timeout: str,
@@ -398,39 +601,76 @@ class HelmDeployFunction(BaseFunction):
         operation: str,
         kubeconfig: str,
         helm_labels: Dict[str, str],
+        max_parallel_clusters: int = 8,
     ) -> Dict[str, Any]:
         """Execute Helm install/upgrade across multiple clusters with cluster-specific configs."""
-        results = {}
-
-        # Parse per-cluster values and settings
-        cluster_values_map = self._parse_cluster_values(cluster_values)
-        cluster_set_values_map = self._parse_cluster_set_values(cluster_set_values)
+        # Label arguments are identical for every cluster and namespace. A
+        # single --set-json value keeps dotted keys such as
+        # app.kubernetes.io/name flat instead of nesting them
+        label_args = (
+            ["--set-json", f"labels={json.dumps(helm_labels)}"] if helm_labels else []
+        )
 
-        # Execute deployment on each cluster in parallel
-        for cluster in clusters:
-            cluster_result = await self._deploy_to_cluster(
-                cluster,
-                chart_name,
-                chart_version,
-                repository_url,
-                repository_name,
-                chart_path,
-                release_name,
-                target_namespaces,
-                values_file,
-                values_files,
-                cluster_values_map,
-                set_values,
-                cluster_set_values_map,
-                create_namespace,
-                wait,
-                timeout,
-                atomic,
-                operation,
-                kubeconfig,
-                helm_labels,
+        # With --repo every helm invocation downloads the repository index
+        # again, so register the repository once when it will be reused. It
+        # goes into a private repository config so the user's is untouched
+        repo_dir = ""
+        repo_args: List[str] = []
+        if (
+            repository_url
+            and not chart_path
+            and len(clusters) * len(target_namespaces) > 1
+        ):
+            repo_dir = tempfile.mkdtemp(prefix="helm-repo-")
+            repo_args = await self._add_temporary_repo(repository_url, repo_dir)
+
+        chart_repository_url = "" if repo_args else repository_url
+        chart_repository_name = _TEMP_REPO_NAME if repo_args else repository_name
+
+        # Limit concurrent clusters and namespaces to avoid spawning too many
+        # helm processes; the namespace limit is shared across all clusters
+        semaphore = asyncio.Semaphore(max(1, max_parallel_clusters))
+        namespace_semaphore = asyncio.Semaphore(_MAX_PARALLEL_NAMESPACES)
+
+        async def deploy_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._deploy_to_cluster(
+                    cluster,
+                    chart_name,
+                    chart_version,
+                    chart_repository_url,
+                    chart_repository_name,
+                    chart_path,
+                    release_name,
+                    target_namespaces,
+                    values_file,
+                    values_files,
+                    cluster_values_map,
+                    set_values,
+                    cluster_set_values_map,
+                    create_namespace,
+                    wait,
+                    timeout,
+                    atomic,
+                    operation,
+                    kubeconfig,
+                    helm_labels,
+                    label_args,
+                    namespace_semaphore,
+                    repo_args,
+                )
+
+        # Execute deployment on each cluster in parallel
+        try:
+            cluster_results = await asyncio.gather(
+                *(deploy_cluster(cluster) for cluster in clusters),
+                return_exceptions=True,
             )
-            results[cluster["name"]] = cluster_result
+        finally:
+            if repo_dir:
+                shutil.rmtree(repo_dir, ignore_errors=True)
+
+        results = self._collect_cluster_results(clusters, cluster_results, operation)
 
         success_count = sum(1 for r in results.values() if r["status"] == "success")
 
@@ -443,34 +683,62 @@ class HelmDeployFunction(BaseFunction):
             "results": results,
         }
 
+    async def _add_temporary_repo(
+        self, repository_url: str, repo_dir: str
+    ) -> List[str]:
+        """Add repository_url to a repository config kept under repo_dir.
+
+        Returns the --repository-config/--repository-cache arguments that
+        resolve charts through it, or an empty list if it could not be added,
+        in which case callers fall back to --repo.
+        """
+        repo_args = [
+            "--repository-config",
+            os.path.join(repo_dir, "repositories.yaml"),
+            "--repository-cache",
+            os.path.join(repo_dir, "cache"),
+        ]
+        result = await self._run_command(
+            ["helm", "repo", "add", _TEMP_REPO_NAME, repository_url, *repo_args]
+        )
+        return repo_args if result["returncode"] == 0 else []
+
     def _parse_cluster_values(
         self, cluster_values: Optional[List[str]]
     ) -> Dict[str, str]:
         """Parse cluster-specific values files."""
-        cluster_values_map = {}
-        if cluster_values:
-            for cluster_value in cluster_values:
-                if "=" in cluster_value:
-                    cluster_name, values_file = cluster_value.split("=", 1)
-                    cluster_values_map[cluster_name.strip()] = values_file.strip()
-        return cluster_values_map
+        matches = (_CLUSTER_VALUE_RE.fullmatch(cv) for cv in cluster_values or ())
+        return {m[1].strip(): m[2].strip() for m in matches if m}
 
     def _parse_cluster_set_values(
         self, cluster_set_values: Optional[List[str]]
     ) -> Dict[str, List[str]]:
         """Parse cluster-specific set values."""
         cluster_set_values_map: Dict[str, List[str]] = {}
-        if cluster_set_values:
-            for cluster_set_value in cluster_set_values:
-                parts = cluster_set_value.split("=", 2)
-                if len(parts) >= 3:
-                    cluster_name = parts[0].strip()
-                    key_value = f"{parts[1]}={parts[2]}"
-                    if cluster_name not in cluster_set_values_map:
-                        cluster_set_values_map[cluster_name] = []
-                    cluster_set_values_map[cluster_name].append(key_value)
+        for csv in cluster_set_values or ():
+            match = _CLUSTER_SET_RE.fullmatch(csv)
+            if match:
+                cluster_set_values_map.setdefault(match[1].strip(), []).append(match[2])
         return cluster_set_values_map
 
+    def _collect_cluster_results(
+        self,
+        clusters: List[Dict[str, Any]],
+        cluster_results: List[Any],
+        operation: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Map gathered per-cluster results by name, converting raised exceptions to errors."""
+        results = {}
+        for cluster, cluster_result in zip(clusters, cluster_results):
+            if isinstance(cluster_result, Exception):
+                cluster_result = {
+                    "status": "error",
+                    "error": f"Helm {operation} failed on cluster {cluster['name']}: {str(cluster_result)}",
+                    "cluster": cluster["name"],
+                }
+            results[cluster["name"]] = cluster_result
+        return results
+
     async def _deploy_to_cluster(
         self,
         cluster: Dict[str, Any],
@@ -493,14 +761,30 @@ class HelmDeployFunction(BaseFunction):
         operation: str,
         kubeconfig: str,
         helm_labels: Dict[str, str],
+        label_args: List[str],
+        namespace_semaphore: Optional[asyncio.Semaphore] = None,
+        repo_args: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """Deploy Helm chart to a specific cluster."""
-        try:
-            namespace_results = {}
+        if namespace_semaphore is None:
+            namespace_semaphore = asyncio.Semaphore(_MAX_PARALLEL_NAMESPACES)
+
+        # With several target namespaces, one listing lets us skip the apply
+        # for namespaces that already exist with the required labels
+        existing_namespaces: Dict[str, Dict[str, str]] = {}
+        if create_namespace and len(target_namespaces) > 1:
+            existing_namespaces = await self._list_namespace_labels(
+                cluster, kubeconfig
+            )
 
-            for namespace in target_namespaces:
+        async def deploy_namespace(namespace: str) -> Dict[str, Any]:
+            async with namespace_semaphore:
                 # Create namespace if needed
-                if create_namespace:
+                current_labels = existing_namespaces.get(namespace)
+                if create_namespace and (
+                    current_labels is None
+                    or not helm_labels.items() <= current_labels.items()
+                ):
                     await self._ensure_namespace_exists(
                         cluster, namespace, kubeconfig, helm_labels
                     )
@@ -525,7 +809,8 @@ class HelmDeployFunction(BaseFunction):
                     timeout,
                     atomic,
                     kubeconfig,
-                    helm_labels,
+                    label_args,
+                    repo_args,
                 )
 
                 # Execute Helm command
@@ -533,13 +818,8 @@ class HelmDeployFunction(BaseFunction):
 
                 if result["returncode"] == 0:
                     # Parse Helm output for release information
-                    release_info = await self._parse_helm_output(
-                        result["stdout"],
-                        operation,
-                        release_name,
-                        cluster,
-                        namespace,
-                        kubeconfig,
+                    release_info = self._parse_helm_output(
+                        result["stdout"], operation, release_name
                     )
 
                     # Label Helm secret for KubeStellar compatibility
@@ -554,23 +834,39 @@ class HelmDeployFunction(BaseFunction):
                     else:
                         result_status = "error"
                     
-                    # Create result dict without overwriting status
+                    # Create result dict without overwriting status; chart
+                    # notes, when helm reported them, come back as "notes"
                     result_info = {k: v for k, v in release_info.items() if k != "status"}
                     result_info["helm_status"] = release_info.get("status", "unknown")
-                    
-                    namespace_results[namespace] = {
+
+                    return {
                         "status": result_status,
                         "output": result["stdout"],
                         **result_info,
                     }
                 else:
                     error_output = result["stderr"] or result["stdout"]
-                    namespace_results[namespace] = {
+                    return {
                         "status": "error",
                         "error": f"Helm {operation} failed: {error_output}",
                         "output": error_output,
                     }
 
+        try:
+            namespace_outcomes = await asyncio.gather(
+                *(deploy_namespace(namespace) for namespace in target_namespaces),
+                return_exceptions=True,
+            )
+
+            namespace_results = {}
+            for namespace, outcome in zip(target_namespaces, namespace_outcomes):
+                if isinstance(outcome, Exception):
+                    outcome = {
+                        "status": "error",
+                        "error": f"Helm {operation} failed: {str(outcome)}",
+                    }
+                namespace_results[namespace] = outcome
+
             # Summarize results across namespaces
             success_count = sum(
                 1 for r in namespace_results.values() if r["status"] == "success"
@@ -613,68 +909,53 @@ class HelmDeployFunction(BaseFunction):
         timeout: str,
         atomic: bool,
         kubeconfig: str,
-        helm_labels: Dict[str, str],
+        label_args: List[str],
+        repo_args: Optional[List[str]] = None,
     ) -> List[str]:
-        """Build Helm command with all parameters."""
+        """Build Helm command with all parameters.
+
+        label_args carries the pre-built KubeStellar label arguments so they
+        are computed once per deployment rather than once per namespace.
+        repo_args points helm at a private repository config, if any.
+        """
         cmd = ["helm", operation]
 
         if operation in ["install", "upgrade"]:
-            cmd.append(release_name)
-
-            # Add chart source
+            # Chart source
             if chart_path:
-                cmd.append(chart_path)
+                chart_source: Tuple[str, ...] = (chart_path,)
             elif repository_url:
-                cmd.extend(["--repo", repository_url, chart_name])
+                chart_source = ("--repo", repository_url, chart_name)
             elif repository_name:
-                cmd.append(f"{repository_name}/{chart_name}")
+                chart_source = (f"{repository_name}/{chart_name}",)
             else:
-                cmd.append(chart_name)
-
-            # Add chart version
-            if chart_version:
-                cmd.extend(["--version", chart_version])
+                chart_source = (chart_name,)
 
-            # Add values files
-            if values_file:
-                cmd.extend(["-f", values_file])
-
-            if values_files:
-                for vf in values_files:
-                    cmd.extend(["-f", vf])
-
-            # Add cluster-specific values
             cluster_specific_values = cluster_values_map.get(cluster["name"])
-            if cluster_specific_values:
-                cmd.extend(["-f", cluster_specific_values])
-
-            # Add set values
-            if set_values:
-                for set_value in set_values:
-                    cmd.extend(["--set", set_value])
-
-            # Add cluster-specific set values
             cluster_specific_set_values = cluster_set_values_map.get(cluster["name"])
-            if cluster_specific_set_values:
-                for set_value in cluster_specific_set_values:
-                    cmd.extend(["--set", set_value])
-
-            # Add KubeStellar labels
-            for key, value in helm_labels.items():
-                cmd.extend(["--set", f"labels.{key}={value}"])
-
-            # Add common parameters
-            if wait:
-                cmd.append("--wait")
-
-            if timeout:
-                cmd.extend(["--timeout", timeout])
-
-            if atomic:
-                cmd.append("--atomic")
 
-            if operation == "upgrade":
-                cmd.append("--install")  # Create if doesn't exist
+            # Declarative (condition, arguments) table, emitted in order
+            spec = (
+                (True, (release_name, *chart_source)),
+                (repo_args, repo_args),
+                (chart_version, ("--version", chart_version)),
+                (values_file, ("-f", values_file)),
+                (values_files, [a for vf in values_files or () for a in ("-f", vf)]),
+                (cluster_specific_values, ("-f", cluster_specific_values)),
+                (set_values, [a for sv in set_values or () for a in ("--set", sv)]),
+                (
+                    cluster_specific_set_values,
+                    [a for sv in cluster_specific_set_values or () for a in ("--set", sv)],
+                ),
+                (label_args, label_args),
+                (wait, ("--wait",)),
+                (timeout, ("--timeout", timeout)),
+                (atomic, ("--atomic",)),
+                (operation == "upgrade", ("--install",)),  # Create if doesn't exist
+                # Emit the release as JSON so no follow-up helm status is needed
+                (True, ("--output", "json")),
+            )
+            cmd.extend(arg for cond, args in spec if cond for arg in args)
 
         elif operation == "uninstall":
             cmd.append(release_name)
@@ -688,6 +969,38 @@ class HelmDeployFunction(BaseFunction):
 
         return cmd
 
+    async def _list_namespace_labels(
+        self, cluster: Dict[str, Any], kubeconfig: str
+    ) -> Dict[str, Dict[str, str]]:
+        """Return the labels of every namespace in a cluster, keyed by name."""
+        cmd = [
+            "kubectl",
+            "get",
+            "namespaces",
+            "-o",
+            "json",
+            "--context",
+            cluster["context"],
+        ]
+        if kubeconfig:
+            cmd.extend(["--kubeconfig", kubeconfig])
+
+        result = await self._run_command(cmd)
+        if result["returncode"] != 0:
+            return {}
+
+        try:
+            items = json.loads(result["stdout"]).get("items", [])
+        except ValueError:
+            return {}
+
+        return {
+            item.get("metadata", {}).get("name", ""): (
+                item.get("metadata", {}).get("labels") or {}
+            )
+            for item in items
+        }
+
     async def _ensure_namespace_exists(
         self,
         cluster: Dict[str, Any],
@@ -696,51 +1009,29 @@ class HelmDeployFunction(BaseFunction):
         labels: Dict[str, str],
     ) -> None:
         """Ensure namespace exists with proper labels."""
-        # Check if namespace exists
-        check_cmd = [
+        # A single idempotent apply creates the namespace if missing and sets
+        # its labels, instead of separate get, create and label calls. kubectl
+        # accepts JSON manifests, which the stdlib encoder produces far faster
+        # than the pure-Python YAML dumper
+        manifest = json.dumps(
+            {
+                "apiVersion": "v1",
+                "kind": "Namespace",
+                "metadata": {"name": namespace, "labels": labels},
+            }
+        )
+        apply_cmd = [
             "kubectl",
-            "get",
-            "namespace",
-            namespace,
+            "apply",
+            "-f",
+            "-",
             "--context",
             cluster["context"],
         ]
         if kubeconfig:
-            check_cmd.extend(["--kubeconfig", kubeconfig])
-
-        result = await self._run_command(check_cmd)
-
-        if result["returncode"] != 0:
-            # Create namespace
-            create_cmd = [
-                "kubectl",
-                "create",
-                "namespace",
-                namespace,
-                "--context",
-                cluster["context"],
-            ]
-            if kubeconfig:
-                create_cmd.extend(["--kubeconfig", kubeconfig])
-
-            await self._run_command(create_cmd)
-
-        # Label namespace with KubeStellar labels
-        for key, value in labels.items():
-            label_cmd = [
-                "kubectl",
-                "label",
-                "namespace",
-                namespace,
-                f"{key}={value}",
-                "--context",
-                cluster["context"],
-                "--overwrite",
-            ]
-            if kubeconfig:
-                label_cmd.extend(["--kubeconfig", kubeconfig])
+            apply_cmd.extend(["--kubeconfig", kubeconfig])
 
-            await self._run_command(label_cmd)
+        await self._run_command(apply_cmd, stdin=manifest, decode=False)
 
     async def _label_helm_secret(
         self,
@@ -751,106 +1042,62 @@ class HelmDeployFunction(BaseFunction):
         kubeconfig: str,
     ) -> None:
         """Label Helm secret for KubeStellar BindingPolicy compatibility."""
+        if not labels:
+            return
+
         try:
-            # Get Helm secret name
-            get_secret_cmd = [
+            # Label the release secrets by selector in one call, without
+            # looking their names up first
+            label_cmd = [
                 "kubectl",
-                "get",
+                "label",
                 "secrets",
+                "-l",
+                f"name={release_name},owner=helm",
+                *[f"{key}={value}" for key, value in labels.items()],
                 "--context",
                 cluster["context"],
                 "--namespace",
                 namespace,
-                "-l",
-                f"name={release_name}",
-                "-l",
-                "owner=helm",
-                "-o",
-                "jsonpath={.items[0].metadata.name}",
+                "--overwrite",
             ]
             if kubeconfig:
-                get_secret_cmd.extend(["--kubeconfig", kubeconfig])
-
-            result = await self._run_command(get_secret_cmd)
-
-            if result["returncode"] == 0 and result["stdout"].strip():
-                secret_name = result["stdout"].strip()
-
-                # Label the Helm secret
-                for key, value in labels.items():
-                    label_cmd = [
-                        "kubectl",
-                        "label",
-                        "secret",
-                        secret_name,
-                        f"{key}={value}",
-                        "--context",
-                        cluster["context"],
-                        "--namespace",
-                        namespace,
-                        "--overwrite",
-                    ]
-                    if kubeconfig:
-                        label_cmd.extend(["--kubeconfig", kubeconfig])
+                label_cmd.extend(["--kubeconfig", kubeconfig])
 
-                    await self._run_command(label_cmd)
+            await self._run_command(label_cmd, decode=False)
 
         except Exception:
             # Non-critical operation, continue if it fails
             pass
 
-    async def _parse_helm_output(
+    def _parse_helm_output(
         self,
         output: str,
         operation: str,
         release_name: str,
-        cluster: Dict[str, Any],
-        namespace: str,
-        kubeconfig: str,
     ) -> Dict[str, Any]:
-        """Parse Helm command output for release information."""
-        info = {}
+        """Parse release information from helm install/upgrade --output json.
 
+        Only the summary fields and the chart notes are extracted; the
+        manifest, values and chart files stay in the raw output.
+        """
         try:
-            # Get detailed release information
-            status_cmd = [
-                "helm",
-                "status",
-                release_name,
-                "--kube-context",
-                cluster["context"],
-                "--namespace",
-                namespace,
-                "-o",
-                "json",
-            ]
-            if kubeconfig:
-                status_cmd.extend(["--kubeconfig", kubeconfig])
-
-            result = await self._run_command(status_cmd)
-
-            if result["returncode"] == 0:
-                status_data = json.loads(result["stdout"])
-                info.update(
-                    {
-                        "release_name": status_data.get("name", release_name),
-                        "revision": status_data.get("version", "unknown"),
-                        "status": status_data.get("info", {}).get("status", "unknown"),
-                        "chart_name": status_data.get("chart", {})
-                        .get("metadata", {})
-                        .get("name", ""),
-                        "chart_version": status_data.get("chart", {})
-                        .get("metadata", {})
-                        .get("version", ""),
-                        "app_version": status_data.get("chart", {})
-                        .get("metadata", {})
-                        .get("appVersion", ""),
-                    }
-                )
+            status_data = json.loads(output)
+            info = status_data.get("info", {})
+            chart_metadata = status_data.get("chart", {}).get("metadata", {})
+            return {
+                "release_name": status_data.get("name", release_name),
+                "revision": status_data.get("version", "unknown"),
+                "status": info.get("status", "unknown"),
+                "chart_name": chart_metadata.get("name", ""),
+                "chart_version": chart_metadata.get("version", ""),
+                "app_version": chart_metadata.get("appVersion", ""),
+                "notes": info.get("notes", ""),
+            }
 
-        except Exception:
+        except (ValueError, AttributeError):
             # Fallback to basic information
-            info = {
+            return {
                 "release_name": release_name,
                 "revision": "unknown",
                 "status": (
@@ -858,58 +1105,57 @@ class HelmDeployFunction(BaseFunction):
                 ),
             }
 
-        return info
-
     async def _uninstall_helm_chart(
         self,
         clusters: List[Dict[str, Any]],
         release_name: str,
         target_namespaces: List[str],
         kubeconfig: str,
+        max_parallel_clusters: int = 8,
     ) -> Dict[str, Any]:
         """Uninstall Helm chart from selected clusters."""
-        results = {}
-
-        for cluster in clusters:
-            cluster_result = {"cluster": cluster["name"], "namespace_results": {}}
-
-            for namespace in target_namespaces:
-                cmd = [
-                    "helm",
-                    "uninstall",
-                    release_name,
-                    "--kube-context",
-                    cluster["context"],
-                    "--namespace",
-                    namespace,
-                ]
-                if kubeconfig:
-                    cmd.extend(["--kubeconfig", kubeconfig])
-
-                result = await self._run_command(cmd)
-
-                if result["returncode"] == 0:
-                    cluster_result["namespace_results"][namespace] = {
-                        "status": "success",
-                        "output": result["stdout"],
-                    }
-                else:
-                    error_output = result["stderr"] or result["stdout"]
-                    cluster_result["namespace_results"][namespace] = {
-                        "status": "error",
-                        "error": f"Helm uninstall failed: {error_output}",
-                        "output": error_output,
-                    }
+        semaphore = asyncio.Semaphore(max(1, max_parallel_clusters))
+        # Invariant parts of every command, built once
+        uninstall_base = ["helm", "uninstall", release_name]
+        kubeconfig_flag = ["--kubeconfig", kubeconfig] if kubeconfig else []
+
+        async def uninstall_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                cluster_result = {"cluster": cluster["name"], "namespace_results": {}}
+                context_args = uninstall_base + ["--kube-context", cluster["context"]]
+
+                for namespace in target_namespaces:
+                    cmd = context_args + ["--namespace", namespace] + kubeconfig_flag
+                    result = await self._run_command(cmd)
+
+                    if result["returncode"] == 0:
+                        cluster_result["namespace_results"][namespace] = {
+                            "status": "success",
+                            "output": result["stdout"],
+                        }
+                    else:
+                        error_output = result["stderr"] or result["stdout"]
+                        cluster_result["namespace_results"][namespace] = {
+                            "status": "error",
+                            "error": f"Helm uninstall failed: {error_output}",
+                            "output": error_output,
+                        }
+
+                # Determine overall cluster status
+                success_count = sum(
+                    1
+                    for r in cluster_result["namespace_results"].values()
+                    if r["status"] == "success"
+                )
+                cluster_result["status"] = "success" if success_count > 0 else "error"
 
-            # Determine overall cluster status
-            success_count = sum(
-                1
-                for r in cluster_result["namespace_results"].values()
-                if r["status"] == "success"
-            )
-            cluster_result["status"] = "success" if success_count > 0 else "error"
+                return cluster_result
 
-            results[cluster["name"]] = cluster_result
+        cluster_results = await asyncio.gather(
+            *(uninstall_cluster(cluster) for cluster in clusters),
+            return_exceptions=True,
+        )
+        results = self._collect_cluster_results(clusters, cluster_results, "uninstall")
 
         success_count = sum(1 for r in results.values() if r["status"] == "success")
 
@@ -929,79 +1175,56 @@ class HelmDeployFunction(BaseFunction):
         target_namespaces: List[str],
         operation: str,
         kubeconfig: str,
+        max_parallel_clusters: int = 8,
     ) -> Dict[str, Any]:
         """Execute helm status/history commands across multiple clusters."""
-        results = {}
-
-        for cluster in clusters:
-            cluster_result = {"cluster": cluster["name"], "namespace_results": {}}
+        semaphore = asyncio.Semaphore(max(1, max_parallel_clusters))
+        # Invariant parts of every history command, built once
+        history_base = ["helm", "history", release_name]
+        kubeconfig_flag = ["--kubeconfig", kubeconfig] if kubeconfig else []
 
-            for namespace in target_namespaces:
-                cmd = [
-                    "helm",
-                    operation,
-                    release_name,
-                    "--kube-context",
-                    cluster["context"],
-                    "--namespace",
-                    namespace,
-                ]
+        async def query_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                cluster_result = {"cluster": cluster["name"], "namespace_results": {}}
 
                 if operation == "status":
-                    cmd.extend(["-o", "json"])
-
-                if kubeconfig:
-                    cmd.extend(["--kubeconfig", kubeconfig])
-
-                result = await self._run_command(cmd)
-
-                if result["returncode"] == 0:
-                    info = {"status": "success", "output": result["stdout"]}
-
-                    # Parse JSON output for status operation
-                    if operation == "status":
-                        try:
-                            status_data = json.loads(result["stdout"])
-                            info.update(
-                                {
-                                    "release_info": {
-                                        "name": status_data.get("name", release_name),
-                                        "revision": status_data.get(
-                                            "version", "unknown"
-                                        ),
-                                        "status": status_data.get("info", {}).get(
-                                            "status", "unknown"
-                                        ),
-                                        "chart": status_data.get("chart", {}).get(
-                                            "metadata", {}
-                                        ),
-                                        "last_deployed": status_data.get(
-                                            "info", {}
-                                        ).get("last_deployed", ""),
-                                    }
-                                }
+                    statuses = await self._get_release_statuses(
+                        cluster, release_name, target_namespaces, kubeconfig
+                    )
+                    cluster_result["namespace_results"] = statuses
+                else:
+                    # helm list has no revision history, so query each namespace;
+                    # the queries run concurrently, bounded by the process slots
+                    context_args = history_base + ["--kube-context", cluster["context"]]
+                    histories = await asyncio.gather(
+                        *(
+                            self._get_release_history(
+                                context_args
+                                + ["--namespace", namespace]
+                                + kubeconfig_flag
                             )
-                        except json.JSONDecodeError:
-                            pass
+                            for namespace in target_namespaces
+                        )
+                    )
+                    cluster_result["namespace_results"] = dict(
+                        zip(target_namespaces, histories)
+                    )
 
-                    cluster_result["namespace_results"][namespace] = info
-                else:
-                    error_output = result["stderr"] or result["stdout"]
-                    cluster_result["namespace_results"][namespace] = {
-                        "status": "error",
-                        "error": f"Helm {operation} failed: {error_output}",
-                        "output": error_output,
-                    }
+                # Determine overall cluster status
+                success_count = sum(
+                    1
+                    for r in cluster_result["namespace_results"].values()
+                    if r["status"] == "success"
+                )
+                cluster_result["status"] = "success" if success_count > 0 else "error"
 
-            # Determine overall cluster status
-            success_count = sum(
-                1
-                for r in cluster_result["namespace_results"].values()
-                if r["status"] == "success"
-            )
-            cluster_result["status"] = "success" if success_count > 0 else "error"
+                return cluster_result
 
-            results[cluster["name"]] = cluster_result
+        cluster_results = await asyncio.gather(
+            *(query_cluster(cluster) for cluster in clusters),
+            return_exceptions=True,
+        )
+        results = self._collect_cluster_results(clusters, cluster_results, operation)
 
         success_count = sum(1 for r in results.values() if r["status"] == "success")
 
@@ -1014,6 +1237,99 @@ class HelmDeployFunction(BaseFunction):
             "results": results,
         }
 
+    async def _get_release_history(self, cmd: List[str]) -> Dict[str, Any]:
+        """Run a prepared helm history command for one namespace."""
+        result = await self._run_command(cmd)
+
+        if result["returncode"] == 0:
+            return {"status": "success", "output": result["stdout"]}
+
+        error_output = result["stderr"] or result["stdout"]
+        return {
+            "status": "error",
+            "error": f"Helm history failed: {error_output}",
+            "output": error_output,
+        }
+
+    async def _get_release_statuses(
+        self,
+        cluster: Dict[str, Any],
+        release_name: str,
+        target_namespaces: List[str],
+        kubeconfig: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Look up a release in every target namespace with one helm list call.
+
+        Results keep the shape of a per-namespace "helm status -o json": the
+        output is status-style JSON and release_info carries the chart
+        metadata, so callers see no difference beyond the fields a list
+        entry lacks.
+        """
+        cmd = [
+            "helm",
+            "list",
+            "--all-namespaces",
+            "--all",
+            "--filter",
+            f"^{re.escape(release_name)}$",
+            "--output",
+            "json",
+            "--kube-context",
+            cluster["context"],
+        ]
+        if kubeconfig:
+            cmd.extend(["--kubeconfig", kubeconfig])
+
+        # The JSON is parsed straight from bytes, skipping a decode step
+        result = await self._run_command(cmd, decode=False)
+        if result["returncode"] != 0:
+            error_output = result["stderr"] or result["stdout"].decode(
+                errors="replace"
+            )
+            return {
+                namespace: {
+                    "status": "error",
+                    "error": f"Helm status failed: {error_output}",
+                    "output": error_output,
+                }
+                for namespace in target_namespaces
+            }
+
+        releases = {
+            release.get("namespace"): release
+            for release in json.loads(result["stdout"] or b"[]")
+            if release.get("name") == release_name
+        }
+
+        namespace_results = {}
+        for namespace in target_namespaces:
+            release = releases.get(namespace)
+            if release is None:
+                # The error helm status itself reports for a missing release
+                error_output = "Error: release: not found"
+                namespace_results[namespace] = {
+                    "status": "error",
+                    "error": f"Helm status failed: {error_output}",
+                    "output": error_output,
+                }
+                continue
+
+            # Same result shape as a per-namespace "helm status -o json"
+            status_data = _status_from_list_entry(release)
+            namespace_results[namespace] = {
+                "status": "success",
+                "output": json.dumps(status_data),
+                "release_info": {
+                    "name": status_data["name"] or release_name,
+                    "revision": status_data["version"],
+                    "status": status_data["info"]["status"],
+                    "chart": status_data["chart"]["metadata"],
+                    "last_deployed": status_data["info"]["last_deployed"],
+                },
+            }
+
+        return namespace_results
+
     async def _create_binding_policy(
         self,
         policy_name: str,
@@ -1045,19 +1361,15 @@ class HelmDeployFunction(BaseFunction):
             ]
 
             # Add additional labels if specified
-            if helm_labels:
-                additional_selector: Dict[str, Any] = {"matchLabels": {}}
-                for key, value in helm_labels.items():
-                    if key not in [
-                        "app.kubernetes.io/managed-by",
-                        "app.kubernetes.io/instance",
-                    ]:
-                        additional_selector["matchLabels"][key] = value
-
-                if additional_selector["matchLabels"]:
-                    object_selectors.append(additional_selector)
-
-            # Create binding policy YAML
+            extra_labels = {
+                key: value
+                for key, value in (helm_labels or {}).items()
+                if key not in _RESERVED_HELM_KEYS
+            }
+            if extra_labels:
+                object_selectors.append({"matchLabels": extra_labels})
+
+            # Create binding policy manifest
             binding_policy = {
                 "apiVersion": "control.kubestellar.io/v1alpha1",
                 "kind": "BindingPolicy",
@@ -1076,15 +1388,9 @@ class HelmDeployFunction(BaseFunction):
                 },
             }
 
-            # Write binding policy to temporary file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".yaml", delete=False
-            ) as f:
-                yaml.dump(binding_policy, f, default_flow_style=False)
-                policy_file = f.name
-
-            # Apply binding policy to WDS context
-            apply_cmd = ["kubectl", "apply", "-f", policy_file]
+            # Apply binding policy to WDS context; JSON is valid YAML, so the
+            # manifest is fed on stdin without a temporary file
+            apply_cmd = ["kubectl", "apply", "-f", "-"]
 
             if wds_context:
                 apply_cmd.extend(["--context", wds_context])
@@ -1092,12 +1398,9 @@ class HelmDeployFunction(BaseFunction):
             if kubeconfig:
                 apply_cmd.extend(["--kubeconfig", kubeconfig])
 
-            result = await self._run_command(apply_cmd)
-
-            # Cleanup temporary file
-            import os
-
-            os.unlink(policy_file)
+            result = await self._run_command(
+                apply_cmd, stdin=json.dumps(binding_policy)
+            )
 
             if result["returncode"] == 0:
                 return {
@@ -1128,13 +1431,11 @@ class HelmDeployFunction(BaseFunction):
     ) -> List[Dict[str, Any]]:
         """Filter clusters based on selection criteria."""
         if target_names:
-            # Filter by cluster names
+            # Filter by cluster names, flattening comma-separated entries
             name_set = set()
             for name_list in target_names:
-                # Handle comma-separated names
                 if isinstance(name_list, str):
-                    names = [n.strip() for n in name_list.split(",")]
-                    name_set.update(names)
+                    name_set.update(n.strip() for n in name_list.split(","))
                 else:
                     name_set.add(name_list)
 
@@ -1144,81 +1445,120 @@ class HelmDeployFunction(BaseFunction):
                 if c["name"] in name_set or c["context"] in name_set
             ]
 
-        if cluster_labels:
-            # Parse label selectors
-            label_selectors = {}
-            for label in cluster_labels:
-                if "=" in label:
-                    key, value = label.split("=", 1)
-                    label_selectors[key.strip()] = value.strip()
+        # Label selectors are not matched against cluster metadata yet, so
+        # cluster_labels selects every cluster; parsing them here would be
+        # wasted work until real label matching is implemented
+        return all_clusters
 
-            # Note: In a real implementation, you would check actual cluster labels
-            # For now, this returns all clusters with a warning
-            # In production, this would query cluster metadata or labels
-            return all_clusters
+    async def _discover_clusters_cached(
+        self, kubeconfig: str, remote_context: str
+    ) -> List[Dict[str, Any]]:
+        """Discover clusters, reusing results from the last few seconds.
 
-        return all_clusters
+        The cache key includes the kubeconfig modification time so edits to
+        the file are picked up immediately. Empty results are not cached.
+        """
+        key = (kubeconfig, remote_context, self._kubeconfig_mtime(kubeconfig))
+        cached = self._discovery_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._discovery_ttl:
+            return list(cached[1])
+
+        # The lock is bound to the running loop, which can differ per call
+        loop = asyncio.get_running_loop()
+        if self._discovery_lock is None or self._discovery_lock_loop is not loop:
+            self._discovery_lock = asyncio.Lock()
+            self._discovery_lock_loop = loop
+
+        async with self._discovery_lock:
+            # Another caller may have populated the cache while we waited
+            cached = self._discovery_cache.get(key)
+            if cached and time.monotonic() - cached[0] < self._discovery_ttl:
+                return list(cached[1])
+
+            clusters = await self._discover_clusters(kubeconfig, remote_context)
+            if clusters:
+                self._discovery_cache[key] = (time.monotonic(), clusters)
+            return list(clusters)
+
+    def _kubeconfig_mtime(self, kubeconfig: str) -> Tuple[float, ...]:
+        """Return modification times of the kubeconfig file(s) in effect."""
+        mtimes = []
+        for path in resolve_kubeconfig_path(kubeconfig).split(os.pathsep):
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                mtimes.append(0.0)
+        return tuple(mtimes)
 
     async def _discover_clusters(
         self, kubeconfig: str, remote_context: str
     ) -> List[Dict[str, Any]]:
         """Discover available clusters using kubectl."""
         try:
-            clusters = []
-
-            # Get kubeconfig contexts
-            cmd = ["kubectl", "config", "get-contexts", "-o", "name"]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
-
-            result = await self._run_command(cmd)
-            if result["returncode"] != 0:
-                return []
-
-            contexts = result["stdout"].strip().split("\n")
-
-            # Test connectivity to each context
-            for context in contexts:
-                if not context.strip():
-                    continue
+            # Get kubeconfig contexts, asking kubectl only when the file
+            # cannot be read directly
+            context_names = self._read_context_names(kubeconfig)
+            if context_names is None:
+                cmd = ["kubectl", "config", "get-contexts", "-o", "name"]
+                if kubeconfig:
+                    cmd.extend(["--kubeconfig", kubeconfig])
 
-                # Skip WDS (Workload Description Space) clusters for direct deployment
-                if self._is_wds_cluster(context):
-                    continue
+                result = await self._run_command(cmd)
+                if result["returncode"] != 0:
+                    return []
+                context_names = result["stdout"].strip().split("\n")
+
+            # Skip WDS (Workload Description Space) clusters for direct deployment
+            contexts = [
+                context
+                for context in context_names
+                if context.strip() and not self._is_wds_cluster(context)
+            ]
 
-                # Test cluster connectivity
-                test_cmd = ["kubectl", "cluster-info", "--context", context]
+            async def probe(context: str) -> Dict[str, Any]:
+                # Test cluster connectivity with a single readiness request;
+                # cluster-info would also list the kube-system services
+                test_cmd = ["kubectl", "get", "--raw", "/readyz", "--context", context]
                 if kubeconfig:
                     test_cmd.extend(["--kubeconfig", kubeconfig])
 
-                test_result = await self._run_command(test_cmd)
+                # Only the exit status matters, so stdout is left undecoded
+                test_result = await self._run_command(test_cmd, decode=False)
                 status = "Ready" if test_result["returncode"] == 0 else "Unreachable"
 
-                clusters.append({"name": context, "context": context, "status": status})
+                return {"name": context, "context": context, "status": status}
 
-            return clusters
+            # Test connectivity to each context concurrently
+            return list(await asyncio.gather(*(probe(c) for c in contexts)))
 
         except Exception:
             return []
 
+    def _read_context_names(self, kubeconfig: str) -> Optional[List[str]]:
+        """Read context names from a single kubeconfig file.
+
+        Returns None when kubectl has to be asked instead: for a merged
+        KUBECONFIG list, or a file that is missing or cannot be parsed.
+        Names are sorted, as kubectl config get-contexts prints them.
+        """
+        path = resolve_kubeconfig_path(kubeconfig)
+        if os.pathsep in path:
+            return None
+
+        try:
+            config = load_kubeconfig(path)
+            return sorted({ctx["name"] for ctx in config.get("contexts") or []})
+        except Exception:
+            return None
+
     def _is_wds_cluster(self, cluster_name: str) -> bool:
         """Check if cluster is a WDS (Workload Description Space) cluster."""
-        lower_name = cluster_name.lower()
-        return (
-            lower_name.startswith("wds")
-            or "-wds-" in lower_name
-            or "_wds_" in lower_name
-        )
-        
+        return _WDS_NAME_RE.search(cluster_name) is not None
+
     def _is_its_cluster(self, cluster_name: str) -> bool:
         """Check if cluster is an ITS (Inventory & Template Space) cluster."""
-        lower_name = cluster_name.lower()
-        return (
-            lower_name.startswith("its")
-            or "-its-" in lower_name
-            or "_its_" in lower_name
-        )
-        
+        return _ITS_NAME_RE.search(cluster_name) is not None
+
     def _is_wec_cluster(self, cluster_name: str) -> bool:
         """Check if cluster is a WEC (Workload Execution Cluster)."""
         # WEC clusters are typically named cluster1, cluster2, etc.
@@ -1227,7 +1567,6 @@ class HelmDeployFunction(BaseFunction):
         
     def _log_warning(self, message: str) -> None:
         """Log a warning message."""
-        import sys
         print(f"WARNING: {message}", file=sys.stderr)
 
     async def _resolve_target_namespaces(
@@ -1254,12 +1593,13 @@ class HelmDeployFunction(BaseFunction):
                 if namespace_selector:
                     cmd.extend(["-l", namespace_selector])
 
-                cmd.extend(["-o", "jsonpath={.items[*].metadata.name}"])
+                # One name per line, collected while kubectl is still writing
+                cmd.extend(
+                    ["-o", 'jsonpath={range .items[*]}{.metadata.name}{"\\n"}{end}']
+                )
 
-                result = await self._run_command(cmd)
-                if result["returncode"] == 0:
-                    namespaces = result["stdout"].strip().split()
-                    return [ns for ns in namespaces if ns]
+                lines = self._run_command_stream(cmd, slots=self._get_proc_slots())
+                return [ns async for ns in lines if ns]
 
             if namespace:
                 return [namespace]
@@ -1269,21 +1609,80 @@ class HelmDeployFunction(BaseFunction):
         except Exception:
             return ["default"] if not namespace else [namespace]
 
-    async def _run_command(self, cmd: List[str]) -> Dict[str, Any]:
-        """Run a shell command asynchronously."""
+    async def _run_command(
+        self, cmd: List[str], stdin: Optional[str] = None, decode: bool = True
+    ) -> Dict[str, Any]:
+        """Run a shell command asynchronously, optionally feeding text to stdin.
+
+        stdout is read in full for parsing, while only the last
+        _STDERR_TAIL_BYTES of stderr are retained for error reporting.
+        With decode=False stdout is returned as bytes, which json.loads
+        accepts directly. At most _max_procs() commands run at once.
+        """
+        async with self._get_proc_slots():
+            return await self._run_command_unbounded(cmd, stdin, decode)
+
+    def _get_proc_slots(self) -> asyncio.Semaphore:
+        """Return the subprocess semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._proc_slots is None or self._proc_slots_loop is not loop:
+            self._proc_slots = asyncio.Semaphore(_max_procs())
+            self._proc_slots_loop = loop
+        return self._proc_slots
+
+    async def _run_command_unbounded(
+        self, cmd: List[str], stdin: Optional[str], decode: bool = True
+    ) -> Dict[str, Any]:
+        """Run a command without acquiring a subprocess slot."""
         try:
             process = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                *cmd,
+                stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=1 << 20,
+            )
+
+            async def feed_stdin() -> None:
+                if stdin is None:
+                    return
+                try:
+                    process.stdin.write(stdin.encode())
+                    await process.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    process.stdin.close()
+
+            async def read_stderr_tail() -> bytes:
+                tail: Deque[bytes] = deque()
+                size = 0
+                while True:
+                    chunk = await process.stderr.read(65536)
+                    if not chunk:
+                        break
+                    tail.append(chunk)
+                    size += len(chunk)
+                    while size - len(tail[0]) >= _STDERR_TAIL_BYTES:
+                        size -= len(tail.popleft())
+                return b"".join(tail)[-_STDERR_TAIL_BYTES:]
+
+            stdout, stderr, _ = await asyncio.gather(
+                process.stdout.read(), read_stderr_tail(), feed_stdin()
             )
-            stdout, stderr = await process.communicate()
+            await process.wait()
 
             return {
                 "returncode": process.returncode,
-                "stdout": stdout.decode(),
-                "stderr": stderr.decode(),
+                "stdout": stdout.decode() if decode else stdout,
+                "stderr": stderr.decode(errors="replace"),
             }
         except Exception as e:
-            return {"returncode": 1, "stdout": "", "stderr": str(e)}
+            return {
+                "returncode": 1,
+                "stdout": "" if decode else b"",
+                "stderr": str(e),
+            }
 
     def get_schema(self) -> Dict[str, Any]:
         """Define the JSON schema for function parameters."""
@@ -1429,6 +1828,12 @@ class HelmDeployFunction(BaseFunction):
                     "type": "string",
                     "description": "WDS (Workload Description Space) context for binding policy creation",
                 },
+                "max_parallel_clusters": {
+                    "type": "integer",
+                    "description": "Maximum number of clusters to run Helm operations on concurrently",
+                    "default": 8,
+                    "minimum": 1,
+                },
             },
             "anyOf": [
                 {
@@ -1,13 +1,62 @@
 """Kubeconfig function implementation."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from ..base_functions import BaseFunction
 
+# Prefer the libyaml-backed loader; it is much faster on large kubeconfigs
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _load_kubeconfig_cached(
+    path: str, mtime_ns: int, size: int
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Parse a kubeconfig file and index its contexts by name.
+
+    mtime_ns and size are part of the cache key only, so an edited file is
+    parsed again. The returned dicts are shared and must not be mutated.
+    """
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
+
+    contexts_by_name: Dict[str, Dict[str, Any]] = {}
+    if isinstance(data, dict):
+        for ctx in data.get("contexts") or []:
+            # The first entry wins, matching kubectl for duplicate names
+            contexts_by_name.setdefault(ctx["name"], ctx)
+    return data, contexts_by_name
+
+
+def resolve_kubeconfig_path(kubeconfig: str = "") -> str:
+    """Return the kubeconfig path(s) kubectl would use.
+
+    An explicit path wins, then a non-empty $KUBECONFIG (which may list
+    several files), then ~/.kube/config.
+    """
+    return (
+        kubeconfig
+        or os.environ.get("KUBECONFIG")
+        or os.path.expanduser("~/.kube/config")
+    )
+
+
+def load_kubeconfig(path: str) -> Dict[str, Any]:
+    """Load a kubeconfig file, reusing the cached parse while it is unchanged.
+
+    The returned dict is shared and must not be mutated.
+    """
+    st = os.stat(path)
+    return _load_kubeconfig_cached(path, st.st_mtime_ns, st.st_size)[0]
+
 
 class KubeconfigFunction(BaseFunction):
     """Function to get details from kubeconfig file."""
@@ -49,9 +98,11 @@ class KubeconfigFunction(BaseFunction):
             }
 
         try:
-            # Load kubeconfig
-            with open(kubeconfig_path, "r") as f:
-                kubeconfig = yaml.safe_load(f)
+            # Load kubeconfig, reusing the parse while the file is unchanged
+            st = os.stat(kubeconfig_path)
+            kubeconfig, contexts_by_name = _load_kubeconfig_cached(
+                kubeconfig_path, st.st_mtime_ns, st.st_size
+            )
 
             result = {
                 "kubeconfig_path": kubeconfig_path,
@@ -65,9 +116,7 @@ class KubeconfigFunction(BaseFunction):
 
             # If specific context requested
             if context:
-                context_data = next(
-                    (ctx for ctx in contexts if ctx["name"] == context), None
-                )
+                context_data = contexts_by_name.get(context)
                 if context_data:
                     result["selected_context"] = self._get_context_details(
                         kubeconfig, context_data
@@ -6,13 +6,281 @@ Supports binding policies, workload transformations, and status management.
 
 import asyncio
 import json
+import os
+import re
+import sys
+import time
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 
 from ..base_functions import BaseFunction
-
-
-@dataclass
+from .kubeconfig import load_kubeconfig, resolve_kubeconfig_path
+
+# API groups whose resources identify KubeStellar and OCM spaces
+_KUBESTELLAR_API_GROUPS = (
+    "control.kubestellar.io",
+    "cluster.open-cluster-management.io",
+    "work.open-cluster-management.io",
+)
+
+# kubectl's on-disk discovery cache is trusted for this long, in seconds
+_DISCOVERY_CACHE_TTL = 600.0
+
+# kubectl names a server's discovery cache directory after its host, with
+# these characters replaced by "_"
+_DISCOVERY_HOST_CHARS_RE = re.compile(r"[^(\w/.)]")
+
+# Default bound on concurrent kubectl processes, to spare the API servers
+_MAX_CONCURRENT_COMMANDS = 16
+
+# Lines of kubectl get namespaces -o name
+_NAMESPACE_NAME_RE = re.compile(r"^namespace/(\S+)$", re.MULTILINE)
+
+# Lines of kubectl api-resources -o name for grouped resources
+_GROUPED_RESOURCE_NAME_RE = re.compile(r"^([^.\s]+)\.(\S+)$", re.MULTILINE)
+
+# kubectl get rejects a whole multi-type request for one unknown type
+_UNKNOWN_RESOURCE_TYPE_RE = re.compile(r'resource type "([^"]+)"')
+
+
+def _max_concurrent_commands() -> int:
+    """Maximum concurrent kubectl processes (KUBESTELLAR_MAX_PARALLEL overrides)."""
+    try:
+        return max(1, int(os.environ["KUBESTELLAR_MAX_PARALLEL"]))
+    except (KeyError, ValueError):
+        return _MAX_CONCURRENT_COMMANDS
+
+
+@lru_cache(maxsize=128)
+def _context_flags(context: str, kubeconfig: str) -> Tuple[str, ...]:
+    """Return the kubectl flags selecting a context, built once per context."""
+    flags: Tuple[str, ...] = ("--context", context)
+    if kubeconfig:
+        flags += ("--kubeconfig", kubeconfig)
+    return flags
+
+
+def _kubectl(context: str, kubeconfig: str, *args: str) -> List[str]:
+    """Build a kubectl command line targeting a context."""
+    return ["kubectl", *args, *_context_flags(context, kubeconfig)]
+
+
+# Fields deep search keeps, projected by kubectl so that specs, secret data
+# and the like never reach this process. Each object prints one
+# tab-separated "R" line; WorkStatus objects add an "S" line with their
+# status. Maps print as single-line JSON, other fields are plain names.
+_RESOURCE_FIELDS_JSONPATH = (
+    "{range .items[*]}R\t{.kind}\t{.apiVersion}\t{.metadata.namespace}\t"
+    "{.metadata.name}\t{.metadata.creationTimestamp}\t{.metadata.uid}\t"
+    "{.metadata.resourceVersion}\t{.status.phase}\t{.spec.nodeName}\t"
+    "{.metadata.labels}\t{.metadata.annotations}\n{end}"
+    '{range .items[?(@.kind=="WorkStatus")]}S\t{.metadata.uid}\t{.status}\n{end}'
+)
+_RESOURCE_FIELD_COUNT = 12
+
+
+def _json_object(text: str) -> Dict[str, Any]:
+    """Parse a projected JSON map, treating absent or odd output as empty.
+
+    Keys are interned: the same label and annotation keys recur on most
+    objects of a listing.
+    """
+    if not text:
+        return {}
+    try:
+        value = json.loads(
+            text, object_pairs_hook=lambda pairs: {sys.intern(k): v for k, v in pairs}
+        )
+    except json.JSONDecodeError:
+        return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _parse_projected_items(output: str) -> List[Dict[str, Any]]:
+    """Rebuild minimal objects from _RESOURCE_FIELDS_JSONPATH output.
+
+    The objects have the same shape as kubectl -o json items, limited to
+    the projected fields. Truncated lines are skipped.
+    """
+    items: Dict[str, Dict[str, Any]] = {}
+    for line in output.split("\n"):
+        fields = line.split("\t")
+        if fields[0] == "R" and len(fields) == _RESOURCE_FIELD_COUNT:
+            (
+                _,
+                kind,
+                api_version,
+                namespace,
+                name,
+                created,
+                uid,
+                resource_version,
+                phase,
+                node_name,
+                labels,
+                annotations,
+            ) = fields
+            # Kinds, API versions and namespaces repeat across a listing;
+            # interning keeps one copy of each
+            items[uid] = {
+                "kind": sys.intern(kind),
+                "apiVersion": sys.intern(api_version),
+                "metadata": {
+                    "name": name,
+                    "namespace": sys.intern(namespace),
+                    "labels": _json_object(labels),
+                    "annotations": _json_object(annotations),
+                    "creationTimestamp": created,
+                    "uid": uid,
+                    "resourceVersion": resource_version,
+                },
+                "spec": {"nodeName": node_name or None},
+                "status": {"phase": phase or None},
+            }
+        elif fields[0] == "S" and len(fields) == 3 and fields[1] in items:
+            items[fields[1]]["status"] = _json_object(fields[2])
+    return list(items.values())
+
+
+# Policy and status listings: one line per object with kind, name, namespace
+# and creation time, then (with details) spec and status as single-line JSON
+_OBJECT_LINE_JSONPATH = (
+    "{range .items[*]}{.kind}\t{.metadata.name}\t{.metadata.namespace}\t"
+    "{.metadata.creationTimestamp}\t{.spec}\t{.status}\n{end}"
+)
+_OBJECT_SUMMARY_LINE_JSONPATH = (
+    "{range .items[*]}{.kind}\t{.metadata.name}\t{.metadata.namespace}\t"
+    "{.metadata.creationTimestamp}\n{end}"
+)
+
+# KubeStellar objects listed together per cluster, by kind
+_KUBESTELLAR_OBJECT_RESOURCES = {
+    "BindingPolicy": "bindingpolicies",
+    "WorkStatus": "workstatuses",
+}
+
+# Context naming conventions, in classification precedence order
+_SPACE_NAME_PATTERNS = tuple(
+    (space_type, re.compile(rf"^{space_type}|-{space_type}-", re.IGNORECASE))
+    for space_type in ("wds", "its", "wec")
+)
+
+# Label and annotation keys that mark a KubeStellar dependency
+_DEPENDENCY_MARKER_RE = re.compile(r"kubestellar|binding", re.IGNORECASE)
+
+# Topology map list for each space type; other types are "standard"
+_TOPOLOGY_BUCKETS = {
+    "control_plane": "control_planes",
+    "wec": "wec_clusters",
+    "wds": "wds_clusters",
+}
+
+# Kinds that are KubeStellar objects regardless of labels
+_KUBESTELLAR_KINDS = frozenset(
+    {"WorkStatus", "BindingPolicy", "Placement", "PlacementDecision"}
+)
+
+# Parameter schema; built once and shared by every get_schema() call, so
+# callers must not mutate it
+_PARAMETERS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "description": "Operation type to perform",
+            "enum": [
+                "deep_search",
+                "policy_analysis",
+                "resource_inventory",
+                "topology_map",
+            ],
+            "default": "deep_search",
+        },
+        "resource_types": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Specific resource types to search for (pods, services, deployments, workstatuses, etc.)",
+        },
+        "namespace_names": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Specific namespace names to analyze",
+        },
+        "all_namespaces": {
+            "type": "boolean",
+            "description": "Include all namespaces in search",
+            "default": True,
+        },
+        "cluster_names": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "Specific cluster names to analyze",
+        },
+        "all_clusters": {
+            "type": "boolean",
+            "description": "Include all clusters in analysis",
+            "default": True,
+        },
+        "label_selector": {
+            "type": "string",
+            "description": "Label selector for resource filtering (e.g., 'app=nginx')",
+        },
+        "field_selector": {
+            "type": "string",
+            "description": "Field selector for resource filtering (e.g., 'status.phase=Running')",
+        },
+        "binding_policies": {
+            "type": "boolean",
+            "description": "Include binding policy analysis",
+            "default": True,
+        },
+        "work_statuses": {
+            "type": "boolean",
+            "description": "Include work status tracking",
+            "default": True,
+        },
+        "placement_analysis": {
+            "type": "boolean",
+            "description": "Analyze resource placement strategies",
+            "default": True,
+        },
+        "deep_analysis": {
+            "type": "boolean",
+            "description": "Perform deep dependency and relationship analysis",
+            "default": True,
+        },
+        "include_wds": {
+            "type": "boolean",
+            "description": "Include WDS clusters in analysis",
+            "default": False,
+        },
+        "kubeconfig": {
+            "type": "string",
+            "description": "Path to kubeconfig file",
+        },
+        "output_format": {
+            "type": "string",
+            "description": "Output format for results",
+            "enum": ["comprehensive", "summary", "detailed", "json"],
+            "default": "comprehensive",
+        },
+    },
+    "required": [],
+}
+
+
+@dataclass(slots=True)
 class KubeStellarSpace:
     """KubeStellar space information (WDS/ITS)."""
 
@@ -28,7 +296,7 @@ class KubeStellarSpace:
     manifest_works: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BindingPolicy:
     """KubeStellar binding policy with 2024 architecture support."""
 
@@ -44,7 +312,7 @@ class BindingPolicy:
     binding_objects: List[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkStatus:
     """KubeStellar work status with OCM integration."""
 
@@ -59,7 +327,7 @@ class WorkStatus:
     created: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ManifestWork:
     """OCM ManifestWork object information."""
 
@@ -81,6 +349,23 @@ class KubeStellarManagementFunction(BaseFunction):
             name="kubestellar_management",
             description="Advanced KubeStellar multi-cluster resource management with deep search capabilities, binding policy integration, work status tracking, and comprehensive cluster topology analysis. Provides detailed insights into resource distribution, policy compliance, and cross-cluster relationships.",
         )
+        # Space classifications change on minute-to-hour timescales, so they
+        # are reused for a short while across calls
+        self._topology_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._topology_ttl = 60.0
+        # Reachability is probed far more often and may flip quickly
+        self._reachable_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+        self._reachable_ttl = 10.0
+        # In-flight fetches, shared by concurrent callers asking the same thing
+        self._inflight: Dict[Tuple[str, ...], asyncio.Future] = {}
+        # Policy and status listings, reused by the operations of one analysis
+        self._listing_cache: Dict[
+            Tuple[str, ...], Tuple[float, Dict[str, List[Dict[str, Any]]]]
+        ] = {}
+        self._listing_ttl = 30.0
+        # Created lazily: a semaphore is bound to the loop that first uses it
+        self._command_slots: Optional[asyncio.Semaphore] = None
+        self._command_slots_loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def execute(
         self,
@@ -125,9 +410,12 @@ class KubeStellarManagementFunction(BaseFunction):
             Dictionary with comprehensive KubeStellar analysis results
         """
         try:
-            # Discover KubeStellar cluster topology
+            # Discover KubeStellar cluster topology; spaces are named after
+            # their contexts, so requested clusters need no full discovery
             clusters = await self._discover_kubestellar_topology(
-                kubeconfig, include_wds
+                kubeconfig,
+                include_wds,
+                cluster_names if cluster_names and not all_clusters else None,
             )
             if not clusters:
                 return {
@@ -135,10 +423,6 @@ class KubeStellarManagementFunction(BaseFunction):
                     "error": "No KubeStellar clusters discovered",
                 }
 
-            # Filter clusters if specified
-            if cluster_names and not all_clusters:
-                clusters = [c for c in clusters if c["name"] in cluster_names]
-
             # Execute operation based on type
             if operation == "deep_search":
                 return await self._perform_deep_search(
@@ -185,51 +469,92 @@ class KubeStellarManagementFunction(BaseFunction):
             }
 
     async def _discover_kubestellar_topology(
-        self, kubeconfig: str, include_wds: bool
+        self,
+        kubeconfig: str,
+        include_wds: bool,
+        contexts: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Discover KubeStellar 2024 architecture topology with WDS, ITS, and WEC classification."""
-        try:
-            spaces = []
+        """Discover KubeStellar 2024 architecture topology with WDS, ITS, and WEC classification.
 
-            # Get all kubeconfig contexts
-            cmd = ["kubectl", "config", "get-contexts", "-o", "name"]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
+        When contexts is given only those are probed and classified;
+        otherwise every kubeconfig context is.
+        """
+        try:
+            if contexts:
+                contexts = list(dict.fromkeys(contexts))
+            else:
+                # Get all kubeconfig contexts
+                cmd = ["kubectl", "config", "get-contexts", "-o", "name"]
+                if kubeconfig:
+                    cmd.extend(["--kubeconfig", kubeconfig])
 
-            result = await self._run_command(cmd)
-            if result["returncode"] != 0:
-                return []
+                result = await self._run_command(cmd)
+                if result["returncode"] != 0:
+                    return []
 
-            contexts = result["stdout"].strip().split("\n")
+                contexts = [
+                    c for c in result["stdout"].strip().split("\n") if c.strip()
+                ]
 
-            # Analyze each context for KubeStellar 2024 components
-            for context in contexts:
-                if not context.strip():
-                    continue
+            async def discover(context: str) -> Optional[Dict[str, Any]]:
+                # Unreachable contexts are not worth classifying
+                if not await self._is_reachable(context, kubeconfig):
+                    return None
 
                 # Classify space type based on 2024 architecture
-                space_info = await self._classify_kubestellar_space(context, kubeconfig)
+                space_info = await self._classify_kubestellar_space_cached(
+                    context, kubeconfig
+                )
 
                 # Skip WDS spaces unless explicitly requested
                 if space_info["type"] == "wds" and not include_wds:
-                    continue
+                    return None
 
-                # Test connectivity
-                test_cmd = ["kubectl", "cluster-info", "--context", context]
-                if kubeconfig:
-                    test_cmd.extend(["--kubeconfig", kubeconfig])
-
-                test_result = await self._run_command(test_cmd)
-                if test_result["returncode"] == 0:
-                    space_info["status"] = "Ready"
-                    space_info["context"] = context
-                    spaces.append(space_info)
+                space_info["status"] = "Ready"
+                space_info["context"] = context
+                return space_info
 
-            return spaces
+            # Analyze all contexts concurrently, keeping kubeconfig order
+            results = await asyncio.gather(
+                *(discover(context) for context in contexts), return_exceptions=True
+            )
+            return [space for space in results if isinstance(space, dict)]
 
         except Exception:
             return []
 
+    async def _is_reachable(self, context: str, kubeconfig: str) -> bool:
+        """Probe a context with kubectl cluster-info, reusing recent verdicts."""
+        key = (context, kubeconfig)
+        cached = self._reachable_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._reachable_ttl:
+            return cached[1]
+
+        cmd = _kubectl(context, kubeconfig, "cluster-info")
+
+        result = await self._run_command(cmd)
+        reachable = result["returncode"] == 0
+        self._reachable_cache[key] = (time.monotonic(), reachable)
+        return reachable
+
+    async def _classify_kubestellar_space_cached(
+        self, context: str, kubeconfig: str
+    ) -> Dict[str, Any]:
+        """Classify a space, reusing a classification younger than the TTL.
+
+        Failed classifications (type "unknown") are not cached. A copy is
+        returned because callers add per-call fields such as status.
+        """
+        key = (context, kubeconfig)
+        cached = self._topology_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._topology_ttl:
+            return dict(cached[1])
+
+        space_info = await self._classify_kubestellar_space(context, kubeconfig)
+        if space_info["type"] != "unknown":
+            self._topology_cache[key] = (time.monotonic(), space_info)
+        return dict(space_info)
+
     async def _classify_kubestellar_space(
         self, context: str, kubeconfig: str
     ) -> Dict[str, Any]:
@@ -245,78 +570,49 @@ class KubeStellarManagementFunction(BaseFunction):
                 "ocm_components": {},
             }
 
-            # Get CRDs to identify space type
-            cmd = [
-                "kubectl",
-                "api-resources",
-                "--context",
-                context,
-                "--api-group=control.kubestellar.io",
-            ]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
-
-            result = await self._run_command(cmd)
-            kubestellar_resources = (
-                result["stdout"] if result["returncode"] == 0 else ""
+            # List each API group once; the same listing identifies the space
+            # type and fills api_resources
+            group_resources = await self._get_api_group_resources(context, kubeconfig)
+            kubestellar_resources = set(
+                group_resources.get("control.kubestellar.io", [])
             )
-
-            # Get OCM CRDs
-            ocm_cmd = [
-                "kubectl",
-                "api-resources",
-                "--context",
-                context,
-                "--api-group=cluster.open-cluster-management.io",
-            ]
-            if kubeconfig:
-                ocm_cmd.extend(["--kubeconfig", kubeconfig])
-
-            ocm_result = await self._run_command(ocm_cmd)
-            ocm_resources = (
-                ocm_result["stdout"] if ocm_result["returncode"] == 0 else ""
+            ocm_resources = set(
+                group_resources.get("cluster.open-cluster-management.io", [])
             )
 
             # Classify based on KubeStellar 2024 architecture
-            if "bindingpolicies" in kubestellar_resources.lower():
+            if "bindingpolicies" in kubestellar_resources:
                 space_info["type"] = "wds"  # Workload Description Space
                 space_info["kubestellar_components"]["binding_controller"] = True
                 space_info["kubestellar_components"]["controller_manager"] = True
-            elif "workstatuses" in kubestellar_resources.lower():
+            elif "workstatuses" in kubestellar_resources:
                 space_info["type"] = "its"  # Inventory and Transport Space
                 space_info["kubestellar_components"]["transport_controller"] = True
                 space_info["kubestellar_components"]["status_controller"] = True
-            elif "managedclusters" in ocm_resources.lower():
+            elif "managedclusters" in ocm_resources:
                 space_info["type"] = "its"  # ITS with OCM Hub
                 space_info["ocm_components"]["cluster_manager"] = True
-            elif "manifestworks" in ocm_resources.lower():
+            elif "manifestworks" in ocm_resources:
                 # Could be either ITS or WEC with OCM agent
-                if context.lower().startswith("wds") or "-wds-" in context.lower():
+                if self._space_type_from_name(context) == "wds":
                     space_info["type"] = "wds"
                 else:
                     space_info["type"] = "wec"  # Workload Execution Cluster
                     space_info["ocm_components"]["klusterlet"] = True
             else:
                 # Check naming patterns for space type
-                context_lower = context.lower()
-                if context_lower.startswith("wds") or "-wds-" in context_lower:
-                    space_info["type"] = "wds"
-                elif context_lower.startswith("its") or "-its-" in context_lower:
-                    space_info["type"] = "its"
-                elif context_lower.startswith("wec") or "-wec-" in context_lower:
-                    space_info["type"] = "wec"
-                else:
-                    space_info["type"] = "standard"
+                space_info["type"] = self._space_type_from_name(context)
 
             # Get KubeStellar-specific namespaces
             space_info["namespaces"] = await self._get_kubestellar_namespaces(
                 context, kubeconfig
             )
 
-            # Get API resources count
-            space_info["api_resources"] = await self._get_kubestellar_api_resources(
-                context, kubeconfig
-            )
+            space_info["api_resources"] = [
+                resource
+                for resources in group_resources.values()
+                for resource in resources
+            ]
 
             return space_info
 
@@ -331,16 +627,22 @@ class KubeStellarManagementFunction(BaseFunction):
                 "ocm_components": {},
             }
 
+    @staticmethod
+    def _space_type_from_name(context: str) -> str:
+        """Guess the space type from context naming conventions."""
+        for space_type, pattern in _SPACE_NAME_PATTERNS:
+            if pattern.search(context):
+                return space_type
+        return "standard"
+
     async def _get_kubestellar_namespaces(
         self, context: str, kubeconfig: str
     ) -> List[str]:
         """Get KubeStellar-related namespaces."""
         try:
-            cmd = ["kubectl", "get", "namespaces", "--context", context, "-o", "json"]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
+            cmd = _kubectl(context, kubeconfig, "get", "namespaces", "-o", "json")
 
-            result = await self._run_command(cmd)
+            result = await self._run_command(cmd, decode=False)
             if result["returncode"] != 0:
                 return []
 
@@ -367,42 +669,108 @@ class KubeStellarManagementFunction(BaseFunction):
         except Exception:
             return []
 
-    async def _get_kubestellar_api_resources(
+    async def _get_api_group_resources(
         self, context: str, kubeconfig: str
-    ) -> List[str]:
-        """Get KubeStellar-specific API resources."""
+    ) -> Dict[str, List[str]]:
+        """List resource names per KubeStellar/OCM API group.
+
+        One kubectl api-resources call covers every group; its -o name
+        output has one "<resource>.<group>" line per resource.
+        """
+        cached = self._read_discovery_cache(context, kubeconfig)
+        if cached is not None:
+            return cached
+
+        group_resources: Dict[str, List[str]] = {}
         try:
-            resources = []
+            cmd = _kubectl(context, kubeconfig, "api-resources", "-o", "name")
 
-            # Get KubeStellar API resources
-            for api_group in [
-                "control.kubestellar.io",
-                "cluster.open-cluster-management.io",
-                "work.open-cluster-management.io",
-            ]:
-                cmd = [
-                    "kubectl",
-                    "api-resources",
-                    "--context",
-                    context,
-                    f"--api-group={api_group}",
-                ]
-                if kubeconfig:
-                    cmd.extend(["--kubeconfig", kubeconfig])
+            result = await self._run_command(cmd)
+            if result["returncode"] != 0:
+                return group_resources
 
-                result = await self._run_command(cmd)
-                if result["returncode"] == 0:
-                    lines = result["stdout"].strip().split("\n")
-                    for line in lines[1:]:  # Skip header
-                        if line.strip():
-                            parts = line.split()
-                            if len(parts) >= 1:
-                                resources.append(parts[0])
+            group_resources = {api_group: [] for api_group in _KUBESTELLAR_API_GROUPS}
+            for resource, api_group in _GROUPED_RESOURCE_NAME_RE.findall(
+                result["stdout"]
+            ):
+                if api_group in group_resources:
+                    group_resources[api_group].append(resource)
 
-            return resources
+            return group_resources
 
         except Exception:
-            return []
+            return group_resources
+
+    def _read_discovery_cache(
+        self, context: str, kubeconfig: str
+    ) -> Optional[Dict[str, List[str]]]:
+        """Read KubeStellar/OCM resource names from kubectl's discovery cache.
+
+        kubectl keeps API discovery results under ~/.kube/cache/discovery
+        (or $KUBECACHEDIR), one directory per API server. Returns None when
+        the server cannot be resolved from a single kubeconfig file or any
+        needed cache file is missing or older than _DISCOVERY_CACHE_TTL; the
+        kubectl fallback then refreshes the cache.
+        """
+        path = resolve_kubeconfig_path(kubeconfig)
+        if os.pathsep in path:
+            return None
+
+        try:
+            config = load_kubeconfig(path)
+            cluster_name = next(
+                ctx["context"]["cluster"]
+                for ctx in config.get("contexts") or []
+                if ctx["name"] == context
+            )
+            server = next(
+                cluster["cluster"]["server"]
+                for cluster in config.get("clusters") or []
+                if cluster["name"] == cluster_name
+            )
+
+            host = server.replace("https://", "", 1).replace("http://", "", 1)
+            cache_root = os.environ.get("KUBECACHEDIR") or os.path.expanduser(
+                "~/.kube/cache"
+            )
+            server_dir = os.path.join(
+                cache_root, "discovery", _DISCOVERY_HOST_CHARS_RE.sub("_", host)
+            )
+
+            def read_fresh(file_path: str) -> Dict[str, Any]:
+                if time.time() - os.stat(file_path).st_mtime > _DISCOVERY_CACHE_TTL:
+                    raise FileNotFoundError(file_path)
+                with open(file_path, "rb") as f:
+                    return json.load(f)
+
+            preferred_versions = {
+                group["name"]: group["preferredVersion"]["version"]
+                for group in read_fresh(
+                    os.path.join(server_dir, "servergroups.json")
+                ).get("groups", [])
+            }
+
+            group_resources: Dict[str, List[str]] = {}
+            for api_group in _KUBESTELLAR_API_GROUPS:
+                version = preferred_versions.get(api_group)
+                if version is None:
+                    # The server does not serve this group
+                    group_resources[api_group] = []
+                    continue
+
+                resource_list = read_fresh(
+                    os.path.join(server_dir, api_group, version, "serverresources.json")
+                )
+                group_resources[api_group] = [
+                    resource["name"]
+                    for resource in resource_list.get("resources", [])
+                    if "/" not in resource["name"]  # Skip subresources
+                ]
+
+            return group_resources
+
+        except Exception:
+            return None
 
     async def _get_kubestellar_info(
         self, context: str, kubeconfig: str
@@ -417,9 +785,7 @@ class KubeStellarManagementFunction(BaseFunction):
             }
 
             # Get KubeStellar API resources
-            cmd = ["kubectl", "api-resources", "--context", context]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
+            cmd = _kubectl(context, kubeconfig, "api-resources")
 
             result = await self._run_command(cmd)
             if result["returncode"] == 0:
@@ -437,19 +803,9 @@ class KubeStellarManagementFunction(BaseFunction):
                             )
 
             # Get KubeStellar namespaces
-            ns_cmd = [
-                "kubectl",
-                "get",
-                "namespaces",
-                "--context",
-                context,
-                "-o",
-                "json",
-            ]
-            if kubeconfig:
-                ns_cmd.extend(["--kubeconfig", kubeconfig])
+            ns_cmd = _kubectl(context, kubeconfig, "get", "namespaces", "-o", "json")
 
-            ns_result = await self._run_command(ns_cmd)
+            ns_result = await self._run_command(ns_cmd, decode=False)
             if ns_result["returncode"] == 0:
                 ns_data = json.loads(ns_result["stdout"])
                 for ns in ns_data.get("items", []):
@@ -520,36 +876,65 @@ class KubeStellarManagementFunction(BaseFunction):
                     "placementdecisions",
                 ]
 
-            # Execute deep search on each cluster
-            for cluster in clusters:
-                cluster_result = await self._deep_search_cluster(
-                    cluster,
-                    resource_types,
-                    namespace_names,
-                    all_namespaces,
-                    label_selector,
-                    field_selector,
-                    binding_policies,
-                    work_statuses,
-                    kubeconfig,
+            # Policy and status specs are only reported in deep or detailed
+            # output; otherwise just their identities are listed
+            details = deep_analysis or output_format == "detailed"
+
+            # Search every cluster and collect policies/statuses concurrently
+            aggregates = []
+            if binding_policies:
+                aggregates.append(
+                    (
+                        "binding_policies",
+                        self._aggregate_binding_policies(clusters, kubeconfig, details),
+                    )
+                )
+            if work_statuses:
+                aggregates.append(
+                    (
+                        "work_statuses",
+                        self._aggregate_work_statuses(clusters, kubeconfig, details),
+                    )
                 )
+
+            outcomes = await asyncio.gather(
+                *(
+                    self._deep_search_cluster(
+                        cluster,
+                        resource_types,
+                        namespace_names,
+                        all_namespaces,
+                        label_selector,
+                        field_selector,
+                        binding_policies,
+                        work_statuses,
+                        kubeconfig,
+                    )
+                    for cluster in clusters
+                ),
+                *(coro for _, coro in aggregates),
+                return_exceptions=True,
+            )
+
+            for cluster, cluster_result in zip(clusters, outcomes):
+                if isinstance(cluster_result, Exception):
+                    cluster_result = {
+                        "cluster": cluster["name"],
+                        "status": "error",
+                        "error": str(cluster_result),
+                    }
                 results["cluster_results"][cluster["name"]] = cluster_result
 
+            for (key, _), outcome in zip(aggregates, outcomes[len(clusters) :]):
+                if isinstance(outcome, Exception):
+                    outcome = {"error": str(outcome)}
+                results[key] = outcome
+
             # Aggregate results
             results["resource_summary"] = self._aggregate_resource_summary(
                 results["cluster_results"]
             )
 
-            if binding_policies:
-                results["binding_policies"] = await self._aggregate_binding_policies(
-                    clusters, kubeconfig
-                )
-
-            if work_statuses:
-                results["work_statuses"] = await self._aggregate_work_statuses(
-                    clusters, kubeconfig
-                )
-
             if placement_analysis:
                 results["placement_analysis"] = self._analyze_resource_placement(
                     results["cluster_results"]
@@ -592,36 +977,68 @@ class KubeStellarManagementFunction(BaseFunction):
                 "kubestellar_resources": [],
             }
 
-            # Get target namespaces
-            target_namespaces = await self._get_target_namespaces(
-                cluster, namespace_names, all_namespaces, kubeconfig
-            )
+            if all_namespaces and not namespace_names:
+                # One cluster-wide listing instead of one per namespace; the
+                # namespace list still runs so empty namespaces are reported
+                target_namespaces, all_resources = await asyncio.gather(
+                    self._get_target_namespaces(
+                        cluster, namespace_names, all_namespaces, kubeconfig
+                    ),
+                    self._search_namespace_resources(
+                        cluster,
+                        None,
+                        resource_types,
+                        label_selector,
+                        field_selector,
+                        kubeconfig,
+                    ),
+                )
+                by_namespace: Dict[str, List[Dict[str, Any]]] = {
+                    namespace: [] for namespace in target_namespaces
+                }
+                for resource in all_resources:
+                    by_namespace.setdefault(resource["namespace"], []).append(resource)
+                namespace_pairs = list(by_namespace.items())
+            else:
+                # Get target namespaces
+                target_namespaces = await self._get_target_namespaces(
+                    cluster, namespace_names, all_namespaces, kubeconfig
+                )
 
-            # Search each namespace for resources
-            for namespace in target_namespaces:
-                namespace_resources = await self._search_namespace_resources(
-                    cluster,
-                    namespace,
-                    resource_types,
-                    label_selector,
-                    field_selector,
-                    kubeconfig,
+                # Search all namespaces concurrently, then merge in order
+                namespace_results = await asyncio.gather(
+                    *(
+                        self._search_namespace_resources(
+                            cluster,
+                            namespace,
+                            resource_types,
+                            label_selector,
+                            field_selector,
+                            kubeconfig,
+                        )
+                        for namespace in target_namespaces
+                    )
                 )
+                namespace_pairs = list(zip(target_namespaces, namespace_results))
 
+            # Resources are listed under their namespace; by type only counts
+            # are kept, so summaries need not walk the resources again
+            type_counts: Counter = Counter()
+            for namespace, namespace_resources in namespace_pairs:
                 cluster_result["namespaces"][namespace] = namespace_resources
                 cluster_result["total_resources"] += len(namespace_resources)
+                type_counts.update(
+                    resource["kind"].lower() for resource in namespace_resources
+                )
 
-                # Categorize resources by type
-                for resource in namespace_resources:
-                    resource_type = resource["kind"].lower()
-                    if resource_type not in cluster_result["resources_by_type"]:
-                        cluster_result["resources_by_type"][resource_type] = []
-                    cluster_result["resources_by_type"][resource_type].append(resource)
-
-                    # Track KubeStellar-specific resources
-                    if self._is_kubestellar_resource(resource):
-                        cluster_result["kubestellar_resources"].append(resource)
+                # Track KubeStellar-specific resources
+                cluster_result["kubestellar_resources"].extend(
+                    resource
+                    for resource in namespace_resources
+                    if self._is_kubestellar_resource(resource)
+                )
 
+            cluster_result["resources_by_type"] = dict(type_counts)
             return cluster_result
 
         except Exception as e:
@@ -643,29 +1060,15 @@ class KubeStellarManagementFunction(BaseFunction):
                 return ["default"]
 
             # Get all namespaces
-            cmd = [
-                "kubectl",
-                "get",
-                "namespaces",
-                "--context",
-                cluster["context"],
-                "-o",
-                "name",
-            ]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
+            cmd = _kubectl(
+                cluster["context"], kubeconfig, "get", "namespaces", "-o", "name"
+            )
 
             result = await self._run_command(cmd)
             if result["returncode"] != 0:
                 return ["default"]
 
-            namespaces = []
-            for line in result["stdout"].strip().split("\n"):
-                if line.startswith("namespace/"):
-                    ns_name = line.replace("namespace/", "")
-                    namespaces.append(ns_name)
-
-            return namespaces
+            return _NAMESPACE_NAME_RE.findall(result["stdout"])
 
         except Exception:
             return ["default"]
@@ -673,104 +1076,129 @@ class KubeStellarManagementFunction(BaseFunction):
     async def _search_namespace_resources(
         self,
         cluster: Dict[str, Any],
-        namespace: str,
+        namespace: Optional[str],
         resource_types: List[str],
         label_selector: str,
         field_selector: str,
         kubeconfig: str,
     ) -> List[Dict[str, Any]]:
-        """Search for resources in a specific namespace."""
-        try:
-            resources = []
+        """Search for resources in a specific namespace, or all when None.
 
-            for resource_type in resource_types:
-                cmd = [
-                    "kubectl",
-                    "get",
-                    resource_type,
-                    "--namespace",
-                    namespace,
-                    "--context",
-                    cluster["context"],
-                    "-o",
-                    "json",
-                ]
+        All resource types are fetched with one comma-separated kubectl get,
+        which prints only the fields in _RESOURCE_FIELDS_JSONPATH.
+        Types the cluster does not serve are dropped and the call retried;
+        any other failure falls back to one call per type.
+        """
 
-                if kubeconfig:
-                    cmd.extend(["--kubeconfig", kubeconfig])
+        async def get_resources(resource_type: str) -> Dict[str, Any]:
+            cmd = _kubectl(
+                cluster["context"],
+                kubeconfig,
+                "get",
+                resource_type,
+                *(
+                    ["--all-namespaces"]
+                    if namespace is None
+                    else ["--namespace", namespace]
+                ),
+                "-o",
+                f"jsonpath={_RESOURCE_FIELDS_JSONPATH}",
+            )
 
-                if label_selector:
-                    cmd.extend(["-l", label_selector])
+            if label_selector:
+                cmd.extend(["-l", label_selector])
 
-                if field_selector:
-                    cmd.extend(["--field-selector", field_selector])
+            if field_selector:
+                cmd.extend(["--field-selector", field_selector])
 
-                result = await self._run_command(cmd)
-                if result["returncode"] == 0:
-                    try:
-                        resource_data = json.loads(result["stdout"])
-                        for item in resource_data.get("items", []):
-                            resource_info = {
-                                "name": item["metadata"]["name"],
-                                "kind": item["kind"],
-                                "api_version": item["apiVersion"],
-                                "namespace": namespace,
-                                "cluster": cluster["name"],
-                                "labels": item["metadata"].get("labels", {}),
-                                "annotations": item["metadata"].get("annotations", {}),
-                                "created": item["metadata"]["creationTimestamp"],
-                                "uid": item["metadata"]["uid"],
-                                "resource_version": item["metadata"]["resourceVersion"],
-                            }
+            return await self._run_command(cmd)
 
-                            # Add resource-specific information
-                            if resource_type == "pods":
-                                resource_info["phase"] = item.get("status", {}).get(
-                                    "phase"
-                                )
-                                resource_info["node"] = item.get("spec", {}).get(
-                                    "nodeName"
-                                )
-                            elif resource_type == "workstatuses":
-                                resource_info["work_status_details"] = item.get(
-                                    "status", {}
-                                )
+        def parse(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+            if result["returncode"] != 0:
+                return []
+
+            resources = []
+            for item in _parse_projected_items(result["stdout"]):
+                try:
+                    resources.append(self._resource_info(item, namespace, cluster))
+                except (KeyError, TypeError, AttributeError):
+                    # Skip malformed items rather than the whole namespace
+                    continue
+            return resources
 
-                            resources.append(resource_info)
+        try:
+            pending = list(resource_types)
+            while pending:
+                result = await get_resources(",".join(pending))
+                if result["returncode"] == 0:
+                    return parse(result)
 
-                    except json.JSONDecodeError:
-                        continue
+                unknown = set(
+                    _UNKNOWN_RESOURCE_TYPE_RE.findall(result["stderr"])
+                ).intersection(pending)
+                if not unknown:
+                    break
+                pending = [t for t in pending if t not in unknown]
 
-            return resources
+            if not pending:
+                return []
+
+            # Some type failed for another reason (e.g. forbidden); query the
+            # types one by one so the others still report
+            results = await asyncio.gather(*(get_resources(t) for t in pending))
+            return [resource for result in results for resource in parse(result)]
 
         except Exception:
             return []
 
+    def _resource_info(
+        self, item: Dict[str, Any], namespace: Optional[str], cluster: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the search result entry for one listed object.
+
+        For cluster-wide listings (namespace None) the object's own namespace
+        is used; cluster-scoped objects get "".
+        """
+        metadata = item["metadata"]
+        resource_info = {
+            "name": metadata["name"],
+            "kind": item["kind"],
+            "api_version": item["apiVersion"],
+            "namespace": (
+                metadata.get("namespace", "") if namespace is None else namespace
+            ),
+            "cluster": cluster["name"],
+            "labels": metadata.get("labels", {}),
+            "annotations": metadata.get("annotations", {}),
+            "created": metadata["creationTimestamp"],
+            "uid": metadata["uid"],
+            "resource_version": metadata["resourceVersion"],
+        }
+
+        # Add resource-specific information
+        if item["kind"] == "Pod":
+            resource_info["phase"] = item.get("status", {}).get("phase")
+            resource_info["node"] = item.get("spec", {}).get("nodeName")
+        elif item["kind"] == "WorkStatus":
+            resource_info["work_status_details"] = item.get("status", {})
+
+        return resource_info
+
     def _is_kubestellar_resource(self, resource: Dict[str, Any]) -> bool:
         """Check if a resource is KubeStellar-specific."""
-        api_version = resource.get("api_version", "")
-        kind = resource.get("kind", "")
-        labels = resource.get("labels", {})
-        annotations = resource.get("annotations", {})
-
-        # Check API version
-        if "kubestellar.io" in api_version:
+        if resource.get("kind", "") in _KUBESTELLAR_KINDS:
             return True
 
-        # Check labels and annotations
-        for key in list(labels.keys()) + list(annotations.keys()):
-            if "kubestellar" in key.lower():
-                return True
-
-        # Check specific KubeStellar resource types
-        kubestellar_kinds = [
-            "WorkStatus",
-            "BindingPolicy",
-            "Placement",
-            "PlacementDecision",
-        ]
+        if "kubestellar.io" in resource.get("api_version", ""):
+            return True
 
-        return kind in kubestellar_kinds
+        # Check label and annotation keys
+        return any(
+            "kubestellar" in key.lower()
+            for key in chain(
+                resource.get("labels", {}), resource.get("annotations", {})
+            )
+        )
 
     def _aggregate_resource_summary(
         self, cluster_results: Dict[str, Any]
@@ -784,6 +1212,7 @@ class KubeStellarManagementFunction(BaseFunction):
             "kubestellar_resources": 0,
             "cluster_types": {},
         }
+        resources_by_type: Counter = Counter()
 
         for cluster_name, cluster_result in cluster_results.items():
             if cluster_result.get("status") != "success":
@@ -801,22 +1230,18 @@ class KubeStellarManagementFunction(BaseFunction):
             summary["cluster_types"][cluster_type]["resources"] += cluster_total
 
             # Aggregate by resource type
-            for resource_type, resources in cluster_result.get(
-                "resources_by_type", {}
-            ).items():
-                if resource_type not in summary["resources_by_type"]:
-                    summary["resources_by_type"][resource_type] = 0
-                summary["resources_by_type"][resource_type] += len(resources)
+            resources_by_type.update(cluster_result.get("resources_by_type", {}))
 
             # Count KubeStellar resources
             summary["kubestellar_resources"] += len(
                 cluster_result.get("kubestellar_resources", [])
             )
 
+        summary["resources_by_type"] = dict(resources_by_type)
         return summary
 
     async def _aggregate_binding_policies(
-        self, clusters: List[Dict[str, Any]], kubeconfig: str
+        self, clusters: List[Dict[str, Any]], kubeconfig: str, details: bool = True
     ) -> Dict[str, Any]:
         """Aggregate binding policy information across clusters."""
         try:
@@ -826,8 +1251,17 @@ class KubeStellarManagementFunction(BaseFunction):
                 "policy_details": [],
             }
 
-            for cluster in clusters:
-                cluster_policies = await self._get_binding_policies(cluster, kubeconfig)
+            # Query every cluster concurrently; a failed cluster counts as empty
+            results = await asyncio.gather(
+                *(
+                    self._get_binding_policies(cluster, kubeconfig, details)
+                    for cluster in clusters
+                ),
+                return_exceptions=True,
+            )
+            for cluster, cluster_policies in zip(clusters, results):
+                if isinstance(cluster_policies, Exception):
+                    cluster_policies = []
                 policies["policies_by_cluster"][cluster["name"]] = len(cluster_policies)
                 policies["total_policies"] += len(cluster_policies)
                 policies["policy_details"].extend(cluster_policies)
@@ -838,47 +1272,14 @@ class KubeStellarManagementFunction(BaseFunction):
             return {"error": "Failed to aggregate binding policies"}
 
     async def _get_binding_policies(
-        self, cluster: Dict[str, Any], kubeconfig: str
+        self, cluster: Dict[str, Any], kubeconfig: str, details: bool = True
     ) -> List[Dict[str, Any]]:
-        """Get binding policies from a cluster."""
-        try:
-            policies = []
-
-            # Try to get binding policies (KubeStellar specific)
-            cmd = [
-                "kubectl",
-                "get",
-                "bindingpolicies",
-                "--context",
-                cluster["context"],
-                "-o",
-                "json",
-            ]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
-
-            result = await self._run_command(cmd)
-            if result["returncode"] == 0:
-                policy_data = json.loads(result["stdout"])
-                for item in policy_data.get("items", []):
-                    policies.append(
-                        {
-                            "name": item["metadata"]["name"],
-                            "namespace": item["metadata"].get("namespace", ""),
-                            "cluster": cluster["name"],
-                            "spec": item.get("spec", {}),
-                            "status": item.get("status", {}),
-                            "created": item["metadata"]["creationTimestamp"],
-                        }
-                    )
-
-            return policies
-
-        except Exception:
-            return []
+        """Get binding policies from a cluster; an unreachable one has none."""
+        objects = await self._get_kubestellar_objects(cluster, kubeconfig, details)
+        return objects.get("bindingpolicies", [])
 
     async def _aggregate_work_statuses(
-        self, clusters: List[Dict[str, Any]], kubeconfig: str
+        self, clusters: List[Dict[str, Any]], kubeconfig: str, details: bool = True
     ) -> Dict[str, Any]:
         """Aggregate work status information across clusters."""
         try:
@@ -888,8 +1289,17 @@ class KubeStellarManagementFunction(BaseFunction):
                 "status_details": [],
             }
 
-            for cluster in clusters:
-                cluster_statuses = await self._get_work_statuses(cluster, kubeconfig)
+            # Query every cluster concurrently; a failed cluster counts as empty
+            results = await asyncio.gather(
+                *(
+                    self._get_work_statuses(cluster, kubeconfig, details)
+                    for cluster in clusters
+                ),
+                return_exceptions=True,
+            )
+            for cluster, cluster_statuses in zip(clusters, results):
+                if isinstance(cluster_statuses, Exception):
+                    cluster_statuses = []
                 statuses["statuses_by_cluster"][cluster["name"]] = len(cluster_statuses)
                 statuses["total_work_statuses"] += len(cluster_statuses)
                 statuses["status_details"].extend(cluster_statuses)
@@ -900,43 +1310,131 @@ class KubeStellarManagementFunction(BaseFunction):
             return {"error": "Failed to aggregate work statuses"}
 
     async def _get_work_statuses(
-        self, cluster: Dict[str, Any], kubeconfig: str
+        self, cluster: Dict[str, Any], kubeconfig: str, details: bool = True
     ) -> List[Dict[str, Any]]:
-        """Get work statuses from a cluster."""
-        try:
-            statuses = []
+        """Get work statuses from a cluster; an unreachable one has none."""
+        objects = await self._get_kubestellar_objects(cluster, kubeconfig, details)
+        return objects.get("workstatuses", [])
 
-            cmd = [
-                "kubectl",
-                "get",
-                "workstatuses",
-                "--context",
+    async def _get_kubestellar_objects(
+        self, cluster: Dict[str, Any], kubeconfig: str, details: bool
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get a cluster's binding policies and work statuses, by resource.
+
+        Both come from one cached, coalesced listing, so the two aggregators
+        share a single kubectl get per cluster.
+        """
+        return await self._cached_listing(
+            (
+                "kubestellar-objects",
+                cluster["name"],
                 cluster["context"],
+                kubeconfig,
+                str(details),
+            ),
+            lambda: self._fetch_objects(cluster, kubeconfig, details),
+        )
+
+    async def _fetch_objects(
+        self, cluster: Dict[str, Any], kubeconfig: str, details: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """List the KubeStellar objects of a cluster with one kubectl get.
+
+        kubectl prints one line per object, parsed as it arrives, so the
+        full listing is never held as one document. Without details only
+        name, namespace and creation time are requested; spec and status
+        are left out of both the output and the entries. Resource types the
+        cluster does not serve are dropped and the call retried; any other
+        failure falls back to one call per type. Raises RuntimeError if
+        nothing could be listed.
+        """
+        jsonpath = _OBJECT_LINE_JSONPATH if details else _OBJECT_SUMMARY_LINE_JSONPATH
+        field_count = 6 if details else 4
+        cluster_name = cluster["name"]
+
+        def summary_entry(fields: List[str]) -> Tuple[str, Dict[str, Any]]:
+            kind, name, namespace, created = fields
+            return kind, {
+                "name": name,
+                "namespace": namespace,
+                "cluster": cluster_name,
+                "created": created,
+            }
+
+        def detailed_entry(fields: List[str]) -> Tuple[str, Dict[str, Any]]:
+            kind, name, namespace, created, spec, status = fields
+            return kind, {
+                "name": name,
+                "namespace": namespace,
+                "cluster": cluster_name,
+                "spec": _json_object(spec),
+                "status": _json_object(status),
+                "created": created,
+            }
+
+        # Chosen once, so the per-line work is a split and one dict literal
+        to_entry = detailed_entry if details else summary_entry
+
+        async def list_objects(
+            resources: List[str],
+        ) -> List[Tuple[str, Dict[str, Any]]]:
+            cmd = _kubectl(
+                cluster["context"],
+                kubeconfig,
+                "get",
+                ",".join(resources),
                 "-o",
-                "json",
+                f"jsonpath={jsonpath}",
+            )
+            # A line carries a whole object's spec and status
+            lines = self._run_command_stream(
+                cmd, limit=1 << 24, slots=self._get_command_slots()
+            )
+            rows = (line.split("\t") async for line in lines)
+            return [
+                to_entry(fields) async for fields in rows if len(fields) == field_count
             ]
-            if kubeconfig:
-                cmd.extend(["--kubeconfig", kubeconfig])
 
-            result = await self._run_command(cmd)
-            if result["returncode"] == 0:
-                status_data = json.loads(result["stdout"])
-                for item in status_data.get("items", []):
-                    statuses.append(
-                        {
-                            "name": item["metadata"]["name"],
-                            "namespace": item["metadata"].get("namespace", ""),
-                            "cluster": cluster["name"],
-                            "spec": item.get("spec", {}),
-                            "status": item.get("status", {}),
-                            "created": item["metadata"]["creationTimestamp"],
-                        }
-                    )
+        objects: Dict[str, List[Dict[str, Any]]] = {
+            resource: [] for resource in _KUBESTELLAR_OBJECT_RESOURCES.values()
+        }
 
-            return statuses
+        def bucket(entries: List[Tuple[str, Dict[str, Any]]]) -> None:
+            for kind, entry in entries:
+                resource = _KUBESTELLAR_OBJECT_RESOURCES.get(kind)
+                if resource is not None:
+                    objects[resource].append(entry)
+
+        pending = list(objects)
+        while pending:
+            try:
+                bucket(await list_objects(pending))
+                return objects
+            except RuntimeError as e:
+                unknown = set(_UNKNOWN_RESOURCE_TYPE_RE.findall(str(e))).intersection(
+                    pending
+                )
+                if unknown:
+                    pending = [r for r in pending if r not in unknown]
+                    continue
+                if len(pending) == 1:
+                    raise
+
+                # Some type failed for another reason (e.g. forbidden); list
+                # the types one by one so the others still report
+                results = await asyncio.gather(
+                    *(list_objects([resource]) for resource in pending),
+                    return_exceptions=True,
+                )
+                failures = [r for r in results if isinstance(r, Exception)]
+                if len(failures) == len(results):
+                    raise failures[0]
+                for result in results:
+                    if not isinstance(result, Exception):
+                        bucket(result)
+                return objects
 
-        except Exception:
-            return []
+        return objects
 
     def _analyze_resource_placement(
         self, cluster_results: Dict[str, Any]
@@ -955,29 +1453,36 @@ class KubeStellarManagementFunction(BaseFunction):
             if cluster_result.get("status") != "success":
                 continue
 
-            for resource_type, resources in cluster_result.get(
+            for resource_type, count in cluster_result.get(
                 "resources_by_type", {}
             ).items():
-                if resource_type not in resource_distribution:
-                    resource_distribution[resource_type] = {}
-                resource_distribution[resource_type][cluster_name] = len(resources)
+                resource_distribution.setdefault(resource_type, {})[cluster_name] = (
+                    count
+                )
 
         placement_analysis["distribution_patterns"] = resource_distribution
 
-        # Generate placement recommendations
+        # Generate placement recommendations, as data for the caller to render
         recommendations = []
         for resource_type, distribution in resource_distribution.items():
-            total_resources = sum(distribution.values())
             cluster_count = len(distribution)
+            if cluster_count < 2:
+                continue
 
-            if cluster_count > 1:
-                avg_per_cluster = total_resources / cluster_count
-                for cluster, count in distribution.items():
-                    if count > avg_per_cluster * 1.5:
-                        recommendations.append(
-                            f"Consider redistributing {resource_type} from {cluster} "
-                            f"(has {count}, average is {avg_per_cluster:.1f})"
-                        )
+            avg_per_cluster = sum(distribution.values()) / cluster_count
+            threshold = avg_per_cluster * 1.5
+            average = round(avg_per_cluster, 1)
+            recommendations.extend(
+                {
+                    "action": "redistribute",
+                    "resource_type": resource_type,
+                    "from_cluster": cluster,
+                    "count": count,
+                    "average": average,
+                }
+                for cluster, count in distribution.items()
+                if count > threshold
+            )
 
         placement_analysis["recommendations"] = recommendations
 
@@ -991,30 +1496,29 @@ class KubeStellarManagementFunction(BaseFunction):
             "orphaned_resources": [],
         }
 
-        # Analyze cross-cluster references
-        all_resources = {}
+        # Scan each resource's annotations and labels for KubeStellar
+        # dependency markers; keys are only built for resources that match
+        relationships = dependency_map["resource_relationships"]
         for cluster_name, cluster_result in cluster_results.items():
             if cluster_result.get("status") != "success":
                 continue
 
             for namespace, resources in cluster_result.get("namespaces", {}).items():
                 for resource in resources:
-                    resource_key = f"{cluster_name}/{namespace}/{resource['kind']}/{resource['name']}"
-                    all_resources[resource_key] = resource
-
-        # Find potential dependencies based on annotations and labels
-        for resource_key, resource in all_resources.items():
-            annotations = resource.get("annotations", {})
-            labels = resource.get("labels", {})
-
-            # Look for KubeStellar-specific dependency markers
-            for key, value in {**annotations, **labels}.items():
-                if "kubestellar" in key.lower() or "binding" in key.lower():
-                    if resource_key not in dependency_map["resource_relationships"]:
-                        dependency_map["resource_relationships"][resource_key] = []
-                    dependency_map["resource_relationships"][resource_key].append(
+                    references = [
                         {"type": "kubestellar_managed", "reference": f"{key}={value}"}
-                    )
+                        for key, value in chain(
+                            resource.get("annotations", {}).items(),
+                            resource.get("labels", {}).items(),
+                        )
+                        if _DEPENDENCY_MARKER_RE.search(key)
+                    ]
+                    if references:
+                        resource_key = (
+                            f"{cluster_name}/{namespace}/"
+                            f"{resource['kind']}/{resource['name']}"
+                        )
+                        relationships[resource_key] = references
 
         return dependency_map
 
@@ -1060,18 +1564,31 @@ class KubeStellarManagementFunction(BaseFunction):
                 "inventory": {},
             }
 
-            for cluster in clusters:
-                cluster_inventory = await self._deep_search_cluster(
-                    cluster,
-                    resource_types or ["pods", "services", "deployments"],
-                    namespace_names,
-                    all_namespaces,
-                    "",
-                    "",
-                    False,
-                    False,
-                    kubeconfig,
-                )
+            # Inventory every cluster concurrently, keeping cluster order
+            results = await asyncio.gather(
+                *(
+                    self._deep_search_cluster(
+                        cluster,
+                        resource_types or ["pods", "services", "deployments"],
+                        namespace_names,
+                        all_namespaces,
+                        "",
+                        "",
+                        False,
+                        False,
+                        kubeconfig,
+                    )
+                    for cluster in clusters
+                ),
+                return_exceptions=True,
+            )
+            for cluster, cluster_inventory in zip(clusters, results):
+                if isinstance(cluster_inventory, Exception):
+                    cluster_inventory = {
+                        "cluster": cluster["name"],
+                        "status": "error",
+                        "error": str(cluster_inventory),
+                    }
                 inventory["inventory"][cluster["name"]] = cluster_inventory
 
             return inventory
@@ -1097,22 +1614,19 @@ class KubeStellarManagementFunction(BaseFunction):
                 "cluster_relationships": {},
             }
 
+            buckets = {
+                cluster_type: topology[key]
+                for cluster_type, key in _TOPOLOGY_BUCKETS.items()
+            }
+            standard_clusters = topology["standard_clusters"]
             for cluster in clusters:
-                cluster_type = cluster.get("type", "unknown")
-                cluster_info = {
-                    "name": cluster["name"],
-                    "context": cluster["context"],
-                    "kubestellar_info": cluster.get("kubestellar_info", {}),
-                }
-
-                if cluster_type == "control_plane":
-                    topology["control_planes"].append(cluster_info)
-                elif cluster_type == "wec":
-                    topology["wec_clusters"].append(cluster_info)
-                elif cluster_type == "wds":
-                    topology["wds_clusters"].append(cluster_info)
-                else:
-                    topology["standard_clusters"].append(cluster_info)
+                buckets.get(cluster.get("type", "unknown"), standard_clusters).append(
+                    {
+                        "name": cluster["name"],
+                        "context": cluster["context"],
+                        "kubestellar_info": cluster.get("kubestellar_info", {}),
+                    }
+                )
 
             return topology
 
@@ -1122,106 +1636,84 @@ class KubeStellarManagementFunction(BaseFunction):
                 "error": f"Failed to create topology map: {str(e)}",
             }
 
-    async def _run_command(self, cmd: List[str]) -> Dict[str, Any]:
-        """Run a shell command asynchronously."""
+    async def _run_command(self, cmd: List[str], decode: bool = True) -> Dict[str, Any]:
+        """Run a shell command asynchronously.
+
+        With decode=False stdout is returned as bytes, which json.loads
+        accepts directly. At most _max_concurrent_commands() commands run at
+        once.
+        """
+        async with self._get_command_slots():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await process.communicate()
+
+                return {
+                    "returncode": process.returncode,
+                    "stdout": stdout.decode() if decode else stdout,
+                    "stderr": stderr.decode(errors="replace"),
+                }
+            except Exception as e:
+                return {
+                    "returncode": 1,
+                    "stdout": "" if decode else b"",
+                    "stderr": str(e),
+                }
+
+    async def _cached_listing(
+        self,
+        key: Tuple[str, ...],
+        fetch: Callable[[], Awaitable[Dict[str, List[Dict[str, Any]]]]],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Return listings fetched within the last _listing_ttl seconds.
+
+        Misses are coalesced with concurrent callers. Failed fetches are
+        not cached and yield no listings.
+        """
+        cached = self._listing_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self._listing_ttl:
+            return {resource: list(items) for resource, items in cached[1].items()}
+
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            objects = await self._coalesce(key, fetch)
+        except Exception:
+            return {}
+        self._listing_cache[key] = (time.monotonic(), objects)
+        return {resource: list(items) for resource, items in objects.items()}
 
-            return {
-                "returncode": process.returncode,
-                "stdout": stdout.decode(),
-                "stderr": stderr.decode(),
-            }
-        except Exception as e:
-            return {"returncode": 1, "stdout": "", "stderr": str(e)}
+    async def _coalesce(
+        self,
+        key: Tuple[str, ...],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run fetch() once for all concurrent callers passing the same key.
+
+        The shared task is shielded so that one caller being cancelled does
+        not cancel it for the others. The result is shared and must not be
+        mutated.
+        """
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def forget(done: asyncio.Future) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    def _get_command_slots(self) -> asyncio.Semaphore:
+        """Return the command semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._command_slots is None or self._command_slots_loop is not loop:
+            self._command_slots = asyncio.Semaphore(_max_concurrent_commands())
+            self._command_slots_loop = loop
+        return self._command_slots
 
     def get_schema(self) -> Dict[str, Any]:
         """Define the JSON schema for function parameters."""
-        return {
-            "type": "object",
-            "properties": {
-                "operation": {
-                    "type": "string",
-                    "description": "Operation type to perform",
-                    "enum": [
-                        "deep_search",
-                        "policy_analysis",
-                        "resource_inventory",
-                        "topology_map",
-                    ],
-                    "default": "deep_search",
-                },
-                "resource_types": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Specific resource types to search for (pods, services, deployments, workstatuses, etc.)",
-                },
-                "namespace_names": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Specific namespace names to analyze",
-                },
-                "all_namespaces": {
-                    "type": "boolean",
-                    "description": "Include all namespaces in search",
-                    "default": True,
-                },
-                "cluster_names": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Specific cluster names to analyze",
-                },
-                "all_clusters": {
-                    "type": "boolean",
-                    "description": "Include all clusters in analysis",
-                    "default": True,
-                },
-                "label_selector": {
-                    "type": "string",
-                    "description": "Label selector for resource filtering (e.g., 'app=nginx')",
-                },
-                "field_selector": {
-                    "type": "string",
-                    "description": "Field selector for resource filtering (e.g., 'status.phase=Running')",
-                },
-                "binding_policies": {
-                    "type": "boolean",
-                    "description": "Include binding policy analysis",
-                    "default": True,
-                },
-                "work_statuses": {
-                    "type": "boolean",
-                    "description": "Include work status tracking",
-                    "default": True,
-                },
-                "placement_analysis": {
-                    "type": "boolean",
-                    "description": "Analyze resource placement strategies",
-                    "default": True,
-                },
-                "deep_analysis": {
-                    "type": "boolean",
-                    "description": "Perform deep dependency and relationship analysis",
-                    "default": True,
-                },
-                "include_wds": {
-                    "type": "boolean",
-                    "description": "Include WDS clusters in analysis",
-                    "default": False,
-                },
-                "kubeconfig": {
-                    "type": "string",
-                    "description": "Path to kubeconfig file",
-                },
-                "output_format": {
-                    "type": "string",
-                    "description": "Output format for results",
-                    "enum": ["comprehensive", "summary", "detailed", "json"],
-                    "default": "comprehensive",
-                },
-            },
-            "required": [],
-        }
+        return _PARAMETERS_SCHEMA
@@ -1,10 +1,17 @@
 """Tests for base functions and registry."""
 
+import asyncio
+import sys
 from typing import Any, Dict
 
 import pytest
 
-from src.shared.base_functions import BaseFunction, FunctionRegistry, async_to_sync
+from src.shared.base_functions import (
+    BaseFunction,
+    FunctionRegistry,
+    async_to_sync,
+    install_uvloop,
+)
 
 
 class MockFunction(BaseFunction):
@@ -168,3 +175,44 @@ def test_function_registry_overwrite():
     # Verify it's the new function
     result = async_to_sync(registry.get("mock_function").execute)()
     assert result == {"result": "different"}
+
+
+def test_install_uvloop_without_uvloop(monkeypatch):
+    """Test that the default event loop is kept when uvloop is missing."""
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert install_uvloop() is False
+
+
+@pytest.mark.asyncio
+async def test_run_command_stream():
+    """Test streaming stdout lines and reporting a failed exit."""
+    func = MockFunction()
+    lines = [
+        line
+        async for line in func._run_command_stream(
+            [sys.executable, "-c", "print('a'); print('b')"]
+        )
+    ]
+    assert lines == ["a", "b"]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in func._run_command_stream(
+            [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(2)"]
+        ):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_run_command_stream_holds_slot():
+    """Test streamed commands hold the given slot until they exit."""
+    func = MockFunction()
+    slots = asyncio.Semaphore(1)
+    lines = []
+    async for line in func._run_command_stream(
+        [sys.executable, "-c", "print('a'); print('b')"], slots=slots
+    ):
+        assert slots.locked()
+        lines.append(line)
+
+    assert lines == ["a", "b"]
+    assert not slots.locked()
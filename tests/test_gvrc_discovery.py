@@ -1,5 +1,6 @@
 """Tests for GVRC discovery functionality."""
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -7,6 +8,16 @@ import pytest
 from src.shared.functions.gvrc_discovery import GVRCDiscoveryFunction
 
 
+def stream_lines(output):
+    """Build a _run_command_stream replacement that yields the given output."""
+
+    async def _stream(cmd):
+        for line in output.splitlines():
+            yield line
+
+    return _stream
+
+
 @pytest.fixture
 def gvrc_function():
     """Create a GVRC discovery function instance."""
@@ -101,9 +112,9 @@ pods                              po           v1
 services                          svc          v1                                true         Service                          all
 deployments                       deploy       apps/v1                           true         Deployment                       all"""
 
-        mock_result = {"returncode": 0, "stdout": mock_kubectl_output, "stderr": ""}
-
-        with patch.object(gvrc_function, "_run_command", return_value=mock_result):
+        with patch.object(
+            gvrc_function, "_run_command_stream", stream_lines(mock_kubectl_output)
+        ):
             resources = await gvrc_function._get_api_resources(
                 mock_clusters[0], "", None, ""
             )
@@ -118,26 +129,46 @@ deployments                       deploy       apps/v1
     @pytest.mark.asyncio
     async def test_get_namespaces(self, gvrc_function, mock_clusters):
         """Test namespace discovery."""
-        mock_kubectl_output = """NAME              STATUS   AGE
-default           Active   10d
-kube-system       Active   10d
-kube-public       Active   10d"""
+        mock_kubectl_output = json.dumps(
+            {
+                "items": [
+                    {
+                        "metadata": {
+                            "name": "default",
+                            "labels": {"kubernetes.io/metadata.name": "default"},
+                        },
+                        "status": {"phase": "Active"},
+                    },
+                    {
+                        "metadata": {
+                            "name": "kube-system",
+                            "annotations": {"owner": "platform"},
+                        },
+                        "status": {"phase": "Active"},
+                    },
+                    {
+                        "metadata": {"name": "kube-public"},
+                        "status": {"phase": "Terminating"},
+                    },
+                ]
+            }
+        )
 
         mock_result = {"returncode": 0, "stdout": mock_kubectl_output, "stderr": ""}
 
-        with patch.object(gvrc_function, "_run_command", return_value=mock_result):
-            with patch.object(
-                gvrc_function,
-                "_get_namespace_details",
-                return_value={"labels": {}, "annotations": {}},
-            ):
-                namespaces = await gvrc_function._get_namespaces(
-                    mock_clusters[0], "", ""
-                )
-
-                assert len(namespaces) == 3
-                assert namespaces[0]["name"] == "default"
-                assert namespaces[0]["status"] == "Active"
+        with patch.object(
+            gvrc_function, "_run_command", return_value=mock_result
+        ) as mock_run:
+            namespaces = await gvrc_function._get_namespaces(mock_clusters[0], "", "")
+
+            # Labels and annotations come from the same list call
+            assert mock_run.call_count == 1
+            assert len(namespaces) == 3
+            assert namespaces[0]["name"] == "default"
+            assert namespaces[0]["status"] == "Active"
+            assert namespaces[0]["labels"] == {"kubernetes.io/metadata.name": "default"}
+            assert namespaces[1]["annotations"] == {"owner": "platform"}
+            assert namespaces[2]["status"] == "Terminating"
 
     def test_create_summary(self, gvrc_function):
         """Test summary creation."""
@@ -179,9 +210,9 @@ pods                              po           v1
 services                          svc          v1                                true         Service                          all
 deployments                       deploy       apps/v1                           true         Deployment                       all"""
 
-        mock_result = {"returncode": 0, "stdout": mock_kubectl_output, "stderr": ""}
-
-        with patch.object(gvrc_function, "_run_command", return_value=mock_result):
+        with patch.object(
+            gvrc_function, "_run_command_stream", stream_lines(mock_kubectl_output)
+        ):
             # Test with resource filter
             resources = await gvrc_function._get_api_resources(
                 mock_clusters[0], "pod", None, ""
@@ -197,6 +228,23 @@ deployments                       deploy       apps/v1
 
             assert len(resources) == 3  # All resources have 'all' category
 
+    @pytest.mark.asyncio
+    async def test_get_api_resources_command_failure(
+        self, gvrc_function, mock_clusters
+    ):
+        """Test that a failing api-resources call yields no resources."""
+
+        async def failing_stream(cmd):
+            raise RuntimeError("connection refused")
+            yield  # pragma: no cover
+
+        with patch.object(gvrc_function, "_run_command_stream", failing_stream):
+            resources = await gvrc_function._get_api_resources(
+                mock_clusters[0], "", None, ""
+            )
+
+            assert resources == []
+
     @pytest.mark.asyncio
     async def test_discover_clusters_filters_wds(self, gvrc_function):
         """Test that WDS clusters are filtered out."""
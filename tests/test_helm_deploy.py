@@ -1,11 +1,25 @@
 """Tests for Helm deployment function."""
 
 import json
-from unittest.mock import AsyncMock, patch
+import os
+import sys
+from unittest.mock import patch
 
 import pytest
 
-from src.shared.functions.helm_deploy import HelmDeployFunction
+from src.shared.functions.helm_deploy import HelmDeployFunction, _max_procs
+
+
+def stream_lines(output, error=None):
+    """Build a _run_command_stream replacement that yields the given output."""
+
+    async def _stream(cmd, **kwargs):
+        for line in output.splitlines():
+            yield line
+        if error:
+            raise RuntimeError(error)
+
+    return _stream
 
 
 @pytest.fixture
@@ -114,6 +128,16 @@ class TestHelmDeployFunction:
 
         assert labels == expected_labels
 
+    def test_prepare_kubestellar_labels_keeps_order_and_coerces(self, helm_function):
+        """Test extra labels keep their order and non-string values become strings."""
+        labels = helm_function._prepare_kubestellar_labels(
+            "myapp", "", {"zone": "b", "tier": 2, "canary": ["x"]}
+        )
+
+        assert list(labels)[-3:] == ["zone", "tier", "canary"]
+        assert labels["tier"] == "2"
+        assert labels["canary"] == "['x']"
+
     def test_prepare_kubestellar_labels_no_chart(self, helm_function):
         """Test KubeStellar label preparation without chart name."""
         labels = helm_function._prepare_kubestellar_labels("myapp", "", None)
@@ -145,12 +169,14 @@ class TestHelmDeployFunction:
             "cluster1=image.tag=v1.0",
             "cluster1=replicas=3",
             "cluster2=image.tag=v2.0",
+            "cluster2=env.OPTS=a=b",
+            "cluster3=missing-value",
         ]
         result = helm_function._parse_cluster_set_values(cluster_set_values)
 
         expected = {
             "cluster1": ["image.tag=v1.0", "replicas=3"],
-            "cluster2": ["image.tag=v2.0"],
+            "cluster2": ["image.tag=v2.0", "env.OPTS=a=b"],
         }
 
         assert result == expected
@@ -165,6 +191,12 @@ class TestHelmDeployFunction:
         assert result[0]["name"] == "cluster1"
         assert result[1]["name"] == "edge-cluster1"
 
+        # Comma-separated entries are split and stripped
+        result = helm_function._filter_clusters(
+            mock_clusters, ["cluster1, edge-cluster1"], None
+        )
+        assert [c["name"] for c in result] == ["cluster1", "edge-cluster1"]
+
     def test_filter_clusters_by_labels(self, helm_function, mock_clusters):
         """Test filtering clusters by labels."""
         # This should return all clusters (mock implementation)
@@ -178,43 +210,122 @@ class TestHelmDeployFunction:
         assert helm_function._is_wds_cluster("my-wds-cluster") is True
         assert helm_function._is_wds_cluster("cluster_wds_test") is True
         assert helm_function._is_wds_cluster("regular-cluster") is False
+        assert helm_function._is_wds_cluster("WDS1") is True
+        assert helm_function._is_wds_cluster("cluster-wds_test") is False
+
+    def test_is_its_cluster(self, helm_function):
+        """Test ITS cluster detection."""
+        assert helm_function._is_its_cluster("its1") is True
+        assert helm_function._is_its_cluster("kind-its-hub") is True
+        assert helm_function._is_its_cluster("ITS_1") is True
+        assert helm_function._is_its_cluster("wds1") is False
+        assert helm_function._is_wec_cluster("cluster1") is True
 
     @pytest.mark.asyncio
     async def test_run_command_success(self, helm_function):
         """Test successful command execution."""
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 0
-            mock_process.communicate.return_value = (b"success output", b"")
-            mock_subprocess.return_value = mock_process
+        result = await helm_function._run_command(
+            [sys.executable, "-c", "print('success output', end='')"]
+        )
 
-            result = await helm_function._run_command(["echo", "test"])
+        assert result["returncode"] == 0
+        assert result["stdout"] == "success output"
+        assert result["stderr"] == ""
 
-            assert result["returncode"] == 0
-            assert result["stdout"] == "success output"
-            assert result["stderr"] == ""
+    @pytest.mark.asyncio
+    async def test_run_command_raw_stdout(self, helm_function):
+        """Test that decode=False returns stdout as bytes."""
+        result = await helm_function._run_command(
+            [sys.executable, "-c", "print('[1, 2]', end='')"], decode=False
+        )
+
+        assert result["returncode"] == 0
+        assert result["stdout"] == b"[1, 2]"
+        assert json.loads(result["stdout"]) == [1, 2]
 
     @pytest.mark.asyncio
     async def test_run_command_failure(self, helm_function):
         """Test failed command execution."""
-        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
-            # Mock process
-            mock_process = AsyncMock()
-            mock_process.returncode = 1
-            mock_process.communicate.return_value = (b"", b"error output")
-            mock_subprocess.return_value = mock_process
+        result = await helm_function._run_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stderr.write('error output'); sys.exit(1)",
+            ]
+        )
+
+        assert result["returncode"] == 1
+        assert result["stdout"] == ""
+        assert result["stderr"] == "error output"
+
+    @pytest.mark.asyncio
+    async def test_run_command_stderr_tail(self, helm_function):
+        """Test that only the tail of a large stderr stream is retained."""
+        result = await helm_function._run_command(
+            [
+                sys.executable,
+                "-c",
+                "import sys; sys.stderr.write('x' * 200000 + 'END'); print('ok')",
+            ]
+        )
+
+        assert result["returncode"] == 0
+        assert result["stdout"].strip() == "ok"
+        assert len(result["stderr"]) == 64 * 1024
+        assert result["stderr"].endswith("END")
+
+    @pytest.mark.asyncio
+    async def test_run_command_missing_binary(self, helm_function):
+        """Test that a missing executable is reported as a failed command."""
+        with patch(
+            "asyncio.create_subprocess_exec", side_effect=FileNotFoundError("helm")
+        ):
+            result = await helm_function._run_command(["helm", "version"])
+
+        assert result["returncode"] == 1
+        assert "helm" in result["stderr"]
+
+    def test_max_procs(self, monkeypatch):
+        """Test the subprocess limit default and HELM_MAX_PROCS override."""
+        monkeypatch.delenv("HELM_MAX_PROCS", raising=False)
+        assert _max_procs() >= 8
+
+        monkeypatch.setenv("HELM_MAX_PROCS", "3")
+        assert _max_procs() == 3
+
+        monkeypatch.setenv("HELM_MAX_PROCS", "not-a-number")
+        assert _max_procs() >= 8
+
+    def test_kubeconfig_mtime_with_empty_env(
+        self, helm_function, monkeypatch, tmp_path
+    ):
+        """Test an empty KUBECONFIG keys the cache on ~/.kube/config."""
+        config = tmp_path / ".kube" / "config"
+        config.parent.mkdir()
+        config.write_text("contexts: []\n")
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("KUBECONFIG", "")
 
-            result = await helm_function._run_command(["false"])
+        assert helm_function._kubeconfig_mtime("") == (config.stat().st_mtime,)
 
-            assert result["returncode"] == 1
-            assert result["stdout"] == ""
-            assert result["stderr"] == "error output"
+    @pytest.mark.asyncio
+    async def test_run_command_with_stdin(self, helm_function):
+        """Test that stdin text is piped to the process."""
+        result = await helm_function._run_command(
+            [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+            stdin="piped input",
+        )
+
+        assert result["returncode"] == 0
+        assert result["stdout"].strip() == "PIPED INPUT"
 
     @pytest.mark.asyncio
     async def test_discover_clusters(self, helm_function):
         """Test cluster discovery."""
-        with patch.object(helm_function, "_run_command") as mock_run:
+        with (
+            patch.object(helm_function, "_read_context_names", return_value=None),
+            patch.object(helm_function, "_run_command") as mock_run,
+        ):
             # Mock kubectl config get-contexts
             mock_run.side_effect = [
                 {
@@ -245,6 +356,63 @@ class TestHelmDeployFunction:
             assert result[0]["name"] == "cluster1"
             assert result[1]["name"] == "cluster2"
 
+    @pytest.mark.asyncio
+    async def test_discover_clusters_reads_kubeconfig(self, helm_function, tmp_path):
+        """Test that context names come from the kubeconfig file itself."""
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text(
+            json.dumps(
+                {
+                    "contexts": [
+                        {"name": "cluster2", "context": {}},
+                        {"name": "wds1", "context": {}},
+                        {"name": "cluster1", "context": {}},
+                    ]
+                }
+            )
+        )
+
+        with patch.object(helm_function, "_run_command") as mock_run:
+            mock_run.return_value = {"returncode": 0, "stdout": "ok", "stderr": ""}
+            result = await helm_function._discover_clusters(str(kubeconfig), "")
+
+        # Only the readiness probes run; no kubectl config get-contexts
+        assert [c["name"] for c in result] == ["cluster1", "cluster2"]
+        assert mock_run.call_count == 2
+        for call in mock_run.call_args_list:
+            assert call[0][0][:3] == ["kubectl", "get", "--raw"]
+
+        # Merged KUBECONFIG lists are left to kubectl
+        assert (
+            helm_function._read_context_names(f"{kubeconfig}{os.pathsep}{kubeconfig}")
+            is None
+        )
+        assert helm_function._read_context_names(str(tmp_path / "missing")) is None
+
+    @pytest.mark.asyncio
+    async def test_discover_clusters_cached(self, helm_function, tmp_path):
+        """Test that discovery results are reused until the kubeconfig changes."""
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text("apiVersion: v1\n")
+        clusters = [{"name": "cluster1", "context": "cluster1", "status": "Ready"}]
+
+        with patch.object(
+            helm_function, "_discover_clusters", return_value=clusters
+        ) as mock_discover:
+            first = await helm_function._discover_clusters_cached(str(kubeconfig), "")
+            second = await helm_function._discover_clusters_cached(str(kubeconfig), "")
+
+            assert first == clusters
+            assert second == clusters
+            assert mock_discover.call_count == 1
+
+            # Editing the kubeconfig invalidates the cached entry
+            stat = kubeconfig.stat()
+            os.utime(kubeconfig, (stat.st_atime, stat.st_mtime + 10))
+            await helm_function._discover_clusters_cached(str(kubeconfig), "")
+
+            assert mock_discover.call_count == 2
+
     @pytest.mark.asyncio
     async def test_resolve_target_namespaces_specific(
         self, helm_function, mock_clusters
@@ -259,19 +427,33 @@ class TestHelmDeployFunction:
     @pytest.mark.asyncio
     async def test_resolve_target_namespaces_all(self, helm_function, mock_clusters):
         """Test resolving all namespaces."""
-        with patch.object(helm_function, "_run_command") as mock_run:
-            mock_run.return_value = {
-                "returncode": 0,
-                "stdout": "default kube-system app-namespace",
-                "stderr": "",
-            }
-
+        with patch.object(
+            helm_function,
+            "_run_command_stream",
+            stream_lines("default\nkube-system\napp-namespace\n"),
+        ):
             result = await helm_function._resolve_target_namespaces(
                 mock_clusters[0], True, "", None, "", ""
             )
 
             assert result == ["default", "kube-system", "app-namespace"]
 
+    @pytest.mark.asyncio
+    async def test_resolve_target_namespaces_list_failure(
+        self, helm_function, mock_clusters
+    ):
+        """Test that a failed namespace listing falls back to the namespace."""
+        with patch.object(
+            helm_function,
+            "_run_command_stream",
+            stream_lines("", error="forbidden"),
+        ):
+            result = await helm_function._resolve_target_namespaces(
+                mock_clusters[0], False, "team=a", None, "fallback", ""
+            )
+
+            assert result == ["fallback"]
+
     @pytest.mark.asyncio
     async def test_resolve_target_namespaces_default(
         self, helm_function, mock_clusters
@@ -283,11 +465,48 @@ class TestHelmDeployFunction:
 
         assert result == ["custom-ns"]
 
+    @pytest.mark.asyncio
+    async def test_build_helm_command_private_repository(self, helm_function):
+        """Test charts from a temporary repository resolve through its config."""
+        cluster = {"name": "test-cluster", "context": "test-context"}
+        repo_args = [
+            "--repository-config",
+            "/tmp/r/repositories.yaml",
+            "--repository-cache",
+            "/tmp/r/cache",
+        ]
+
+        cmd = await helm_function._build_helm_command(
+            operation="install",
+            release_name="myapp",
+            chart_name="nginx",
+            chart_version="",
+            repository_url="",
+            repository_name="tmp",
+            chart_path="",
+            cluster=cluster,
+            namespace="default",
+            values_file="",
+            values_files=None,
+            cluster_values_map={},
+            set_values=None,
+            cluster_set_values_map={},
+            wait=False,
+            timeout="",
+            atomic=False,
+            kubeconfig="",
+            label_args=[],
+            repo_args=repo_args,
+        )
+
+        assert cmd[:4] == ["helm", "install", "myapp", "tmp/nginx"]
+        assert cmd[4:8] == repo_args
+
     @pytest.mark.asyncio
     async def test_build_helm_command_install(self, helm_function):
         """Test building Helm install command."""
         cluster = {"name": "test-cluster", "context": "test-context"}
-        labels = {"app.kubernetes.io/managed-by": "Helm"}
+        label_args = ["--set-json", 'labels={"app.kubernetes.io/managed-by": "Helm"}']
 
         cmd = await helm_function._build_helm_command(
             operation="install",
@@ -308,7 +527,7 @@ class TestHelmDeployFunction:
             timeout="5m",
             atomic=False,
             kubeconfig="",
-            helm_labels=labels,
+            label_args=label_args,
         )
 
         expected_cmd = [
@@ -324,11 +543,13 @@ class TestHelmDeployFunction:
             "values.yaml",
             "--set",
             "replicas=3",
-            "--set",
-            "labels.app.kubernetes.io/managed-by=Helm",
+            "--set-json",
+            'labels={"app.kubernetes.io/managed-by": "Helm"}',
             "--wait",
             "--timeout",
             "5m",
+            "--output",
+            "json",
             "--kube-context",
             "test-context",
             "--namespace",
@@ -341,8 +562,6 @@ class TestHelmDeployFunction:
     async def test_build_helm_command_upgrade(self, helm_function):
         """Test building Helm upgrade command."""
         cluster = {"name": "test-cluster", "context": "test-context"}
-        labels = {}
-
         cmd = await helm_function._build_helm_command(
             operation="upgrade",
             release_name="myapp",
@@ -362,7 +581,7 @@ class TestHelmDeployFunction:
             timeout="5m",
             atomic=True,
             kubeconfig="/path/to/kubeconfig",
-            helm_labels=labels,
+            label_args=[],
         )
 
         expected_cmd = [
@@ -374,6 +593,8 @@ class TestHelmDeployFunction:
             "5m",
             "--atomic",
             "--install",
+            "--output",
+            "json",
             "--kube-context",
             "test-context",
             "--namespace",
@@ -388,8 +609,6 @@ class TestHelmDeployFunction:
     async def test_build_helm_command_uninstall(self, helm_function):
         """Test building Helm uninstall command."""
         cluster = {"name": "test-cluster", "context": "test-context"}
-        labels = {}
-
         cmd = await helm_function._build_helm_command(
             operation="uninstall",
             release_name="myapp",
@@ -409,7 +628,7 @@ class TestHelmDeployFunction:
             timeout="",
             atomic=False,
             kubeconfig="",
-            helm_labels=labels,
+            label_args=[],
         )
 
         expected_cmd = [
@@ -425,109 +644,103 @@ class TestHelmDeployFunction:
         assert cmd == expected_cmd
 
     @pytest.mark.asyncio
-    async def test_ensure_namespace_exists_already_exists(self, helm_function):
-        """Test ensuring namespace exists when it already exists."""
+    async def test_ensure_namespace_exists(self, helm_function):
+        """Test ensuring namespace exists with a single idempotent apply."""
         cluster = {"name": "test-cluster", "context": "test-context"}
-        labels = {"key": "value"}
+        labels = {"key": "value", "other": "label"}
 
         with patch.object(helm_function, "_run_command") as mock_run:
-            # Namespace exists
-            mock_run.side_effect = [
-                {"returncode": 0, "stdout": "", "stderr": ""},  # namespace exists
-                {"returncode": 0, "stdout": "", "stderr": ""},  # label command
-            ]
+            mock_run.return_value = {
+                "returncode": 0,
+                "stdout": "namespace/test-ns configured",
+                "stderr": "",
+            }
 
             await helm_function._ensure_namespace_exists(cluster, "test-ns", "", labels)
 
-            # Should call get namespace and label commands
-            assert mock_run.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_ensure_namespace_exists_create_new(self, helm_function):
-        """Test ensuring namespace exists when it needs to be created."""
-        cluster = {"name": "test-cluster", "context": "test-context"}
-        labels = {"key": "value"}
-
-        with patch.object(helm_function, "_run_command") as mock_run:
-            # Namespace doesn't exist, then create it, then label it
-            mock_run.side_effect = [
-                {
-                    "returncode": 1,
-                    "stdout": "",
-                    "stderr": "not found",
-                },  # namespace doesn't exist
-                {"returncode": 0, "stdout": "", "stderr": ""},  # create namespace
-                {"returncode": 0, "stdout": "", "stderr": ""},  # label command
-            ]
-
-            await helm_function._ensure_namespace_exists(cluster, "test-ns", "", labels)
+            # Create and label happen in one kubectl apply fed on stdin
+            assert mock_run.call_count == 1
+            cmd = mock_run.call_args[0][0]
+            assert cmd[:4] == ["kubectl", "apply", "-f", "-"]
+            assert "test-context" in cmd
 
-            # Should call get, create, and label commands
-            assert mock_run.call_count == 3
+            manifest = json.loads(mock_run.call_args[1]["stdin"])
+            assert manifest["kind"] == "Namespace"
+            assert manifest["metadata"]["name"] == "test-ns"
+            assert manifest["metadata"]["labels"] == labels
 
     @pytest.mark.asyncio
     async def test_label_helm_secret(self, helm_function):
         """Test labeling Helm secret."""
         cluster = {"name": "test-cluster", "context": "test-context"}
-        labels = {"key": "value"}
+        labels = {"key": "value", "other": "label"}
 
         with patch.object(helm_function, "_run_command") as mock_run:
-            # Mock getting secret name and labeling it
-            mock_run.side_effect = [
-                {
-                    "returncode": 0,
-                    "stdout": "sh.helm.release.v1.myapp.v1",
-                    "stderr": "",
-                },  # get secret
-                {"returncode": 0, "stdout": "", "stderr": ""},  # label secret
-            ]
+            mock_run.return_value = {
+                "returncode": 0,
+                "stdout": "secret/sh.helm.release.v1.myapp.v1 labeled",
+                "stderr": "",
+            }
 
             await helm_function._label_helm_secret(
                 cluster, "default", "myapp", labels, ""
             )
 
-            assert mock_run.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_parse_helm_output(self, helm_function):
-        """Test parsing Helm command output."""
-        cluster = {"name": "test-cluster", "context": "test-context"}
-
-        with patch.object(helm_function, "_run_command") as mock_run:
-            # Mock helm status output
-            status_data = {
-                "name": "myapp",
-                "version": 1,
-                "info": {"status": "deployed"},
-                "chart": {
-                    "metadata": {
-                        "name": "nginx",
-                        "version": "1.0.0",
-                        "appVersion": "1.21.0",
-                    }
+            # Secrets are selected and labelled in a single kubectl call
+            assert mock_run.call_count == 1
+            label_cmd = mock_run.call_args[0][0]
+            assert label_cmd[:5] == [
+                "kubectl",
+                "label",
+                "secrets",
+                "-l",
+                "name=myapp,owner=helm",
+            ]
+            assert "key=value" in label_cmd
+            assert "other=label" in label_cmd
+
+    def test_parse_helm_output(self, helm_function):
+        """Test parsing Helm --output json from install/upgrade."""
+        status_data = {
+            "name": "myapp",
+            "version": 1,
+            "info": {"status": "deployed", "notes": "Visit http://myapp"},
+            "chart": {
+                "metadata": {
+                    "name": "nginx",
+                    "version": "1.0.0",
+                    "appVersion": "1.21.0",
                 },
-            }
+                "templates": [{"name": "templates/deployment.yaml", "data": "..."}],
+            },
+            "manifest": "---\nkind: Deployment\n",
+        }
 
-            mock_run.return_value = {
-                "returncode": 0,
-                "stdout": json.dumps(status_data),
-                "stderr": "",
-            }
+        result = helm_function._parse_helm_output(
+            json.dumps(status_data), "install", "myapp"
+        )
 
-            result = await helm_function._parse_helm_output(
-                "install output", "install", "myapp", cluster, "default", ""
-            )
+        expected = {
+            "release_name": "myapp",
+            "revision": 1,
+            "status": "deployed",
+            "chart_name": "nginx",
+            "chart_version": "1.0.0",
+            "app_version": "1.21.0",
+            "notes": "Visit http://myapp",
+        }
 
-            expected = {
-                "release_name": "myapp",
-                "revision": 1,
-                "status": "deployed",
-                "chart_name": "nginx",
-                "chart_version": "1.0.0",
-                "app_version": "1.21.0",
-            }
+        assert result == expected
 
-            assert result == expected
+    def test_parse_helm_output_not_json(self, helm_function):
+        """Test fallback when helm output is not JSON."""
+        result = helm_function._parse_helm_output("install output", "upgrade", "myapp")
+
+        assert result == {
+            "release_name": "myapp",
+            "revision": "unknown",
+            "status": "deployed",
+        }
 
     @pytest.mark.asyncio
     async def test_create_binding_policy(self, helm_function):
@@ -560,6 +773,295 @@ class TestHelmDeployFunction:
             assert result["policy_name"] == "myapp-helm-policy"
             assert "clusterSelectors" in str(result["policy_spec"])
 
+            # The manifest is applied from stdin rather than a temporary file
+            cmd = mock_run.call_args[0][0]
+            assert cmd[:4] == ["kubectl", "apply", "-f", "-"]
+            assert cmd[cmd.index("--context") + 1] == "wds-context"
+            policy = json.loads(mock_run.call_args[1]["stdin"])
+            assert policy["kind"] == "BindingPolicy"
+            assert policy["metadata"]["name"] == "myapp-helm-policy"
+
+            # Reserved Helm labels stay in the default selector only
+            object_selectors = policy["spec"]["downsync"][0]["objectSelectors"]
+            assert object_selectors[1] == {
+                "matchLabels": {"kubestellar.io/helm-chart": "nginx"}
+            }
+
+    @pytest.mark.asyncio
+    async def test_uninstall_helm_chart_parallel_clusters(
+        self, helm_function, mock_clusters
+    ):
+        """Test that clusters run concurrently and failures stay per-cluster."""
+
+        async def fake_run(cmd):
+            context = cmd[cmd.index("--kube-context") + 1]
+            if context == "cluster2":
+                raise RuntimeError("connection refused")
+            return {"returncode": 0, "stdout": "uninstalled", "stderr": ""}
+
+        with patch.object(helm_function, "_run_command", side_effect=fake_run):
+            result = await helm_function._uninstall_helm_chart(
+                mock_clusters, "myapp", ["default"], "", max_parallel_clusters=2
+            )
+
+        assert result["status"] == "success"
+        assert result["clusters_succeeded"] == 2
+        assert result["clusters_failed"] == 1
+        assert result["results"]["cluster1"]["status"] == "success"
+        assert result["results"]["cluster2"]["status"] == "error"
+        assert "connection refused" in result["results"]["cluster2"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_get_helm_info_status_uses_helm_list(self, helm_function):
+        """Test that status queries each cluster once via helm list."""
+        cluster = {"name": "cluster1", "context": "cluster1"}
+        releases = [
+            {
+                "name": "myapp",
+                "namespace": "default",
+                "revision": "2",
+                "updated": "2024-01-01 00:00:00",
+                "status": "deployed",
+                "chart": "nginx-1.0.0",
+                "app_version": "1.21.0",
+            },
+            {"name": "myapp-extra", "namespace": "apps", "status": "deployed"},
+        ]
+
+        with patch.object(helm_function, "_run_command") as mock_run:
+            mock_run.return_value = {
+                "returncode": 0,
+                "stdout": json.dumps(releases).encode(),
+                "stderr": "",
+            }
+
+            result = await helm_function._get_helm_info(
+                [cluster], "myapp", ["default", "apps"], "status", ""
+            )
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args[1]["decode"] is False
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:2] == ["helm", "list"]
+        assert "--all-namespaces" in cmd
+
+        namespace_results = result["results"]["cluster1"]["namespace_results"]
+        assert namespace_results["default"]["status"] == "success"
+        assert namespace_results["default"]["release_info"]["revision"] == "2"
+        assert namespace_results["default"]["release_info"]["chart"] == {
+            "name": "nginx",
+            "version": "1.0.0",
+            "appVersion": "1.21.0",
+        }
+        output = json.loads(namespace_results["default"]["output"])
+        assert output["info"]["status"] == "deployed"
+        assert namespace_results["apps"]["status"] == "error"
+        assert "release: not found" in namespace_results["apps"]["error"]
+        assert result["clusters_succeeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deploy_helm_chart_adds_repo_once(self, helm_function, mock_clusters):
+        """Test that a repository URL is registered once for many invocations."""
+        commands = []
+
+        async def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return {"returncode": 0, "stdout": "", "stderr": ""}
+
+        with (
+            patch.object(helm_function, "_run_command", side_effect=fake_run),
+            patch.object(
+                helm_function, "_deploy_to_cluster", return_value={"status": "success"}
+            ) as mock_deploy,
+        ):
+            result = await helm_function._deploy_helm_chart(
+                mock_clusters,
+                "nginx",
+                "",
+                "https://charts.bitnami.com/bitnami",
+                "",
+                "",
+                "myapp",
+                ["default"],
+                "",
+                None,
+                {},
+                None,
+                {},
+                False,
+                False,
+                "5m",
+                False,
+                "install",
+                "",
+                {},
+            )
+
+        assert result["clusters_succeeded"] == 3
+        assert len(commands) == 1
+        assert commands[0][:3] == ["helm", "repo", "add"]
+        repo_name = commands[0][3]
+        assert commands[0][4] == "https://charts.bitnami.com/bitnami"
+
+        # The repository lives in a private config, removed afterwards
+        repo_args = commands[0][5:]
+        assert repo_args[0] == "--repository-config"
+        assert repo_args[2] == "--repository-cache"
+        assert not os.path.exists(os.path.dirname(repo_args[1]))
+
+        # Every cluster installs from the added repository instead of --repo
+        for call in mock_deploy.call_args_list:
+            assert call[0][3] == ""
+            assert call[0][4] == repo_name
+            assert call[0][-1] == repo_args
+
+    @pytest.mark.asyncio
+    async def test_deploy_to_cluster_skips_labelled_namespaces(self, helm_function):
+        """Test that existing, already-labelled namespaces are not re-applied."""
+        cluster = {"name": "cluster1", "context": "cluster1"}
+        labels = {"kubestellar.io/helm-release": "myapp"}
+
+        with (
+            patch.object(
+                helm_function,
+                "_list_namespace_labels",
+                return_value={"ready": dict(labels), "stale": {}},
+            ),
+            patch.object(helm_function, "_ensure_namespace_exists") as mock_ensure,
+            patch.object(
+                helm_function,
+                "_run_command",
+                return_value={"returncode": 0, "stdout": "", "stderr": ""},
+            ),
+            patch.object(helm_function, "_label_helm_secret"),
+        ):
+            result = await helm_function._deploy_to_cluster(
+                cluster,
+                "nginx",
+                "",
+                "",
+                "bitnami",
+                "",
+                "myapp",
+                ["ready", "stale", "new"],
+                "",
+                None,
+                {},
+                None,
+                {},
+                True,
+                False,
+                "5m",
+                False,
+                "install",
+                "",
+                labels,
+                [],
+            )
+
+        assert result["namespaces_succeeded"] == 3
+        ensured = sorted(call[0][1] for call in mock_ensure.call_args_list)
+        assert ensured == ["new", "stale"]
+
+    @pytest.mark.asyncio
+    async def test_deploy_to_cluster_keeps_helm_output(self, helm_function):
+        """Test that output stays helm's stdout and notes are reported apart."""
+        cluster = {"name": "cluster1", "context": "cluster1"}
+        stdout = json.dumps(
+            {
+                "name": "myapp",
+                "version": 1,
+                "info": {"status": "deployed", "notes": "Visit http://myapp"},
+                "manifest": "---\nkind: Deployment\n",
+            }
+        )
+
+        with (
+            patch.object(
+                helm_function,
+                "_run_command",
+                return_value={"returncode": 0, "stdout": stdout, "stderr": ""},
+            ),
+            patch.object(helm_function, "_label_helm_secret"),
+        ):
+            result = await helm_function._deploy_to_cluster(
+                cluster,
+                "nginx",
+                "",
+                "",
+                "bitnami",
+                "",
+                "myapp",
+                ["default"],
+                "",
+                None,
+                {},
+                None,
+                {},
+                False,
+                False,
+                "5m",
+                False,
+                "install",
+                "",
+                {},
+                [],
+            )
+
+        namespace_result = result["namespace_results"]["default"]
+        assert namespace_result["output"] == stdout
+        assert namespace_result["notes"] == "Visit http://myapp"
+        assert namespace_result["helm_status"] == "deployed"
+
+    @pytest.mark.asyncio
+    async def test_deploy_to_cluster_parallel_namespaces(self, helm_function):
+        """Test that namespaces deploy concurrently and fail independently."""
+        cluster = {"name": "cluster1", "context": "cluster1"}
+
+        async def fake_run(cmd):
+            if cmd[cmd.index("--namespace") + 1] == "broken":
+                raise RuntimeError("helm crashed")
+            return {"returncode": 0, "stdout": "deployed", "stderr": ""}
+
+        with (
+            patch.object(helm_function, "_run_command", side_effect=fake_run),
+            patch.object(
+                helm_function,
+                "_parse_helm_output",
+                return_value={"release_name": "myapp", "status": "deployed"},
+            ),
+            patch.object(helm_function, "_label_helm_secret"),
+        ):
+            result = await helm_function._deploy_to_cluster(
+                cluster,
+                "nginx",
+                "",
+                "https://charts.bitnami.com/bitnami",
+                "",
+                "",
+                "myapp",
+                ["default", "broken"],
+                "",
+                None,
+                {},
+                None,
+                {},
+                False,
+                False,
+                "5m",
+                False,
+                "install",
+                "",
+                {},
+                [],
+            )
+
+        assert result["status"] == "success"
+        assert result["namespaces_succeeded"] == 1
+        assert result["namespace_results"]["default"]["status"] == "success"
+        assert result["namespace_results"]["broken"]["status"] == "error"
+        assert "helm crashed" in result["namespace_results"]["broken"]["error"]
+
     @pytest.mark.asyncio
     async def test_execute_dry_run(self, helm_function):
         """Test dry run execution."""
@@ -622,6 +1124,64 @@ class TestHelmDeployFunction:
         assert result["status"] == "error"
         assert "chart_name or chart_path must be specified" in result["error"]
 
+    @pytest.mark.asyncio
+    async def test_execute_unsupported_operation(self, helm_function):
+        """Test that unknown operations are rejected before cluster discovery."""
+        with patch.object(helm_function, "_discover_clusters") as mock_discover:
+            result = await helm_function.execute(
+                release_name="nginx", operation="rollback"
+            )
+
+            assert result["status"] == "error"
+            assert "Unsupported operation: rollback" in result["error"]
+            mock_discover.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_operation_exception(self, helm_function):
+        """Test that failures while running the operation are reported."""
+        with (
+            patch.object(
+                helm_function,
+                "_discover_clusters",
+                return_value=[{"name": "cluster1", "context": "cluster1"}],
+            ),
+            patch.object(
+                helm_function, "_resolve_target_namespaces", return_value=["default"]
+            ),
+            patch.object(
+                helm_function, "_uninstall_helm_chart", side_effect=RuntimeError("boom")
+            ),
+        ):
+            result = await helm_function.execute(
+                release_name="nginx", operation="uninstall"
+            )
+
+            assert result["status"] == "error"
+            assert "Failed to execute Helm deployment: boom" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_execute_planning_exception(self, helm_function):
+        """Test that failures while planning are reported, not raised."""
+        with (
+            patch.object(
+                helm_function,
+                "_discover_clusters",
+                return_value=[{"name": "cluster1", "context": "cluster1"}],
+            ),
+            patch.object(
+                helm_function, "_resolve_target_namespaces", return_value=["default"]
+            ),
+        ):
+            result = await helm_function.execute(
+                chart_name="nginx",
+                repository_url="https://charts.bitnami.com/bitnami",
+                kubestellar_labels=["a"],
+                dry_run=True,
+            )
+
+            assert result["status"] == "error"
+            assert "Failed to execute Helm deployment" in result["error"]
+
     @pytest.mark.asyncio
     async def test_execute_no_clusters(self, helm_function):
         """Test execution when no clusters are discovered."""
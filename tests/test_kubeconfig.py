@@ -1,12 +1,16 @@
 """Tests for kubeconfig function."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
 
-from src.shared.functions.kubeconfig import KubeconfigFunction
+from src.shared.functions.kubeconfig import (
+    KubeconfigFunction,
+    _load_kubeconfig_cached,
+)
 
 
 @pytest.fixture
@@ -212,3 +216,42 @@ async def test_kubeconfig_invalid_yaml(kubeconfig_function):
         assert "Failed to parse" in result["error"]
     finally:
         Path(temp_path).unlink()
+
+
+@pytest.mark.asyncio
+async def test_kubeconfig_parse_is_cached(
+    kubeconfig_function, sample_kubeconfig, tmp_path
+):
+    """Test that an unchanged kubeconfig is parsed only once."""
+    path = tmp_path / "config"
+    path.write_text(yaml.dump(sample_kubeconfig))
+    _load_kubeconfig_cached.cache_clear()
+
+    await kubeconfig_function.execute(kubeconfig_path=str(path))
+    await kubeconfig_function.execute(kubeconfig_path=str(path))
+    info = _load_kubeconfig_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+    # Editing the file invalidates the cached parse
+    sample_kubeconfig["current-context"] = "prod-context"
+    path.write_text(yaml.dump(sample_kubeconfig))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    result = await kubeconfig_function.execute(kubeconfig_path=str(path))
+    assert result["current_context"] == "prod-context"
+
+
+@pytest.mark.asyncio
+async def test_kubeconfig_writes_nothing_beside_file(
+    kubeconfig_function, sample_kubeconfig, tmp_path
+):
+    """Test that loading a kubeconfig leaves no copy of its credentials."""
+    path = tmp_path / "config"
+    path.write_text(yaml.dump(sample_kubeconfig))
+    _load_kubeconfig_cached.cache_clear()
+
+    await kubeconfig_function.execute(kubeconfig_path=str(path))
+
+    assert [p.name for p in tmp_path.iterdir()] == ["config"]
@@ -1,19 +1,73 @@
 """Tests for KubeStellar management function."""
 
+import asyncio
 import json
+import os
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.shared.functions.kubestellar_management import KubeStellarManagementFunction
+from src.shared.functions.kubestellar_management import (
+    KubeStellarManagementFunction,
+    _max_concurrent_commands,
+    _parse_projected_items,
+)
+
+
+def api_resources_by_group(outputs):
+    """Build a _run_command replacement answering kubectl api-resources -o name."""
+
+    async def fake_run(cmd, **kwargs):
+        lines = ["pods", "deployments.apps"]
+        for group, resources in outputs.items():
+            lines.extend(f"{resource}.{group}" for resource in resources)
+        return {"returncode": 0, "stdout": "\n".join(lines) + "\n", "stderr": ""}
+
+    return fake_run
+
+
+def kubectl_projection(items):
+    """Render items as kubectl prints the deep-search jsonpath projection."""
+    lines = []
+    for item in items:
+        metadata = item["metadata"]
+        lines.append(
+            "\t".join(
+                [
+                    "R",
+                    item["kind"],
+                    item["apiVersion"],
+                    metadata.get("namespace", ""),
+                    metadata["name"],
+                    metadata["creationTimestamp"],
+                    metadata["uid"],
+                    metadata["resourceVersion"],
+                    item.get("status", {}).get("phase", ""),
+                    item.get("spec", {}).get("nodeName", ""),
+                    json.dumps(metadata["labels"]) if "labels" in metadata else "",
+                    (
+                        json.dumps(metadata["annotations"])
+                        if "annotations" in metadata
+                        else ""
+                    ),
+                ]
+            )
+        )
+    for item in items:
+        if item["kind"] == "WorkStatus":
+            status = json.dumps(item["status"]) if "status" in item else ""
+            lines.append(f"S\t{item['metadata']['uid']}\t{status}")
+    return "".join(line + "\n" for line in lines)
 
 
 class TestKubeStellarManagementFunction:
     """Test cases for KubeStellar management function."""
 
     @pytest.fixture
-    def kubestellar_function(self):
+    def kubestellar_function(self, monkeypatch, tmp_path):
         """Create KubeStellar management function instance."""
+        # Keep tests away from the developer's kubectl discovery cache
+        monkeypatch.setenv("KUBECACHEDIR", str(tmp_path / "kube-cache"))
         return KubeStellarManagementFunction()
 
     def test_init(self, kubestellar_function):
@@ -126,7 +180,7 @@ class TestKubeStellarManagementFunction:
                     }
                 ]
             },
-            "resources_by_type": {"pod": [{"name": "test-pod", "kind": "Pod"}]},
+            "resources_by_type": {"pod": 1},
             "total_resources": 1,
             "kubestellar_resources": [],
         }
@@ -172,30 +226,24 @@ class TestKubeStellarManagementFunction:
     @pytest.mark.asyncio
     async def test_classify_kubestellar_space_wds(self, kubestellar_function):
         """Test WDS space classification."""
-        mock_command_output = {
-            "returncode": 0,
-            "stdout": "bindingpolicies   control.kubestellar.io/v1alpha1   true   BindingPolicy",
-        }
+        fake_run = api_resources_by_group(
+            {
+                "control.kubestellar.io": ["bindingpolicies"],
+            }
+        )
 
         with (
             patch.object(
-                kubestellar_function, "_run_command", new_callable=AsyncMock
+                kubestellar_function, "_run_command", side_effect=fake_run
             ) as mock_run,
             patch.object(
                 kubestellar_function,
                 "_get_kubestellar_namespaces",
                 new_callable=AsyncMock,
             ) as mock_ns,
-            patch.object(
-                kubestellar_function,
-                "_get_kubestellar_api_resources",
-                new_callable=AsyncMock,
-            ) as mock_api,
         ):
 
-            mock_run.return_value = mock_command_output
             mock_ns.return_value = ["kubestellar-system"]
-            mock_api.return_value = ["bindingpolicies"]
 
             space_info = await kubestellar_function._classify_kubestellar_space(
                 "wds-test", ""
@@ -204,34 +252,30 @@ class TestKubeStellarManagementFunction:
             assert space_info["type"] == "wds"
             assert space_info["name"] == "wds-test"
             assert space_info["kubestellar_components"]["binding_controller"] is True
+            assert space_info["api_resources"] == ["bindingpolicies"]
+            # One api-resources listing, shared by both uses
+            assert mock_run.call_count == 1
 
     @pytest.mark.asyncio
     async def test_classify_kubestellar_space_its(self, kubestellar_function):
         """Test ITS space classification."""
-        mock_command_output = {
-            "returncode": 0,
-            "stdout": "workstatuses   ws,wss   control.kubestellar.io/v1alpha1   true   WorkStatus",
-        }
+        fake_run = api_resources_by_group(
+            {
+                "cluster.open-cluster-management.io": ["managedclusters"],
+                "control.kubestellar.io": ["workstatuses"],
+            }
+        )
 
         with (
-            patch.object(
-                kubestellar_function, "_run_command", new_callable=AsyncMock
-            ) as mock_run,
+            patch.object(kubestellar_function, "_run_command", side_effect=fake_run),
             patch.object(
                 kubestellar_function,
                 "_get_kubestellar_namespaces",
                 new_callable=AsyncMock,
             ) as mock_ns,
-            patch.object(
-                kubestellar_function,
-                "_get_kubestellar_api_resources",
-                new_callable=AsyncMock,
-            ) as mock_api,
         ):
 
-            mock_run.return_value = mock_command_output
             mock_ns.return_value = ["open-cluster-management"]
-            mock_api.return_value = ["workstatuses"]
 
             space_info = await kubestellar_function._classify_kubestellar_space(
                 "its-test", ""
@@ -239,6 +283,121 @@ class TestKubeStellarManagementFunction:
 
             assert space_info["type"] == "its"
             assert space_info["kubestellar_components"]["transport_controller"] is True
+            assert space_info["api_resources"] == ["workstatuses", "managedclusters"]
+
+    def test_space_type_from_name(self, kubestellar_function):
+        """Test the context naming fallback and its precedence."""
+        assert kubestellar_function._space_type_from_name("WDS1") == "wds"
+        assert kubestellar_function._space_type_from_name("kind-its-1") == "its"
+        assert kubestellar_function._space_type_from_name("its-wds-1") == "wds"
+        assert kubestellar_function._space_type_from_name("cluster1") == "standard"
+
+    @pytest.mark.asyncio
+    async def test_classify_kubestellar_space_cached(self, kubestellar_function):
+        """Test that classifications are reused until the TTL expires."""
+        with patch.object(
+            kubestellar_function,
+            "_classify_kubestellar_space",
+            new_callable=AsyncMock,
+        ) as mock_classify:
+            mock_classify.return_value = {"name": "its1", "type": "its"}
+
+            first = await kubestellar_function._classify_kubestellar_space_cached(
+                "its1", ""
+            )
+            first["status"] = "Ready"
+            second = await kubestellar_function._classify_kubestellar_space_cached(
+                "its1", ""
+            )
+            assert mock_classify.call_count == 1
+            # Callers get their own copy of the cached entry
+            assert "status" not in second
+
+            kubestellar_function._topology_ttl = 0
+            await kubestellar_function._classify_kubestellar_space_cached("its1", "")
+            assert mock_classify.call_count == 2
+
+            # Failed classifications are retried on the next call
+            kubestellar_function._topology_ttl = 60.0
+            mock_classify.return_value = {"name": "wec1", "type": "unknown"}
+            await kubestellar_function._classify_kubestellar_space_cached("wec1", "")
+            await kubestellar_function._classify_kubestellar_space_cached("wec1", "")
+            assert mock_classify.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_discover_topology_probes_concurrently(self, kubestellar_function):
+        """Test discovery skips unreachable contexts and caches probes."""
+        probes = []
+
+        async def fake_run(cmd, **kwargs):
+            if cmd[1] == "config":
+                return {"returncode": 0, "stdout": "wds1\nits1\ndown\n", "stderr": ""}
+            probes.append(cmd[3])
+            returncode = 1 if cmd[3] == "down" else 0
+            return {"returncode": returncode, "stdout": "", "stderr": ""}
+
+        async def fake_classify(context, kubeconfig):
+            return {"name": context, "type": context[:3]}
+
+        with (
+            patch.object(kubestellar_function, "_run_command", side_effect=fake_run),
+            patch.object(
+                kubestellar_function,
+                "_classify_kubestellar_space_cached",
+                side_effect=fake_classify,
+            ) as mock_classify,
+        ):
+            spaces = await kubestellar_function._discover_kubestellar_topology(
+                "", include_wds=True
+            )
+            assert [space["name"] for space in spaces] == ["wds1", "its1"]
+            assert all(space["status"] == "Ready" for space in spaces)
+            # The unreachable context is never classified
+            assert mock_classify.call_count == 2
+
+            spaces = await kubestellar_function._discover_kubestellar_topology(
+                "", include_wds=False
+            )
+            assert [space["name"] for space in spaces] == ["its1"]
+            # Probe verdicts are reused within the TTL
+            assert sorted(probes) == ["down", "its1", "wds1"]
+
+    @pytest.mark.asyncio
+    async def test_execute_requested_clusters_skip_full_discovery(
+        self, kubestellar_function
+    ):
+        """Test that named clusters are probed without listing every context."""
+        commands = []
+
+        async def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return {"returncode": 0, "stdout": "", "stderr": ""}
+
+        with (
+            patch.object(kubestellar_function, "_run_command", side_effect=fake_run),
+            patch.object(
+                kubestellar_function,
+                "_classify_kubestellar_space_cached",
+                new_callable=AsyncMock,
+                return_value={"name": "cluster1", "type": "wec"},
+            ),
+            patch.object(
+                kubestellar_function,
+                "_create_topology_map",
+                new_callable=AsyncMock,
+                return_value={"status": "success"},
+            ) as mock_topology,
+        ):
+            result = await kubestellar_function.execute(
+                operation="topology_map",
+                cluster_names=["cluster1", "cluster1"],
+                all_clusters=False,
+            )
+
+        assert result["status"] == "success"
+        assert commands == [["kubectl", "cluster-info", "--context", "cluster1"]]
+        clusters = mock_topology.call_args[0][0]
+        assert [c["context"] for c in clusters] == ["cluster1"]
 
     @pytest.mark.asyncio
     async def test_get_kubestellar_namespaces(self, kubestellar_function):
@@ -280,36 +439,95 @@ class TestKubeStellarManagementFunction:
             assert "regular-namespace" not in namespaces
 
     @pytest.mark.asyncio
-    async def test_get_kubestellar_api_resources(self, kubestellar_function):
-        """Test getting KubeStellar API resources."""
-        mock_outputs = [
-            {
-                "returncode": 0,
-                "stdout": "NAME             SHORTNAMES   APIVERSION                        NAMESPACED   KIND\nbindingpolicies   bp           control.kubestellar.io/v1alpha1   true         BindingPolicy\nworkstatuses      ws           control.kubestellar.io/v1alpha1   true         WorkStatus",
-            },
-            {
-                "returncode": 0,
-                "stdout": "NAME             SHORTNAMES   APIVERSION                              NAMESPACED   KIND\nmanagedclusters               cluster.open-cluster-management.io/v1   false        ManagedCluster",
-            },
-            {
-                "returncode": 0,
-                "stdout": "NAME            SHORTNAMES   APIVERSION                        NAMESPACED   KIND\nmanifestworks                work.open-cluster-management.io/v1   true         ManifestWork",
-            },
-        ]
+    async def test_get_api_group_resources(self, kubestellar_function):
+        """Test listing KubeStellar API resources per group."""
+        mock_output = {
+            "returncode": 0,
+            "stdout": "pods\nbindingpolicies.control.kubestellar.io\n"
+            "workstatuses.control.kubestellar.io\n"
+            "managedclusters.cluster.open-cluster-management.io\n"
+            "manifestworks.work.open-cluster-management.io\n"
+            "deployments.apps\n",
+        }
 
         with patch.object(
             kubestellar_function, "_run_command", new_callable=AsyncMock
         ) as mock_run:
-            mock_run.side_effect = mock_outputs
+            mock_run.return_value = mock_output
 
-            resources = await kubestellar_function._get_kubestellar_api_resources(
+            resources = await kubestellar_function._get_api_group_resources(
                 "test-context", ""
             )
 
-            assert "bindingpolicies" in resources
-            assert "workstatuses" in resources
-            assert "managedclusters" in resources
-            assert "manifestworks" in resources
+            assert resources == {
+                "control.kubestellar.io": ["bindingpolicies", "workstatuses"],
+                "cluster.open-cluster-management.io": ["managedclusters"],
+                "work.open-cluster-management.io": ["manifestworks"],
+            }
+            assert mock_run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_api_group_resources_from_discovery_cache(
+        self, kubestellar_function, tmp_path
+    ):
+        """Test that a fresh kubectl discovery cache replaces api-resources."""
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text(
+            "contexts:\n"
+            "- name: its1\n"
+            "  context: {cluster: kind-its1}\n"
+            "clusters:\n"
+            "- name: kind-its1\n"
+            "  cluster: {server: 'https://127.0.0.1:6443'}\n"
+        )
+        server_dir = tmp_path / "kube-cache" / "discovery" / "127.0.0.1_6443"
+        (server_dir / "control.kubestellar.io" / "v1alpha1").mkdir(parents=True)
+        (server_dir / "servergroups.json").write_text(
+            json.dumps(
+                {
+                    "groups": [
+                        {
+                            "name": "control.kubestellar.io",
+                            "preferredVersion": {"version": "v1alpha1"},
+                        }
+                    ]
+                }
+            )
+        )
+        (
+            server_dir / "control.kubestellar.io" / "v1alpha1" / "serverresources.json"
+        ).write_text(
+            json.dumps(
+                {
+                    "resources": [
+                        {"name": "workstatuses"},
+                        {"name": "workstatuses/status"},
+                    ]
+                }
+            )
+        )
+
+        with patch.object(
+            kubestellar_function, "_run_command", new_callable=AsyncMock
+        ) as mock_run:
+            group_resources = await kubestellar_function._get_api_group_resources(
+                "its1", str(kubeconfig)
+            )
+
+            assert group_resources == {
+                "control.kubestellar.io": ["workstatuses"],
+                "cluster.open-cluster-management.io": [],
+                "work.open-cluster-management.io": [],
+            }
+            mock_run.assert_not_called()
+
+            # A stale cache falls back to kubectl
+            os.utime(server_dir / "servergroups.json", (0, 0))
+            mock_run.return_value = {"returncode": 0, "stdout": "", "stderr": ""}
+            await kubestellar_function._get_api_group_resources(
+                "its1", str(kubeconfig)
+            )
+            assert mock_run.call_count == 1
 
     @pytest.mark.asyncio
     async def test_search_namespace_resources(self, kubestellar_function):
@@ -334,7 +552,10 @@ class TestKubeStellarManagementFunction:
             ]
         }
 
-        mock_command_output = {"returncode": 0, "stdout": json.dumps(mock_pod_data)}
+        mock_command_output = {
+            "returncode": 0,
+            "stdout": kubectl_projection(mock_pod_data["items"]),
+        }
 
         with patch.object(
             kubestellar_function, "_run_command", new_callable=AsyncMock
@@ -350,6 +571,214 @@ class TestKubeStellarManagementFunction:
             assert resources[0]["kind"] == "Pod"
             assert resources[0]["phase"] == "Running"
             assert resources[0]["node"] == "test-node"
+            assert resources[0]["labels"] == {"app": "test"}
+            get_cmd = mock_run.call_args[0][0]
+            assert get_cmd[get_cmd.index("-o") + 1].startswith("jsonpath=")
+
+    @pytest.mark.asyncio
+    async def test_search_namespace_resources_batches_types(
+        self, kubestellar_function
+    ):
+        """Test one kubectl get for all types, retrying without unknown ones."""
+        mock_cluster = {"name": "test-cluster", "context": "test-context"}
+        items = [
+            {
+                "metadata": {
+                    "name": kind.lower(),
+                    "creationTimestamp": "2024-01-01T00:00:00Z",
+                    "uid": kind,
+                    "resourceVersion": "1",
+                },
+                "kind": kind,
+                "apiVersion": "v1",
+                "status": {"phase": "Running"},
+            }
+            for kind in ("Service", "Pod")
+        ]
+
+        with patch.object(
+            kubestellar_function, "_run_command", new_callable=AsyncMock
+        ) as mock_run:
+            mock_run.side_effect = [
+                {
+                    "returncode": 1,
+                    "stdout": "",
+                    "stderr": 'error: the server doesn\'t have a resource type "workstatuses"',
+                },
+                {
+                    "returncode": 0,
+                    # A truncated line is skipped
+                    "stdout": kubectl_projection(items) + "R\tBroken\n",
+                    "stderr": "",
+                },
+            ]
+
+            resources = await kubestellar_function._search_namespace_resources(
+                mock_cluster, "default", ["services", "workstatuses", "pods"], "", "", ""
+            )
+
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[0][0][0][2] == "services,workstatuses,pods"
+        assert mock_run.call_args_list[1][0][0][2] == "services,pods"
+        # Pod details come from the item kind
+        assert [r["kind"] for r in resources] == ["Service", "Pod"]
+        assert resources[1]["phase"] == "Running"
+        assert "phase" not in resources[0]
+
+    @pytest.mark.asyncio
+    async def test_search_namespace_resources_falls_back_per_type(
+        self, kubestellar_function
+    ):
+        """Test that other batch failures fall back to one call per type."""
+        mock_cluster = {"name": "test-cluster", "context": "test-context"}
+        pod = {
+            "metadata": {
+                "name": "p",
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+                "uid": "u",
+                "resourceVersion": "1",
+            },
+            "kind": "Pod",
+            "apiVersion": "v1",
+        }
+
+        async def fake_run(cmd, **kwargs):
+            if cmd[2] == "pods":
+                return {"returncode": 0, "stdout": kubectl_projection([pod])}
+            return {"returncode": 1, "stdout": "", "stderr": "secrets is forbidden"}
+
+        with patch.object(kubestellar_function, "_run_command", side_effect=fake_run):
+            resources = await kubestellar_function._search_namespace_resources(
+                mock_cluster, "default", ["secrets", "pods"], "", "", ""
+            )
+
+        assert [r["name"] for r in resources] == ["p"]
+
+    def test_parse_projected_items_work_status(self):
+        """Test that WorkStatus lines carry the full status through."""
+        work_status = {
+            "metadata": {
+                "name": "ws",
+                "namespace": "cluster1",
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+                "uid": "ws-uid",
+                "resourceVersion": "7",
+                "labels": {"kubestellar.io/managed": "true"},
+            },
+            "kind": "WorkStatus",
+            "apiVersion": "control.kubestellar.io/v1alpha1",
+            "status": {"conditions": [{"type": "Applied", "message": "a\tb"}]},
+        }
+
+        (item,) = _parse_projected_items(kubectl_projection([work_status]))
+
+        assert item["status"] == work_status["status"]
+        assert item["metadata"]["labels"] == {"kubestellar.io/managed": "true"}
+        assert item["metadata"]["annotations"] == {}
+
+    @pytest.mark.asyncio
+    async def test_deep_search_cluster_all_namespaces(self, kubestellar_function):
+        """Test that all-namespace searches use one cluster-wide listing."""
+        mock_cluster = {"name": "cluster1", "context": "cluster1", "type": "wec"}
+        items = [
+            {
+                "metadata": {
+                    "name": name,
+                    "namespace": namespace,
+                    "creationTimestamp": "2024-01-01T00:00:00Z",
+                    "uid": name,
+                    "resourceVersion": "1",
+                },
+                "kind": "Pod",
+                "apiVersion": "v1",
+            }
+            for name, namespace in (("web", "apps"), ("dns", "kube-system"))
+        ]
+
+        async def fake_run(cmd, **kwargs):
+            if cmd[2] == "namespaces":
+                return {
+                    "returncode": 0,
+                    "stdout": "namespace/default\nnamespace/apps\nnamespace/kube-system\n",
+                }
+            return {"returncode": 0, "stdout": kubectl_projection(items)}
+
+        with patch.object(
+            kubestellar_function, "_run_command", side_effect=fake_run
+        ) as mock_run:
+            result = await kubestellar_function._deep_search_cluster(
+                mock_cluster, ["pods"], None, True, "", "", False, False, ""
+            )
+
+        assert mock_run.call_count == 2
+        get_cmd = next(c[0][0] for c in mock_run.call_args_list if c[0][0][2] == "pods")
+        assert "--all-namespaces" in get_cmd
+        assert list(result["namespaces"]) == ["default", "apps", "kube-system"]
+        assert result["namespaces"]["default"] == []
+        assert [r["name"] for r in result["namespaces"]["kube-system"]] == ["dns"]
+        assert result["resources_by_type"] == {"pod": 2}
+        assert result["namespaces"]["apps"][0]["namespace"] == "apps"
+        assert result["total_resources"] == 2
+
+    @pytest.mark.asyncio
+    async def test_deep_search_isolates_cluster_failures(self, kubestellar_function):
+        """Test that one failing cluster does not fail the whole deep search."""
+        clusters = [
+            {"name": "cluster1", "context": "cluster1"},
+            {"name": "cluster2", "context": "cluster2"},
+        ]
+
+        async def fake_search(cluster, *args):
+            if cluster["name"] == "cluster2":
+                raise RuntimeError("connection refused")
+            return {"cluster": "cluster1", "status": "success", "namespaces": {}}
+
+        with (
+            patch.object(
+                kubestellar_function, "_deep_search_cluster", side_effect=fake_search
+            ),
+            patch.object(
+                kubestellar_function,
+                "_aggregate_binding_policies",
+                new_callable=AsyncMock,
+                return_value={"total_policies": 0},
+            ),
+        ):
+            result = await kubestellar_function._perform_deep_search(
+                clusters, ["pods"], None, True, "", "", True, False, False, False, "", ""
+            )
+
+        assert result["status"] == "success"
+        assert result["cluster_results"]["cluster1"]["status"] == "success"
+        assert result["cluster_results"]["cluster2"]["status"] == "error"
+        assert "connection refused" in result["cluster_results"]["cluster2"]["error"]
+        assert result["binding_policies"] == {"total_policies": 0}
+
+    @pytest.mark.asyncio
+    async def test_aggregate_work_statuses_isolates_cluster_failures(
+        self, kubestellar_function
+    ):
+        """Test that clusters are queried together and failures count as empty."""
+        clusters = [
+            {"name": "its1", "context": "its1"},
+            {"name": "its2", "context": "its2"},
+        ]
+
+        async def fake_statuses(cluster, kubeconfig, details=True):
+            if cluster["name"] == "its2":
+                raise RuntimeError("connection refused")
+            return [{"name": "ws1", "cluster": "its1"}]
+
+        with patch.object(
+            kubestellar_function, "_get_work_statuses", side_effect=fake_statuses
+        ):
+            statuses = await kubestellar_function._aggregate_work_statuses(
+                clusters, ""
+            )
+
+        assert statuses["statuses_by_cluster"] == {"its1": 1, "its2": 0}
+        assert statuses["total_work_statuses"] == 1
+        assert statuses["status_details"] == [{"name": "ws1", "cluster": "its1"}]
 
     def test_is_kubestellar_resource(self, kubestellar_function):
         """Test KubeStellar resource identification."""
@@ -407,20 +836,14 @@ class TestKubeStellarManagementFunction:
                 "status": "success",
                 "total_resources": 10,
                 "cluster_type": "wec",
-                "resources_by_type": {
-                    "pod": [{"name": "pod1"}, {"name": "pod2"}],
-                    "service": [{"name": "svc1"}],
-                },
+                "resources_by_type": {"pod": 2, "service": 1},
                 "kubestellar_resources": [{"name": "ks1"}],
             },
             "cluster2": {
                 "status": "success",
                 "total_resources": 5,
                 "cluster_type": "wds",
-                "resources_by_type": {
-                    "pod": [{"name": "pod3"}],
-                    "bindingpolicy": [{"name": "bp1"}],
-                },
+                "resources_by_type": {"pod": 1, "bindingpolicy": 1},
                 "kubestellar_resources": [{"name": "ks2"}, {"name": "ks3"}],
             },
         }
@@ -438,31 +861,141 @@ class TestKubeStellarManagementFunction:
         assert summary["cluster_types"]["wec"]["count"] == 1
         assert summary["cluster_types"]["wds"]["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_get_binding_policies_coalesces_concurrent_calls(
+        self, kubestellar_function
+    ):
+        """Test that fetches for one cluster share a kubectl call and cache it."""
+        cluster = {"name": "wds1", "context": "wds1"}
+        commands = []
+
+        async def fake_stream(cmd, **kwargs):
+            commands.append(cmd)
+            await asyncio.sleep(0)
+            yield "BindingPolicy\tnginx-bp\t\t2024-01-01T00:00:00Z\t{}\t"
+
+        with patch.object(kubestellar_function, "_run_command_stream", fake_stream):
+            first, second = await asyncio.gather(
+                kubestellar_function._get_binding_policies(cluster, ""),
+                kubestellar_function._get_binding_policies(cluster, ""),
+            )
+            assert len(commands) == 1
+            assert first == second
+            assert first is not second
+            assert first[0]["name"] == "nginx-bp"
+
+            assert kubestellar_function._inflight == {}
+
+            # Settled listings are reused until the TTL expires
+            cached = await kubestellar_function._get_binding_policies(cluster, "")
+            assert len(commands) == 1
+            assert cached == first
+
+            kubestellar_function._listing_ttl = 0
+            await kubestellar_function._get_binding_policies(cluster, "")
+            assert len(commands) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_work_statuses_streams_lines(self, kubestellar_function):
+        """Test that work statuses are parsed line by line from kubectl."""
+        cluster = {"name": "its1", "context": "its1"}
+        status = {"conditions": [{"type": "Applied", "status": "True"}]}
+
+        async def fake_stream(cmd, **kwargs):
+            assert cmd[:3] == ["kubectl", "get", "bindingpolicies,workstatuses"]
+            yield f"WorkStatus\tws1\tcluster1\t2024-01-01T00:00:00Z\t\t{json.dumps(status)}"
+            yield "truncated"
+            raise RuntimeError("connection reset")
+
+        with patch.object(kubestellar_function, "_run_command_stream", fake_stream):
+            statuses = await kubestellar_function._get_work_statuses(cluster, "")
+
+        # A failed listing reports nothing, as before
+        assert statuses == []
+
+        async def ok_stream(cmd, **kwargs):
+            yield f"WorkStatus\tws1\tcluster1\t2024-01-01T00:00:00Z\t\t{json.dumps(status)}"
+            yield "truncated"
+
+        with patch.object(kubestellar_function, "_run_command_stream", ok_stream):
+            statuses = await kubestellar_function._get_work_statuses(cluster, "")
+
+        assert statuses == [
+            {
+                "name": "ws1",
+                "namespace": "cluster1",
+                "cluster": "its1",
+                "spec": {},
+                "status": status,
+                "created": "2024-01-01T00:00:00Z",
+            }
+        ]
+
+    @pytest.mark.asyncio
+    async def test_kubestellar_objects_share_one_listing(self, kubestellar_function):
+        """Test that policies and statuses come from one kubectl get."""
+        cluster = {"name": "wds1", "context": "wds1"}
+        commands = []
+
+        async def fake_stream(cmd, **kwargs):
+            commands.append(cmd)
+            if "," in cmd[2]:
+                raise RuntimeError(
+                    'error: the server doesn\'t have a resource type "workstatuses"'
+                )
+            yield "BindingPolicy\tnginx-bp\t\t2024-01-01T00:00:00Z\t{}\t{}"
+
+        with patch.object(kubestellar_function, "_run_command_stream", fake_stream):
+            policies = await kubestellar_function._get_binding_policies(cluster, "")
+            statuses = await kubestellar_function._get_work_statuses(cluster, "")
+
+        # The unserved type is dropped and the rest retried once
+        assert [cmd[2] for cmd in commands] == [
+            "bindingpolicies,workstatuses",
+            "bindingpolicies",
+        ]
+        assert [p["name"] for p in policies] == ["nginx-bp"]
+        assert "kind" not in policies[0]
+        assert statuses == []
+
+    @pytest.mark.asyncio
+    async def test_get_binding_policies_without_details(self, kubestellar_function):
+        """Test that summary listings skip spec and status."""
+        cluster = {"name": "wds1", "context": "wds1"}
+        commands = []
+
+        async def fake_stream(cmd, **kwargs):
+            commands.append(cmd)
+            yield "BindingPolicy\tnginx-bp\t\t2024-01-01T00:00:00Z"
+
+        with patch.object(kubestellar_function, "_run_command_stream", fake_stream):
+            policies = await kubestellar_function._get_binding_policies(
+                cluster, "", details=False
+            )
+
+        assert commands[0][3] == "-o"
+        assert "{.spec}" not in commands[0][4]
+        assert policies == [
+            {
+                "name": "nginx-bp",
+                "namespace": "",
+                "cluster": "wds1",
+                "created": "2024-01-01T00:00:00Z",
+            }
+        ]
+
     @pytest.mark.asyncio
     async def test_analyze_resource_placement(self, kubestellar_function):
         """Test resource placement analysis."""
         cluster_results = {
             "cluster1": {
                 "status": "success",
-                "resources_by_type": {
-                    "pod": [
-                        {"name": "p1"},
-                        {"name": "p2"},
-                        {"name": "p3"},
-                        {"name": "p4"},
-                        {"name": "p5"},
-                    ],  # 5 pods
-                    "service": [{"name": "s1"}],  # 1 service
-                },
+                "resources_by_type": {"pod": 5, "service": 1},
             },
             "cluster2": {
                 "status": "success",
-                "resources_by_type": {
-                    "pod": [
-                        {"name": "p6"}
-                    ],  # 1 pod - significant imbalance (5 vs 1, avg is 3, 5 > 3*1.5)
-                    "service": [{"name": "s2"}],  # 1 service
-                },
+                # 1 pod - significant imbalance (5 vs 1, avg is 3, 5 > 3*1.5)
+                "resources_by_type": {"pod": 1, "service": 1},
             },
         }
 
@@ -471,8 +1004,16 @@ class TestKubeStellarManagementFunction:
         assert "distribution_patterns" in analysis
         assert analysis["distribution_patterns"]["pod"]["cluster1"] == 5
         assert analysis["distribution_patterns"]["pod"]["cluster2"] == 1
-        assert len(analysis["recommendations"]) > 0
         # Should recommend redistributing pods from cluster1 (5 > 3*1.5 = 4.5)
+        assert analysis["recommendations"] == [
+            {
+                "action": "redistribute",
+                "resource_type": "pod",
+                "from_cluster": "cluster1",
+                "count": 5,
+                "average": 3.0,
+            }
+        ]
 
     @pytest.mark.asyncio
     async def test_create_dependency_map(self, kubestellar_function):
@@ -518,6 +1059,37 @@ class TestKubeStellarManagementFunction:
             assert result["stdout"] == "success output"
             assert result["stderr"] == ""
 
+    def test_max_concurrent_commands(self, monkeypatch):
+        """Test the kubectl concurrency bound and its environment override."""
+        monkeypatch.delenv("KUBESTELLAR_MAX_PARALLEL", raising=False)
+        assert _max_concurrent_commands() == 16
+
+        monkeypatch.setenv("KUBESTELLAR_MAX_PARALLEL", "4")
+        assert _max_concurrent_commands() == 4
+
+        monkeypatch.setenv("KUBESTELLAR_MAX_PARALLEL", "0")
+        assert _max_concurrent_commands() == 1
+
+        monkeypatch.setenv("KUBESTELLAR_MAX_PARALLEL", "lots")
+        assert _max_concurrent_commands() == 16
+
+    @pytest.mark.asyncio
+    async def test_run_command_raw_stdout(self, kubestellar_function):
+        """Test decode=False keeps stdout as bytes for json.loads."""
+        with patch("asyncio.create_subprocess_exec") as mock_subprocess:
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (b'{"items": []}', b"warn")
+            mock_process.returncode = 0
+            mock_subprocess.return_value = mock_process
+
+            result = await kubestellar_function._run_command(
+                ["kubectl", "get", "pods"], decode=False
+            )
+
+            assert result["stdout"] == b'{"items": []}'
+            assert result["stderr"] == "warn"
+            assert json.loads(result["stdout"]) == {"items": []}
+
     @pytest.mark.asyncio
     async def test_run_command_failure(self, kubestellar_function):
         """Test command execution failure."""